@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Titanium Hook Client
+
+Forwards a hook event to the Titanium hook daemon over its unix socket and
+returns as soon as the daemon acknowledges it. When the daemon is not running,
+does not acknowledge the event (it died, or is restarting for changed
+settings), or is disabled with TITANIUM_HOOK_DAEMON=0, the hook script runs in
+this process instead, so hooks.json can always point at this client.
+
+Deliberately stdlib-only: this runs on every hook event.
+
+Usage:
+    python3 hook_client.py <hook_name> [hook args...]
+
+Examples:
+    python3 hook_client.py post_tool_use_elevenlabs < event.json
+    python3 hook_client.py stop --chat < event.json
+"""
+
+import io
+import json
+import os
+import runpy
+import socket
+import sys
+from pathlib import Path
+
+HOOKS_DIR = Path(__file__).parent
+HOOK_NAMES = ("post_tool_use_elevenlabs", "stop", "subagent_stop", "notification")
+
+TITANIUM_HOME = Path(os.getenv("TITANIUM_HOME", Path.home() / ".titanium"))
+SOCKET_PATH = Path(os.getenv("TITANIUM_HOOK_SOCKET", TITANIUM_HOME / "hookd.sock"))
+ACK = b"ok"
+ACK_TIMEOUT_SECONDS = 2
+
+
+def forward_to_daemon(hook_name, hook_args, stdin_data):
+    """
+    Send one hook event to the daemon.
+
+    Returns:
+        bool: True if the daemon acknowledged the event, False if it is
+        unavailable or declined it
+    """
+    if os.getenv("TITANIUM_HOOK_DAEMON", "1") == "0" or not hasattr(socket, "AF_UNIX"):
+        return False
+
+    request = {
+        "hook": hook_name,
+        "argv": hook_args,
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+        "stdin": stdin_data,
+    }
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1)
+            sock.connect(str(SOCKET_PATH))
+            sock.sendall(json.dumps(request).encode("utf-8"))
+            sock.shutdown(socket.SHUT_WR)  # End of request
+            sock.settimeout(ACK_TIMEOUT_SECONDS)
+            return sock.recv(16) == ACK
+    except OSError:
+        return False
+
+
+def run_in_process(hook_name, hook_args, stdin_data):
+    """Run the hook script directly, exactly as hooks.json used to."""
+    script_path = HOOKS_DIR / f"{hook_name}.py"
+    sys.argv = [str(script_path)] + hook_args
+    sys.stdin = io.StringIO(stdin_data)
+    runpy.run_path(str(script_path), run_name="__main__")
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in HOOK_NAMES:
+        print(f"Usage: hook_client.py <{'|'.join(HOOK_NAMES)}> [args...]", file=sys.stderr)
+        sys.exit(0)  # Never block Claude Code on a misconfigured hook
+
+    hook_name = sys.argv[1]
+    hook_args = sys.argv[2:]
+
+    try:
+        stdin_data = sys.stdin.read()
+    except Exception:
+        stdin_data = ""
+
+    if forward_to_daemon(hook_name, hook_args, stdin_data):
+        sys.exit(0)
+
+    run_in_process(hook_name, hook_args, stdin_data)
+
+
+if __name__ == "__main__":
+    main()
@@ -40,6 +40,10 @@ server = Server("tt")
 PLUGIN_ROOT = Path(__file__).parent.parent.parent
 UTILS_DIR = PLUGIN_ROOT / "hooks" / "utils"
 
+# Utilities run with the plugin runtime when installed, else `uv run`
+sys.path.insert(0, str(UTILS_DIR / "runtime"))
+from plugin_runtime import runtime_command
+
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
@@ -147,7 +151,7 @@ async def run_plan_parser(args: dict[str, Any]) -> list[TextContent]:
 
     # Run the script
     result = subprocess.run(
-        ["uv", "run", str(script_path), requirements_file, project_path],
+        runtime_command(script_path, requirements_file, project_path),
         capture_output=True,
         text=True,
         cwd=project_path
@@ -189,10 +193,10 @@ async def run_bmad_generator(args: dict[str, Any]) -> list[TextContent]:
                 text=f"Error: Epic generation requires 3 inputs (prd_path arch_path epic_num), got {len(input_parts)}"
             )]
         # Pass all parts as separate arguments
-        cmd = ["uv", "run", str(script_path), doc_type] + input_parts + [project_path]
+        cmd = runtime_command(script_path, doc_type, *input_parts, project_path)
     else:
         # For other doc types, input_path is a single value
-        cmd = ["uv", "run", str(script_path), doc_type, input_path, project_path]
+        cmd = runtime_command(script_path, doc_type, input_path, project_path)
 
     # Run the script
     result = subprocess.run(
@@ -232,7 +236,7 @@ async def run_bmad_validator(args: dict[str, Any]) -> list[TextContent]:
 
     # Run the script
     result = subprocess.run(
-        ["uv", "run", str(script_path), doc_type, document_path],
+        runtime_command(script_path, doc_type, document_path),
         capture_output=True,
         text=True,
         cwd=str(document_parent)
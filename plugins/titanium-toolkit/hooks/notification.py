@@ -15,54 +15,41 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass  # dotenv is optional
+sys.path.insert(0, str(Path(__file__).parent / "utils" / "metrics"))
+from hook_metrics import HookTimer, startup_phase
 
-
-def get_tts_script_path():
-    """
-    Determine which TTS script to use based on available API keys.
-    Priority order: ElevenLabs > OpenAI > pyttsx3
-    """
-    script_dir = Path(__file__).parent
-    tts_dir = script_dir / "utils" / "tts"
-    
-    # Check for ElevenLabs (highest priority for quality)
-    if os.getenv('ELEVENLABS_API_KEY'):
-        elevenlabs_script = tts_dir / "elevenlabs_tts.py"
-        if elevenlabs_script.exists():
-            return str(elevenlabs_script)
-    
-    # Check for OpenAI API key (second priority)
-    if os.getenv('OPENAI_API_KEY'):
-        openai_script = tts_dir / "openai_tts.py"
-        if openai_script.exists():
-            return str(openai_script)
-    
-    # Fall back to pyttsx3 (no API key required)
-    pyttsx3_script = tts_dir / "local_tts.py"
-    if pyttsx3_script.exists():
-        return str(pyttsx3_script)
-    
-    return None
+with startup_phase("dotenv"):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass  # dotenv is optional
+
+with startup_phase("imports"):
+    sys.path.insert(0, str(Path(__file__).parent / "utils" / "tts"))
+    sys.path.insert(0, str(Path(__file__).parent / "utils" / "logs"))
+    sys.path.insert(0, str(Path(__file__).parent / "utils" / "transcript"))
+    sys.path.insert(0, str(Path(__file__).parent / "utils" / "probe"))
+    sys.path.insert(0, str(Path(__file__).parent / "utils" / "llm"))
+    from announce_spool import enqueue_announcement
+    from audio_player import play_audio_file
+    from capability_probe import has_binary
+    from llm_client import complete, llm_available
+    from usage_ledger import set_source
+    from log_store import append_log
+    from transcript_tail import find_last_user_message
+    from tts_router import speak_routed
 
 
 def get_smart_notification(message, input_data):
     """
-    Use GPT-5 nano to generate context-aware notification message.
-    Analyzes recent transcript to understand what Claude needs.
+    Use GPT-5 nano (or Claude Haiku as fallback) to generate context-aware
+    notification message. Analyzes recent transcript to understand what Claude needs.
     """
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
+    if not llm_available():
         return None
 
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=api_key)
-
         # Extract any additional context
         context = f"Notification: {message}\n"
 
@@ -75,22 +62,10 @@ def get_smart_notification(message, input_data):
         transcript_path = input_data.get('transcript_path')
         if transcript_path and os.path.exists(transcript_path):
             try:
-                # Read last few messages to understand context
-                with open(transcript_path, 'r') as f:
-                    lines = f.readlines()
-                    last_lines = lines[-10:] if len(lines) > 10 else lines
-
-                    for line in reversed(last_lines):
-                        try:
-                            msg = json.loads(line.strip())
-                            # Look for recent user message
-                            if msg.get('role') == 'user':
-                                user_msg = msg.get('content', '')
-                                if isinstance(user_msg, str):
-                                    context += f"Last user request: {user_msg[:100]}\n"
-                                    break
-                        except:
-                            pass
+                # Seek backwards from the end; memory stays bounded for huge transcripts
+                user_msg = find_last_user_message(transcript_path)
+                if user_msg is not None:
+                    context += f"Last user request: {user_msg[:100]}\n"
             except:
                 pass
 
@@ -107,13 +82,8 @@ Examples:
 
 Notification:"""
 
-        response = client.chat.completions.create(
-            model="gpt-5-nano",
-            messages=[{"role": "user", "content": prompt}],
-            max_completion_tokens=20,
-        )
-
-        return response.choices[0].message.content.strip().strip('"').strip("'")
+        notification = complete(prompt, max_tokens=20, hedge=True, cache=True)
+        return notification.strip('"').strip("'") if notification else None
 
     except Exception as e:
         print(f"Smart notification error: {e}", file=sys.stderr)
@@ -160,9 +130,12 @@ def get_notification_message(message, input_data=None):
 
 
 def main():
+    timer = HookTimer("notification")
+    set_source("notification")
     try:
         # Read JSON input from stdin
-        input_data = json.load(sys.stdin)
+        with timer.phase("read_input"):
+            input_data = json.load(sys.stdin)
         
         # Extract notification message
         message = input_data.get("message", "")
@@ -171,59 +144,48 @@ def main():
             sys.exit(0)
 
         # Convert to natural speech with context
-        spoken_message = get_notification_message(message, input_data)
-
-        # Use ElevenLabs for consistent voice across all hooks
-        script_dir = Path(__file__).parent
-        elevenlabs_script = script_dir / "utils" / "tts" / "elevenlabs_tts.py"
-
-        try:
-            subprocess.run(["afplay", "/System/Library/Sounds/Tink.aiff"], timeout=1)
-            subprocess.run(
-                ["uv", "run", str(elevenlabs_script), spoken_message],
-                capture_output=True,
-                timeout=10
-            )
-        except Exception:
-            pass
+        with timer.phase("message"):
+            spoken_message = get_notification_message(message, input_data)
+
+        # Same router as every other hook: consistent voice while it is healthy
+        chime = "/System/Library/Sounds/Tink.aiff"
+
+        with timer.phase("enqueue"):
+            queued = enqueue_announcement(spoken_message, sound=chime, source="notification", priority="urgent")
+        if not queued:
+            with timer.phase("tts"):
+                if os.path.exists(chime):
+                    play_audio_file(chime, timeout=1)
+                speak_routed(spoken_message, script_timeout=10)
         
         # Optional: Also use system notification if available
+        # (only notifiers the capability probe found installed are spawned)
         try:
-            # Try notify-send on Linux
-            subprocess.run([
-                "notify-send", "-a", "Claude Code", "Claude Code", message
-            ], capture_output=True, timeout=2)
-        except:
-            try:
-                # Try osascript on macOS
-                subprocess.run([
-                    "osascript", "-e", 
-                    f'display notification "{message}" with title "Claude Code"'
-                ], capture_output=True, timeout=2)
-            except:
-                pass  # No system notification available
+            with timer.phase("desktop_notification"):
+                if has_binary("notify-send"):
+                    # Linux
+                    subprocess.run([
+                        "notify-send", "-a", "Claude Code", "Claude Code", message
+                    ], capture_output=True, timeout=2)
+                elif has_binary("osascript"):
+                    # macOS
+                    subprocess.run([
+                        "osascript", "-e",
+                        f'display notification "{message}" with title "Claude Code"'
+                    ], capture_output=True, timeout=2)
+        except (subprocess.SubprocessError, OSError):
+            pass  # No system notification available
         
         # Log for debugging (optional)
         log_dir = os.path.join(os.getcwd(), "logs")
         if os.path.exists(log_dir):
-            log_path = os.path.join(log_dir, "notifications.json")
             try:
-                logs = []
-                if os.path.exists(log_path):
-                    with open(log_path, 'r') as f:
-                        logs = json.load(f)
-                
-                logs.append({
-                    "timestamp": datetime.now().isoformat(),
-                    "message": message,
-                    "spoken": spoken_message
-                })
-                
-                # Keep last 50 entries
-                logs = logs[-50:]
-                
-                with open(log_path, 'w') as f:
-                    json.dump(logs, f, indent=2)
+                with timer.phase("log"):
+                    append_log(log_dir, "notifications", {
+                        "timestamp": datetime.now().isoformat(),
+                        "message": message,
+                        "spoken": spoken_message
+                    })
             except:
                 pass
         
@@ -232,6 +194,8 @@ def main():
     except Exception:
         # Fail silently
         sys.exit(0)
+    finally:
+        timer.flush()
 
 
 if __name__ == "__main__":
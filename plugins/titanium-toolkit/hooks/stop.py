@@ -16,11 +16,29 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass  # dotenv is optional
+sys.path.insert(0, str(Path(__file__).parent / "utils" / "metrics"))
+from hook_metrics import HookTimer, startup_phase
+
+with startup_phase("dotenv"):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass  # dotenv is optional
+
+with startup_phase("imports"):
+    sys.path.insert(0, str(Path(__file__).parent / "utils" / "tts"))
+    sys.path.insert(0, str(Path(__file__).parent / "utils" / "transcript"))
+    sys.path.insert(0, str(Path(__file__).parent / "utils" / "logs"))
+    sys.path.insert(0, str(Path(__file__).parent / "utils" / "llm"))
+    from announce_spool import enqueue_announcement
+    from tts_router import speak_routed
+    from log_store import append_log
+    from chat_export import export_chat
+    from transcript_index import update_index
+    from llm_client import complete, llm_available
+    from message_pool import take_message
+    from usage_ledger import set_source
 
 
 def get_completion_messages():
@@ -34,95 +52,36 @@ def get_completion_messages():
     ]
 
 
-def get_tts_script_path():
-    """
-    Determine which TTS script to use based on available API keys and MCP.
-    Priority order: ElevenLabs MCP > OpenAI > local
-    """
-    # Get current script directory and construct utils/tts path
-    script_dir = Path(__file__).parent
-    tts_dir = script_dir / "utils" / "tts"
-    
-    # Check for ElevenLabs MCP first (highest priority)
-    elevenlabs_mcp_script = tts_dir / "elevenlabs_mcp.py"
-    if elevenlabs_mcp_script.exists():
-        return str(elevenlabs_mcp_script)
-    
-    # Check for OpenAI API key (second priority)
-    if os.getenv('OPENAI_API_KEY'):
-        openai_script = tts_dir / "openai_tts.py"
-        if openai_script.exists():
-            return str(openai_script)
-    
-    # Fall back to local TTS (no API key required)
-    local_script = tts_dir / "local_tts.py"
-    if local_script.exists():
-        return str(local_script)
-    
-    return None
-
-
 def get_session_summary(transcript_path):
     """
     Analyze the transcript and create a comprehensive summary
     of what Claude accomplished in this session.
 
-    Uses GPT-5 mini for intelligent session summarization.
+    Uses GPT-5 mini (or Claude Haiku as fallback) for intelligent session
+    summarization. Transcript
+    aggregates come from an incremental index, so only lines appended since
+    the previous Stop are parsed.
     """
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key or not transcript_path or not os.path.exists(transcript_path):
+    if not llm_available() or not transcript_path or not os.path.exists(transcript_path):
         return None
 
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=api_key)
-
-        # Read transcript and collect tool uses
-        tool_uses = []
-        user_requests = []
+        # Tool counts and user intent, updated from newly appended lines only
+        index = update_index(transcript_path)
 
-        with open(transcript_path, 'r') as f:
-            for line in f:
-                try:
-                    msg = json.loads(line.strip())
-
-                    # Collect user messages
-                    if msg.get('role') == 'user':
-                        content = msg.get('content', '')
-                        if isinstance(content, str) and content.strip():
-                            user_requests.append(content[:100])  # First 100 chars
-
-                    # Collect tool uses from content blocks
-                    if msg.get('role') == 'assistant':
-                        content = msg.get('content', [])
-                        if isinstance(content, list):
-                            for block in content:
-                                if isinstance(block, dict) and block.get('type') == 'tool_use':
-                                    tool_uses.append({
-                                        'name': block.get('name'),
-                                        'input': block.get('input', {})
-                                    })
-                except:
-                    pass
-
-        if not tool_uses:
+        if not index["operation_count"]:
             return None
 
         # Build context from tools and user intent
-        context = f"Session completed with {len(tool_uses)} operations.\n"
+        context = f"Session completed with {index['operation_count']} operations.\n"
 
-        if user_requests:
-            context += f"User requested: {user_requests[0]}\n\n"
+        if index["first_user_request"]:
+            context += f"User requested: {index['first_user_request']}\n\n"
 
         context += "Key actions:\n"
 
         # Summarize tool usage
-        tool_counts = {}
-        for tool in tool_uses:
-            name = tool['name']
-            tool_counts[name] = tool_counts.get(name, 0) + 1
-
-        for tool_name, count in list(tool_counts.items())[:10]:
+        for tool_name, count in list(index["tool_counts"].items())[:10]:
             context += f"- {tool_name}: {count}x\n"
 
         prompt = f"""Summarize what Claude accomplished in this work session in 1-2 natural sentences for a voice announcement.
@@ -140,13 +99,7 @@ Examples of good summaries:
 
 Summary:"""
 
-        response = client.chat.completions.create(
-            model="gpt-5-mini",
-            messages=[{"role": "user", "content": prompt}],
-            max_completion_tokens=100,
-        )
-
-        return response.choices[0].message.content.strip()
+        return complete(prompt, max_tokens=100, models={"openai": "gpt-5-mini"}, cache=True)
 
     except Exception as e:
         print(f"Session summary error: {e}", file=sys.stderr)
@@ -155,76 +108,42 @@ Summary:"""
 
 def get_llm_completion_message():
     """
-    Generate completion message using available LLM services.
-    Priority order: OpenAI > Anthropic > fallback to random message
-    
+    Take a pregenerated completion message from the message pool.
+    Falls back to a random predefined message while the pool refills
+    in the background (never waits on an LLM).
+
     Returns:
         str: Generated or fallback completion message
     """
-    # Get current script directory and construct utils/llm path
-    script_dir = Path(__file__).parent
-    llm_dir = script_dir / "utils" / "llm"
-    
-    # Try OpenAI first (highest priority)
-    if os.getenv('OPENAI_API_KEY'):
-        oai_script = llm_dir / "oai.py"
-        if oai_script.exists():
-            try:
-                result = subprocess.run([
-                    "uv", "run", str(oai_script), "--completion"
-                ], 
-                capture_output=True,
-                text=True,
-                timeout=10
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    return result.stdout.strip()
-            except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-                pass
-    
-    # Try Anthropic second
-    if os.getenv('ANTHROPIC_API_KEY'):
-        anth_script = llm_dir / "anth.py"
-        if anth_script.exists():
-            try:
-                result = subprocess.run([
-                    "uv", "run", str(anth_script), "--completion"
-                ], 
-                capture_output=True,
-                text=True,
-                timeout=10
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    return result.stdout.strip()
-            except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-                pass
-    
+    message = take_message()
+    if message:
+        return message
+
     # Fallback to random predefined message
     messages = get_completion_messages()
     return random.choice(messages)
 
-def announce_completion(input_data):
+def announce_completion(input_data, timer):
     """Announce completion with comprehensive session summary."""
     try:
-        tts_script = get_tts_script_path()
-        if not tts_script:
-            return  # No TTS scripts available
-
         # Try to get comprehensive session summary from transcript
         transcript_path = input_data.get('transcript_path')
-        completion_message = get_session_summary(transcript_path)
+        with timer.phase("session_summary"):
+            completion_message = get_session_summary(transcript_path)
 
         # Fallback to generic message if summary fails
         if not completion_message:
-            completion_message = get_llm_completion_message()
+            with timer.phase("completion_message"):
+                completion_message = get_llm_completion_message()
 
-        # Call the TTS script with the completion message
-        subprocess.run([
-            "uv", "run", tts_script, completion_message
-        ],
-        capture_output=True,  # Suppress output
-        timeout=15  # Longer timeout for longer summaries
-        )
+        # Hand off to the spool worker; speak synchronously if unavailable
+        with timer.phase("enqueue"):
+            queued = enqueue_announcement(completion_message, source="stop")
+        if queued:
+            return
+
+        with timer.phase("tts"):
+            speak_routed(completion_message, script_timeout=15)  # Longer timeout for longer summaries
 
     except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
         # Fail silently if TTS encounters issues
@@ -235,14 +154,19 @@ def announce_completion(input_data):
 
 
 def main():
+    timer = HookTimer("stop")
+    set_source("stop")
     try:
         # Parse command line arguments
         parser = argparse.ArgumentParser()
-        parser.add_argument('--chat', action='store_true', help='Copy transcript to chat.json')
+        parser.add_argument('--chat', action='store_true', help='Export new transcript records to logs/')
+        parser.add_argument('--chat-format', choices=['json', 'jsonl', 'archive'], default='json',
+                            help='json: logs/chat.json (default), jsonl: chat/<session>.jsonl per session, archive: compressed chunks')
         args = parser.parse_args()
         
         # Read JSON input from stdin
-        input_data = json.load(sys.stdin)
+        with timer.phase("read_input"):
+            input_data = json.load(sys.stdin)
 
         # Extract required fields
         session_id = input_data.get("session_id", "")
@@ -251,50 +175,24 @@ def main():
         # Ensure log directory exists
         log_dir = os.path.join(os.getcwd(), "logs")
         os.makedirs(log_dir, exist_ok=True)
-        log_path = os.path.join(log_dir, "stop.json")
 
-        # Read existing log data or initialize empty list
-        if os.path.exists(log_path):
-            with open(log_path, 'r') as f:
-                try:
-                    log_data = json.load(f)
-                except (json.JSONDecodeError, ValueError):
-                    log_data = []
-        else:
-            log_data = []
-        
-        # Append new data
-        log_data.append(input_data)
-        
-        # Write back to file with formatting
-        with open(log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        # Append to logs/stop.jsonl (rotated, safe under concurrent hooks)
+        with timer.phase("log"):
+            append_log(log_dir, "stop", input_data)
         
         # Handle --chat switch
         if args.chat and 'transcript_path' in input_data:
             transcript_path = input_data['transcript_path']
             if os.path.exists(transcript_path):
-                # Read .jsonl file and convert to JSON array
-                chat_data = []
+                # Export only records appended since the last Stop
                 try:
-                    with open(transcript_path, 'r') as f:
-                        for line in f:
-                            line = line.strip()
-                            if line:
-                                try:
-                                    chat_data.append(json.loads(line))
-                                except json.JSONDecodeError:
-                                    pass  # Skip invalid lines
-                    
-                    # Write to logs/chat.json
-                    chat_file = os.path.join(log_dir, 'chat.json')
-                    with open(chat_file, 'w') as f:
-                        json.dump(chat_data, f, indent=2)
+                    with timer.phase("chat_export"):
+                        export_chat(transcript_path, log_dir, args.chat_format)
                 except Exception:
                     pass  # Fail silently
 
         # Announce completion via TTS
-        announce_completion(input_data)
+        announce_completion(input_data, timer)
 
         sys.exit(0)
 
@@ -304,6 +202,8 @@ def main():
     except Exception:
         # Handle any other errors gracefully
         sys.exit(0)
+    finally:
+        timer.flush()
 
 
 if __name__ == "__main__":
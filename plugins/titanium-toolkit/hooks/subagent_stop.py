@@ -14,58 +14,37 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass  # dotenv is optional
-
-
-def get_tts_script_path():
-    """
-    Determine which TTS script to use based on available API keys and MCP.
-    Priority order: ElevenLabs MCP > OpenAI > local
-    """
-    # Get current script directory and construct utils/tts path
-    script_dir = Path(__file__).parent
-    tts_dir = script_dir / "utils" / "tts"
-    
-    # Check for ElevenLabs MCP first (highest priority)
-    elevenlabs_mcp_script = tts_dir / "elevenlabs_mcp.py"
-    if elevenlabs_mcp_script.exists():
-        return str(elevenlabs_mcp_script)
-    
-    # Check for OpenAI API key (second priority)
-    if os.getenv('OPENAI_API_KEY'):
-        openai_script = tts_dir / "openai_tts.py"
-        if openai_script.exists():
-            return str(openai_script)
-    
-    # Fall back to local TTS (no API key required)
-    local_script = tts_dir / "local_tts.py"
-    if local_script.exists():
-        return str(local_script)
-    
-    return None
+sys.path.insert(0, str(Path(__file__).parent / "utils" / "metrics"))
+from hook_metrics import HookTimer, startup_phase
+
+with startup_phase("dotenv"):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass  # dotenv is optional
+
+with startup_phase("imports"):
+    sys.path.insert(0, str(Path(__file__).parent / "utils" / "tts"))
+    sys.path.insert(0, str(Path(__file__).parent / "utils" / "logs"))
+    sys.path.insert(0, str(Path(__file__).parent / "utils" / "transcript"))
+    from announce_spool import enqueue_announcement
+    from chat_export import export_chat
+    from log_store import append_log
+    from tts_router import speak_routed
 
 
 def announce_subagent_completion():
     """Announce subagent completion using the best available TTS service."""
     try:
-        tts_script = get_tts_script_path()
-        if not tts_script:
-            return  # No TTS scripts available
-        
         # Use fixed message for subagent completion
         completion_message = "Subagent Complete"
         
-        # Call the TTS script with the completion message
-        subprocess.run([
-            "uv", "run", tts_script, completion_message
-        ], 
-        capture_output=True,  # Suppress output
-        timeout=10  # 10-second timeout
-        )
+        # Hand off to the spool worker; speak synchronously if unavailable
+        if enqueue_announcement(completion_message, source="subagent_stop"):
+            return
+
+        speak_routed(completion_message, script_timeout=10)
         
     except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
         # Fail silently if TTS encounters issues
@@ -76,14 +55,18 @@ def announce_subagent_completion():
 
 
 def main():
+    timer = HookTimer("subagent_stop")
     try:
         # Parse command line arguments
         parser = argparse.ArgumentParser()
-        parser.add_argument('--chat', action='store_true', help='Copy transcript to chat.json')
+        parser.add_argument('--chat', action='store_true', help='Export new transcript records to logs/')
+        parser.add_argument('--chat-format', choices=['json', 'jsonl', 'archive'], default='json',
+                            help='json: logs/chat.json (default), jsonl: chat/<session>.jsonl per session, archive: compressed chunks')
         args = parser.parse_args()
         
         # Read JSON input from stdin
-        input_data = json.load(sys.stdin)
+        with timer.phase("read_input"):
+            input_data = json.load(sys.stdin)
 
         # Extract required fields
         session_id = input_data.get("session_id", "")
@@ -92,50 +75,25 @@ def main():
         # Ensure log directory exists
         log_dir = os.path.join(os.getcwd(), "logs")
         os.makedirs(log_dir, exist_ok=True)
-        log_path = os.path.join(log_dir, "subagent_stop.json")
 
-        # Read existing log data or initialize empty list
-        if os.path.exists(log_path):
-            with open(log_path, 'r') as f:
-                try:
-                    log_data = json.load(f)
-                except (json.JSONDecodeError, ValueError):
-                    log_data = []
-        else:
-            log_data = []
-        
-        # Append new data
-        log_data.append(input_data)
-        
-        # Write back to file with formatting
-        with open(log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        # Append to logs/subagent_stop.jsonl (rotated, safe under concurrent hooks)
+        with timer.phase("log"):
+            append_log(log_dir, "subagent_stop", input_data)
         
         # Handle --chat switch (same as stop.py)
         if args.chat and 'transcript_path' in input_data:
             transcript_path = input_data['transcript_path']
             if os.path.exists(transcript_path):
-                # Read .jsonl file and convert to JSON array
-                chat_data = []
+                # Export only records appended since the last Stop
                 try:
-                    with open(transcript_path, 'r') as f:
-                        for line in f:
-                            line = line.strip()
-                            if line:
-                                try:
-                                    chat_data.append(json.loads(line))
-                                except json.JSONDecodeError:
-                                    pass  # Skip invalid lines
-                    
-                    # Write to logs/chat.json
-                    chat_file = os.path.join(log_dir, 'chat.json')
-                    with open(chat_file, 'w') as f:
-                        json.dump(chat_data, f, indent=2)
+                    with timer.phase("chat_export"):
+                        export_chat(transcript_path, log_dir, args.chat_format)
                 except Exception:
                     pass  # Fail silently
 
         # Announce subagent completion via TTS
-        announce_subagent_completion()
+        with timer.phase("announce"):
+            announce_subagent_completion()
 
         sys.exit(0)
 
@@ -145,6 +103,8 @@ def main():
     except Exception:
         # Handle any other errors gracefully
         sys.exit(0)
+    finally:
+        timer.flush()
 
 
 if __name__ == "__main__":
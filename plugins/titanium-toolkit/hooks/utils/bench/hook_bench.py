@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+"""
+Hook Benchmark Harness
+
+Runs the four hook scripts against synthetic stdin payloads and synthetic
+transcripts (1k to 1M lines), with the local mock API server (mock_api.py)
+standing in for OpenAI, Anthropic and ElevenLabs at a configurable latency.
+Reports, per hook and transcript size:
+
+    wall ms     Median time from start to exit
+    rss MB      Peak resident memory of the hook process or its largest
+                subprocess (e.g. a TTS player), from wait4 in a small launcher
+                process so the harness's own memory isn't counted
+    written     Median bytes the hook added under the project and TITANIUM_HOME
+    api         Requests the hook made to the mock server
+
+Every run starts from a fresh project directory and TITANIUM_HOME (cold
+transcript index, empty chat export), with each hook's log pre-seeded with
+one record per ten transcript lines, so the transcript index, --chat export
+and log writes are measured at their worst case. Audio players, `say` and
+desktop notifiers are replaced by no-op stand-ins on PATH.
+
+Modes:
+    inline   TITANIUM_TTS_SPOOL=0: summaries and TTS happen inside the hook
+    spool    Announcements are queued but no worker is started
+             (TITANIUM_ANNOUNCE_WORKER=0), measuring what Claude Code waits for
+
+Commands:
+    run [options]                 Benchmark hooks (see run --help)
+    transcript <lines> <path>     Write a synthetic transcript
+
+Examples:
+    python3 hook_bench.py run
+    python3 hook_bench.py run --lines 1m --hooks stop --repeat 5
+    python3 hook_bench.py run --save bench-baseline.json
+    python3 hook_bench.py run --baseline bench-baseline.json   # exit 1 on regression
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "mock"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "probe"))
+from mock_api import MockAPIServer
+from capability_probe import has_binary
+
+# Constants
+HOOKS_DIR = Path(__file__).resolve().parent.parent.parent
+DEFAULT_LINES = "1k,10k,100k,1m"
+DEFAULT_WORK_DIR = Path(tempfile.gettempdir()) / "titanium-bench"
+RUN_TIMEOUT_SECONDS = 300
+BASELINE_VERSION = 1
+
+# Differences below these are noise, whatever the ratio
+NOISE_FLOOR = {"wall_ms": 25, "peak_rss_mb": 4, "bytes_written": 16 * 1024}
+
+# Binaries replaced by no-op stand-ins so runs are silent and deterministic
+STUB_BINARIES = ("afplay", "aplay", "ffplay", "mpv", "say", "notify-send", "osascript")
+
+# Forks and execs the hook, then reports its wall time and rusage as JSON on
+# stdout. Linux charges a child the memory high-water mark of the process it
+# was forked from, so wait4 in the (large) harness would report the harness's
+# size; forking from this launcher bounds that at a bare interpreter.
+LAUNCHER = """
+import json, os, sys, time
+started_at = time.perf_counter()
+pid = os.fork()
+if pid == 0:
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+    os.execvp(sys.argv[1], sys.argv[1:])
+_, status, rusage = os.wait4(pid, 0)
+print(json.dumps({"wall_ms": (time.perf_counter() - started_at) * 1000,
+                  "maxrss": rusage.ru_maxrss, "exit_code": os.waitstatus_to_exitcode(status)}))
+"""
+
+# Hook name -> (script, arguments, log name seeded before each run)
+HOOKS = {
+    "post_tool_use": ("post_tool_use_elevenlabs.py", [], "voice_announcements"),
+    "stop": ("stop.py", ["--chat"], "stop"),
+    "subagent_stop": ("subagent_stop.py", ["--chat"], "subagent_stop"),
+    "notification": ("notification.py", [], "notifications"),
+}
+
+TOOLS = ("Read", "Edit", "Write", "Bash", "Grep", "Glob")
+WORDS = (
+    "auth", "session", "token", "refresh", "handler", "middleware", "schema",
+    "migration", "test", "config", "cache", "request", "response", "user",
+)
+
+
+def parse_count(text):
+    """Parse a line count such as 1000, 10k or 1m."""
+    text = text.strip().lower()
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    try:
+        return int(float(text.rstrip("km")) * multiplier)
+    except ValueError:
+        raise ValueError(f"Invalid line count: {text} (use e.g. 1000, 10k, 1m)")
+
+
+def format_count(lines):
+    """Compact label for a line count (1k, 100k, 1m)."""
+    if lines >= 1_000_000 and lines % 1_000_000 == 0:
+        return f"{lines // 1_000_000}m"
+    if lines >= 1_000 and lines % 1_000 == 0:
+        return f"{lines // 1_000}k"
+    return str(lines)
+
+
+def synthetic_message(rng, number):
+    """One transcript record: user prompts, assistant tool calls and tool results."""
+    phrase = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 12)))
+
+    if number % 50 == 0:
+        return {"role": "user", "content": f"Please update the {phrase}"}
+
+    if number % 2 == 1:
+        tool = rng.choice(TOOLS)
+        return {
+            "role": "assistant",
+            "content": [
+                {"type": "text", "text": f"Working on the {phrase}."},
+                {
+                    "type": "tool_use",
+                    "id": f"toolu_{number:08d}",
+                    "name": tool,
+                    "input": {"file_path": f"/project/src/{rng.choice(WORDS)}/{rng.choice(WORDS)}.py"},
+                },
+            ],
+        }
+
+    # Tool results; occasionally a large one (file contents, test output)
+    size = rng.randint(2_000, 8_000) if rng.random() < 0.05 else rng.randint(40, 400)
+    return {
+        "role": "user",
+        "content": [{
+            "type": "tool_result",
+            "tool_use_id": f"toolu_{number - 1:08d}",
+            "content": (phrase + "\n") * max(1, size // (len(phrase) + 1)),
+        }],
+    }
+
+
+def generate_transcript(path, lines, seed=0):
+    """Write a deterministic synthetic transcript with the given number of lines."""
+    rng = random.Random(seed)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    temp_path = path.with_suffix(".tmp")
+    with open(temp_path, 'w', buffering=1024 * 1024) as f:
+        for number in range(lines):
+            f.write(json.dumps(synthetic_message(rng, number)) + "\n")
+    temp_path.replace(path)
+    return path
+
+
+def get_transcript(work_dir, lines):
+    """Cached synthetic transcript for a line count, generated on first use."""
+    path = Path(work_dir) / "transcripts" / f"transcript-{format_count(lines)}.jsonl"
+    if not path.exists():
+        print(f"Generating {format_count(lines)}-line transcript...", file=sys.stderr)
+        generate_transcript(path, lines)
+    return path
+
+
+def get_seed_log(work_dir, records):
+    """Cached pre-existing hook log with the given number of records."""
+    path = Path(work_dir) / "logs" / f"seed-{format_count(records)}.jsonl"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', buffering=1024 * 1024) as f:
+            for number in range(records):
+                f.write(json.dumps({"session_id": "bench", "record": number, "timestamp": "2025-01-01T00:00:00"}) + "\n")
+    return path
+
+
+def build_payload(hook, transcript_path, project_dir):
+    """Hook stdin payload shaped like Claude Code's."""
+    payload = {
+        "session_id": "bench-session",
+        "transcript_path": str(transcript_path),
+        "cwd": str(project_dir),
+    }
+    if hook == "post_tool_use":
+        file_path = str(project_dir / "src" / "auth" / "session.py")
+        payload.update({
+            "hook_event_name": "PostToolUse",
+            "tool_name": "Edit",
+            "tool_input": {"file_path": file_path, "old_string": "return None", "new_string": "return token"},
+            "tool_response": {"filePath": file_path, "success": True},
+        })
+    elif hook == "notification":
+        payload.update({
+            "hook_event_name": "Notification",
+            "message": "Claude needs your permission to use Bash",
+        })
+    else:
+        payload.update({
+            "hook_event_name": "Stop" if hook == "stop" else "SubagentStop",
+            "stop_hook_active": False,
+        })
+    return payload
+
+
+def make_stub_binaries(bin_dir):
+    """Create no-op executables for players, `say` and notifiers."""
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    for name in STUB_BINARIES:
+        stub = bin_dir / name
+        stub.write_text("#!/bin/sh\nexit 0\n")
+        stub.chmod(0o755)
+
+
+def hook_env(server, home, bin_dir, mode):
+    """Environment for a hook run: mock endpoints, isolated state, stand-in binaries."""
+    env = dict(os.environ)
+    env.update({
+        "TITANIUM_HOME": str(home),
+        "PATH": f"{bin_dir}{os.pathsep}{env.get('PATH', '')}",
+        "OPENAI_API_KEY": "bench",
+        "OPENAI_BASE_URL": f"{server.url}/v1",
+        "ANTHROPIC_API_KEY": "bench",
+        "ANTHROPIC_BASE_URL": server.url,
+        "ELEVENLABS_API_KEY": "bench",
+        "ELEVENLABS_BASE_URL": server.url,
+        "TITANIUM_TTS_PROVIDER": "",
+        "ENGINEER_NAME": "",
+        "TITANIUM_HOOK_DAEMON": "0",
+        "TITANIUM_HOOK_METRICS": "0",
+    })
+    if mode == "inline":
+        env["TITANIUM_TTS_SPOOL"] = "0"
+    else:
+        env["TITANIUM_ANNOUNCE_WORKER"] = "0"
+    return env
+
+
+def dir_bytes(*paths):
+    """Total size of the regular files under the given directories."""
+    total = 0
+    for path in paths:
+        for root, _, files in os.walk(path):
+            for name in files:
+                try:
+                    total += os.lstat(os.path.join(root, name)).st_size
+                except OSError:
+                    pass
+    return total
+
+
+def run_hook(command, payload, cwd, env, timeout=RUN_TIMEOUT_SECONDS):
+    """
+    Run one hook invocation and collect its resource usage.
+
+    Returns:
+        dict: wall_ms, peak_rss_mb and exit_code
+    """
+    process = subprocess.Popen(
+        [sys.executable, "-I", "-S", "-c", LAUNCHER, *command],
+        cwd=cwd,
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,  # Timeout kills the launcher and the hook together
+    )
+    killer = threading.Timer(timeout, lambda: os.killpg(process.pid, signal.SIGKILL))
+    killer.start()
+    try:
+        try:
+            process.stdin.write(json.dumps(payload).encode())
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        output = process.stdout.read()
+        process.wait()
+    finally:
+        killer.cancel()
+
+    try:
+        usage = json.loads(output)
+    except json.JSONDecodeError:
+        return {"wall_ms": timeout * 1000, "peak_rss_mb": 0.0, "exit_code": -signal.SIGKILL}
+
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    rss_bytes = usage["maxrss"] if sys.platform == "darwin" else usage["maxrss"] * 1024
+    return {
+        "wall_ms": usage["wall_ms"],
+        "peak_rss_mb": rss_bytes / (1024 * 1024),
+        "exit_code": usage["exit_code"],
+    }
+
+
+def run_scenario(hook, lines, server, work_dir, bin_dir, mode, runner, repeat):
+    """
+    Benchmark one hook at one transcript size.
+
+    Returns:
+        dict: Aggregated result (median wall time and bytes, maximum RSS)
+    """
+    script, arguments, log_name = HOOKS[hook]
+    script_path = HOOKS_DIR / script
+    if runner == "uv":
+        command = ["uv", "run", "--script", str(script_path), *arguments]
+    else:
+        command = [sys.executable, str(script_path), *arguments]
+
+    transcript_path = get_transcript(work_dir, lines)
+    seed_log = get_seed_log(work_dir, max(1, lines // 10))
+
+    runs = []
+    for _ in range(repeat):
+        run_dir = Path(tempfile.mkdtemp(prefix=f"{hook}-", dir=work_dir))
+        try:
+            project_dir = run_dir / "project"
+            home = run_dir / "home"
+            (project_dir / "logs").mkdir(parents=True)
+            home.mkdir()
+            shutil.copyfile(seed_log, project_dir / "logs" / f"{log_name}.jsonl")
+
+            payload = build_payload(hook, transcript_path, project_dir)
+            env = hook_env(server, home, bin_dir, mode)
+
+            bytes_before = dir_bytes(project_dir, home)
+            requests_before = sum(server.request_counts().values())
+            result = run_hook(command, payload, project_dir, env)
+            result["bytes_written"] = dir_bytes(project_dir, home) - bytes_before
+            result["api_calls"] = sum(server.request_counts().values()) - requests_before
+            runs.append(result)
+        finally:
+            shutil.rmtree(run_dir, ignore_errors=True)
+
+    return {
+        "hook": hook,
+        "lines": lines,
+        "wall_ms": statistics.median(run["wall_ms"] for run in runs),
+        "peak_rss_mb": max(run["peak_rss_mb"] for run in runs),
+        "bytes_written": int(statistics.median(run["bytes_written"] for run in runs)),
+        "api_calls": runs[-1]["api_calls"],
+        "exit_codes": sorted({run["exit_code"] for run in runs}),
+    }
+
+
+def format_bytes(size):
+    """Human-readable byte count."""
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def compare(result, baseline, threshold):
+    """
+    Compare a result with its baseline entry.
+
+    Returns:
+        list: Regressed metric descriptions (empty if none)
+    """
+    regressions = []
+    for metric, floor in NOISE_FLOOR.items():
+        old, new = baseline.get(metric), result[metric]
+        if old is None:
+            continue
+        if new > old * threshold and new - old > floor:
+            regressions.append(f"{metric} {old:.1f} -> {new:.1f}")
+    return regressions
+
+
+def print_results(results, baseline_results=None):
+    """Print the results table, with wall-time change against the baseline."""
+    baseline_results = baseline_results or {}
+    print(f"{'hook':<16} {'lines':>6} {'wall ms':>9} {'rss MB':>8} {'written':>10} {'api':>4} {'vs base':>8}")
+    for result in results:
+        base = baseline_results.get((result["hook"], result["lines"]))
+        change = f"{(result['wall_ms'] / base['wall_ms'] - 1) * 100:+.0f}%" if base and base.get("wall_ms") else "-"
+        print(
+            f"{result['hook']:<16} {format_count(result['lines']):>6} {result['wall_ms']:>9.1f} "
+            f"{result['peak_rss_mb']:>8.1f} {format_bytes(result['bytes_written']):>10} "
+            f"{result['api_calls']:>4} {change:>8}"
+        )
+        if result["exit_codes"] != [0]:
+            print(f"    warning: exit codes {result['exit_codes']}")
+
+
+def load_baseline(path):
+    """Baseline results keyed by (hook, lines)."""
+    with open(path, 'r') as f:
+        data = json.load(f)
+    if data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version in {path}")
+    return {(result["hook"], result["lines"]): result for result in data["results"]}
+
+
+def run_benchmarks(args):
+    """Run the selected hooks at each transcript size and report."""
+    if not hasattr(os, "wait4"):
+        print("Error: Benchmarks need os.wait4 (Linux or macOS)", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        sizes = [parse_count(text) for text in args.lines.split(",")]
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    hooks = args.hooks.split(",")
+    unknown = [hook for hook in hooks if hook not in HOOKS]
+    if unknown:
+        print(f"Error: Unknown hook(s): {', '.join(unknown)}", file=sys.stderr)
+        print(f"\nValid hooks: {', '.join(HOOKS)}", file=sys.stderr)
+        sys.exit(1)
+
+    runner = args.runner or ("uv" if has_binary("uv") else "python")
+
+    baseline_results = None
+    if args.baseline:
+        try:
+            baseline_results = load_baseline(args.baseline)
+        except (OSError, ValueError, KeyError, json.JSONDecodeError) as e:
+            print(f"Error: Cannot read baseline: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    work_dir = Path(args.work_dir)
+    bin_dir = work_dir / "bin"
+    make_stub_binaries(bin_dir)
+
+    server = MockAPIServer(latency_ms=args.latency_ms, error_rate=args.error_rate)
+    server.start()
+    print(f"Mock API at {server.url} ({args.latency_ms:g} ms), mode {args.mode}, runner {runner}, "
+          f"{args.repeat} run(s) each\n", file=sys.stderr)
+
+    results = []
+    try:
+        for lines in sizes:
+            for hook in hooks:
+                results.append(run_scenario(hook, lines, server, work_dir, bin_dir, args.mode, runner, args.repeat))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print_results(results, baseline_results)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                "version": BASELINE_VERSION,
+                "created_at": datetime.now().isoformat(),
+                "config": {"latency_ms": args.latency_ms, "mode": args.mode, "runner": runner, "repeat": args.repeat},
+                "results": results,
+            }, f, indent=2)
+        print(f"\n✅ Saved results to {args.save}")
+
+    if baseline_results:
+        regressions = []
+        for result in results:
+            base = baseline_results.get((result["hook"], result["lines"]))
+            if base:
+                for regression in compare(result, base, args.threshold):
+                    regressions.append(f"{result['hook']} @ {format_count(result['lines'])}: {regression}")
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:g}x baseline:", file=sys.stderr)
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            sys.exit(1)
+        print(f"\n✅ No regressions beyond {args.threshold:g}x baseline")
+
+
+def main():
+    """CLI interface for the hook benchmarks."""
+
+    parser = argparse.ArgumentParser(description="Benchmark Titanium hooks offline")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="Benchmark hooks")
+    run.add_argument("--lines", default=DEFAULT_LINES, help=f"Transcript sizes (default: {DEFAULT_LINES})")
+    run.add_argument("--hooks", default=",".join(HOOKS), help="Hooks to run (default: all)")
+    run.add_argument("--repeat", type=int, default=3, help="Runs per hook and size (default: 3)")
+    run.add_argument("--latency-ms", type=float, default=200, help="Mock API latency (default: 200)")
+    run.add_argument("--error-rate", type=float, default=0, help="Fraction of mock API requests answered with 429")
+    run.add_argument("--mode", choices=["inline", "spool"], default="inline")
+    run.add_argument("--runner", choices=["python", "uv"], help="Run hooks with python3 or `uv run --script` "
+                                                               "(default: uv if installed)")
+    run.add_argument("--work-dir", default=str(DEFAULT_WORK_DIR), help="Transcript cache and scratch space")
+    run.add_argument("--save", help="Write results as a baseline JSON file")
+    run.add_argument("--baseline", help="Compare with a saved baseline; exit 1 on regression")
+    run.add_argument("--threshold", type=float, default=1.25, help="Regression ratio (default: 1.25)")
+
+    transcript = subparsers.add_parser("transcript", help="Write a synthetic transcript")
+    transcript.add_argument("lines")
+    transcript.add_argument("path")
+
+    args = parser.parse_args()
+
+    if args.command == "transcript":
+        try:
+            lines = parse_count(args.lines)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        generate_transcript(args.path, lines)
+        print(f"✅ Wrote {lines} lines to {args.path}")
+    else:
+        run_benchmarks(args)
+
+
+if __name__ == "__main__":
+    main()
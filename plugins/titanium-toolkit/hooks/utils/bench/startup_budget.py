@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Hook Startup Budget
+
+Checks how long a hook takes to exit on an event it ignores. Most PostToolUse
+events are skipped tools (Grep, Read, Bash, ...), so this path runs more
+often than any other and should cost little more than starting Python.
+
+The hook runs through hook_client.py exactly as hooks.json invokes it (daemon
+disabled). Time-to-exit is the median of several runs; the budget applies to
+the overhead above a bare `python -c pass` with the same interpreter, which
+keeps it comparable across machines. One extra run with `-X importtime` lists
+the slowest imports when the budget is exceeded (or with --verbose).
+
+Commands:
+    check [--tool Grep] [--budget-ms 50] [--runs 15] [--python PATH] [--verbose]
+
+Examples:
+    python3 startup_budget.py check
+    python3 startup_budget.py check --tool Read --budget-ms 25 --verbose
+
+Environment:
+    TITANIUM_STARTUP_BUDGET_MS   Default budget (default: 50)
+
+Exits 1 when the overhead exceeds the budget.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Constants
+HOOKS_DIR = Path(__file__).resolve().parent.parent.parent
+CLIENT_PATH = HOOKS_DIR / "hook_client.py"
+HOOK_NAME = "post_tool_use_elevenlabs"
+DEFAULT_BUDGET_MS = float(os.getenv("TITANIUM_STARTUP_BUDGET_MS", "50"))
+TOP_IMPORTS = 12
+
+
+def time_command(command, stdin_data, env, runs):
+    """Median wall time in ms of running a command to exit."""
+    samples = []
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        subprocess.run(command, input=stdin_data, env=env, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, text=True, check=False)
+        samples.append((time.perf_counter() - started_at) * 1000)
+    return statistics.median(samples)
+
+
+def parse_importtime(stderr):
+    """
+    Parse `-X importtime` output.
+
+    Returns:
+        list: (cumulative ms, module) for top-level imports, slowest first
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            cumulative_us = int(cumulative)
+        except ValueError:
+            continue  # Header line
+        if not name.startswith("  "):  # One leading space marks a top-level import
+            imports.append((cumulative_us / 1000, name.strip()))
+    return sorted(imports, reverse=True)
+
+
+def check(args):
+    """Measure skipped-tool startup and compare with the budget."""
+    payload = json.dumps({
+        "session_id": "startup-budget",
+        "hook_event_name": "PostToolUse",
+        "tool_name": args.tool,
+        "tool_input": {"pattern": "TODO"},
+        "tool_response": {},
+    })
+
+    with tempfile.TemporaryDirectory(prefix="titanium-startup-") as home:
+        env = dict(os.environ, TITANIUM_HOME=home, TITANIUM_HOOK_DAEMON="0", TITANIUM_HOOK_METRICS="0")
+        hook_command = [args.python, str(CLIENT_PATH), HOOK_NAME]
+
+        # Warm the filesystem and bytecode caches
+        time_command(hook_command, payload, env, 2)
+
+        interpreter_ms = time_command([args.python, "-c", "pass"], "", env, args.runs)
+        hook_ms = time_command(hook_command, payload, env, args.runs)
+
+        result = subprocess.run(
+            [args.python, "-X", "importtime", str(CLIENT_PATH), HOOK_NAME],
+            input=payload, env=env, capture_output=True, text=True, check=False,
+        )
+
+    imports = parse_importtime(result.stderr)
+    overhead_ms = hook_ms - interpreter_ms
+    within_budget = overhead_ms <= args.budget_ms
+
+    print(f"Skipped tool:      {args.tool}")
+    print(f"Interpreter:       {interpreter_ms:7.1f} ms  ({args.python} -c pass)")
+    print(f"Hook time-to-exit: {hook_ms:7.1f} ms  (median of {args.runs})")
+    print(f"Overhead:          {overhead_ms:7.1f} ms  (budget {args.budget_ms:g} ms)")
+    print(f"Imports:           {sum(ms for ms, _ in imports):7.1f} ms  (-X importtime, top level)")
+
+    if args.verbose or not within_budget:
+        print("\nSlowest top-level imports:")
+        for ms, name in imports[:TOP_IMPORTS]:
+            print(f"  {ms:7.1f} ms  {name}")
+
+    if not within_budget:
+        print(f"\n❌ Startup overhead {overhead_ms:.1f} ms exceeds the {args.budget_ms:g} ms budget", file=sys.stderr)
+        sys.exit(1)
+    print("\n✅ Within budget")
+
+
+def main():
+    """CLI interface for the startup budget check."""
+
+    parser = argparse.ArgumentParser(description="Check hook startup time on skipped tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run = subparsers.add_parser("check", help="Measure and compare with the budget")
+    run.add_argument("--tool", default="Grep", help="Skipped tool in the payload (default: Grep)")
+    run.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                     help=f"Allowed overhead over bare interpreter startup (default: {DEFAULT_BUDGET_MS:g})")
+    run.add_argument("--runs", type=int, default=15, help="Timed runs (default: 15)")
+    run.add_argument("--python", default=sys.executable, help="Interpreter to run the hook with")
+    run.add_argument("--verbose", action="store_true", help="Always list the slowest imports")
+    args = parser.parse_args()
+
+    check(args)
+
+
+if __name__ == "__main__":
+    main()
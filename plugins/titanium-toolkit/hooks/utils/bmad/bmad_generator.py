@@ -24,22 +24,45 @@ Commands:
     epic <prd_path> <arch_path> <epic_num> <project_path>  Generate single epic
     index <epics_dir> <project_path>                Generate story index
 
+PRD, architecture and epic responses are streamed into <document>.partial as
+they arrive and renamed into place when complete, so an interrupted run keeps
+its partial output. Each stage reports time to first token and tokens/sec.
+
+Architecture is generated outline-first: one fast call fixes the tech stack
+and what each section covers. Then one call writes the foundation (overview,
+principles, high-level architecture, component details) while the six
+independent sections (data, infrastructure, security, deployment, monitoring,
+appendix) are written concurrently, each in its own call, and everything is
+stitched together in order. Wall time approaches the slowest call; the PRD
+excerpt and outline are sent with each of the 8 calls (2 before), and output
+is capped at 16000 + 6 x 4000 tokens (32000 before).
+
 Examples:
     uv run bmad_generator.py brief "AI todo app with voice input" "$(pwd)"
     uv run bmad_generator.py prd bmad-backlog/product-brief.md "$(pwd)"
     uv run bmad_generator.py architecture bmad-backlog/prd/prd.md "$(pwd)"
     uv run bmad_generator.py epic bmad-backlog/prd/prd.md bmad-backlog/architecture/architecture.md 1 "$(pwd)"
     uv run bmad_generator.py index bmad-backlog/epics/ "$(pwd)"
+
+Environment:
+    BMAD_STREAM=0         Wait for complete responses instead of streaming (default: 1)
+    BMAD_MAX_PARALLEL     Architecture calls run at once (default: 7, all of them)
 """
 
 import json
 import sys
 import os
 import re
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "llm"))
+from usage_ledger import record_response
+
 
 def get_claude_model(task_type: str = "default") -> str:
     """
@@ -61,6 +84,94 @@ def get_claude_model(task_type: str = "default") -> str:
         return os.getenv("ANTHROPIC_SMALL_MODEL", "claude-haiku-4-5-20251001")
 
 
+def stream_enabled() -> bool:
+    """Whether long generations stream (BMAD_STREAM=0 disables)."""
+    return os.getenv("BMAD_STREAM", "1") != "0"
+
+
+def partial_path_for(path: Path) -> Path:
+    """Where a document is written while it is being generated."""
+    return path.with_name(path.name + ".partial")
+
+
+def generate_to_partial(client, partial_path: Path, command: str, append: bool = False,
+                        label: str = None, **request) -> str:
+    """
+    Run one Messages API request, writing the text to partial_path as it arrives.
+
+    The file is flushed after every streamed chunk, so whatever was received
+    survives an interrupted run. Time to first token and throughput are
+    printed and recorded in the usage ledger. Ctrl-C is only handled here on
+    the main thread (architecture calls on worker threads never see it;
+    generate_architecture handles it).
+
+    Args:
+        client: Anthropic client
+        partial_path: In-progress document file
+        command: Generator command for reporting (prd, architecture, epic)
+        append: Continue an existing partial document instead of starting it
+        label: Stage within the command (e.g. an architecture section)
+        **request: Arguments for client.messages.create()
+
+    Returns:
+        Response text (stripped)
+    """
+    partial_path.parent.mkdir(parents=True, exist_ok=True)
+    streaming = stream_enabled()
+    started_at = time.monotonic()
+    first_token_at = None
+
+    with open(partial_path, 'a' if append else 'w', encoding='utf-8', newline='\n') as f:
+        if append:
+            f.write("\n\n")
+        try:
+            if streaming:
+                with client.messages.stream(**request) as stream:
+                    for text in stream.text_stream:
+                        if first_token_at is None:
+                            first_token_at = time.monotonic()
+                        f.write(text)
+                        f.flush()
+                    response = stream.get_final_message()
+            else:
+                response = client.messages.create(**request)
+                f.write(response.content[0].text)
+        except KeyboardInterrupt:
+            print(f"Interrupted{partial_note(partial_path)}", file=sys.stderr)
+            sys.exit(130)
+
+    elapsed = time.monotonic() - started_at
+    ttft = first_token_at - started_at if first_token_at is not None else None
+    output_tokens = response.usage.output_tokens
+    record_response(response, started_at, "bmad_generator", command, streamed=streaming,
+                    ttft_ms=round(ttft * 1000, 1) if ttft is not None else None,
+                    **({"stage": label} if label else {}))
+
+    first_token = f"first token {ttft:.1f}s, " if ttft is not None else ""
+    # One write per line: architecture sections finish on parallel threads
+    print(f"⏱️  {f'{command} ({label})' if label else command}: {first_token}{output_tokens:,} tokens in {elapsed:.1f}s "
+          f"({output_tokens / elapsed if elapsed else 0:.0f} tokens/sec)\n", end="", flush=True)
+
+    return response.content[0].text.strip()
+
+
+def finalize_document(partial_path: Path, document_path: Path, content: str) -> None:
+    """Write the final (cleaned) content and atomically rename the partial file into place."""
+    with open(partial_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(content)
+    partial_path.replace(document_path)
+
+
+def partial_note(partial_path: Path) -> str:
+    """Error suffix pointing at the output kept from an interrupted generation."""
+    if partial_path.is_dir():
+        if any(partial_path.iterdir()):
+            return f" (partial output kept in {partial_path})"
+    elif partial_path.exists() and partial_path.stat().st_size:
+        return f" (partial output kept in {partial_path})"
+    return ""
+
+
 def generate_brief(idea: str, project_path: str) -> str:
     """
     Generate Product Brief from high-level idea.
@@ -269,12 +380,14 @@ Be comprehensive but concise. Infer reasonable defaults based on the idea. Forma
         # Use Haiku for brief generation (documentation task, fast)
         model = get_claude_model("default")
 
+        started_at = time.monotonic()
         response = client.messages.create(
             model=model,
             max_tokens=3000,
             temperature=0.4,
             messages=[{"role": "user", "content": prompt}]
         )
+        record_response(response, started_at, "bmad_generator", "brief")
 
         brief_content = response.content[0].text.strip()
 
@@ -617,31 +730,29 @@ IMPORTANT GUIDELINES:
 7. Be specific with technical requirements
 8. Format as clean markdown with proper headers"""
 
+    prd_path = Path(project_path) / "bmad-backlog" / "prd" / "prd.md"
+    partial_path = partial_path_for(prd_path)
+
     try:
         # Use Haiku for PRD generation (documentation task)
         model = get_claude_model("default")
 
         # Haiku 4.5 supports up to 16384 output tokens
-        response = client.messages.create(
+        prd_content = generate_to_partial(
+            client, partial_path, "prd",
             model=model,
             max_tokens=16000,
             temperature=0.3,
             messages=[{"role": "user", "content": prompt}]
         )
 
-        prd_content = response.content[0].text.strip()
-
         # Save to file
-        prd_path = Path(project_path) / "bmad-backlog" / "prd" / "prd.md"
-        prd_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(prd_path, 'w', encoding='utf-8', newline='\n') as f:
-            f.write(prd_content)
+        finalize_document(partial_path, prd_path, prd_content)
 
         return prd_content
 
     except Exception as e:
-        print(f"Error generating PRD: {e}", file=sys.stderr)
+        print(f"Error generating PRD: {e}{partial_note(partial_path)}", file=sys.stderr)
         sys.exit(1)
 
 
@@ -681,100 +792,29 @@ def extract_project_name(content: str) -> str:
     return "Project"
 
 
-def generate_architecture(prd_path: str, project_path: str) -> str:
-    """
-    Generate Architecture document from PRD.
-
-    Args:
-        prd_path: Path to prd.md
-        project_path: Project directory path
-
-    Returns:
-        Generated architecture content
-    """
-    load_dotenv()
-
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        print("Error: ANTHROPIC_API_KEY not found", file=sys.stderr)
-        sys.exit(1)
-
-    # Read PRD
-    try:
-        with open(prd_path, 'r', encoding='utf-8') as f:
-            prd_content = f.read()
-    except Exception as e:
-        print(f"Error reading PRD: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    from anthropic import Anthropic
-    client = Anthropic(api_key=api_key)
-
-    current_date = datetime.now().strftime("%B %d, %Y")
-    project_name = extract_project_name(prd_content)
-
-    prompt = f"""Generate a comprehensive Architecture Document following BMAD methodology.
-
-Product Requirements Document:
-{prd_content[:3000]}  # First part for context
-
-Based on the PRD above, create a detailed Architecture Document.
-
-This will be generated in TWO parts due to length. This is PART 1.
-
-# Architecture Document
-## {project_name}
-
-**Document Version:** 1.0
-**Last Updated:** {current_date}
-**Architecture Owner:** TBD
-**Status:** Draft
-
----
-
-## Table of Contents
-1. [System Overview](#system-overview)
-2. [Architecture Principles](#architecture-principles)
-3. [High-Level Architecture](#high-level-architecture)
-4. [Component Details](#component-details)
-5. [Data Architecture](#data-architecture)
-6. [Infrastructure](#infrastructure)
-7. [Security Architecture](#security-architecture)
-8. [Deployment Strategy](#deployment-strategy)
-9. [Monitoring & Observability](#monitoring--observability)
-10. [Appendix](#appendix)
-
----
-
-## System Overview
-
-### Context
-{{2-3 paragraphs explaining what the system does, referencing PRD features}}
+# Architecture sections in document order: (title, what the section contains).
+# The foundation sections build on each other (overview, principles, layers,
+# tech stack) and are written together in one call.
+ARCHITECTURE_FOUNDATION = [
+    ("System Overview", """### Context
+{2-3 paragraphs explaining what the system does, referencing PRD features}
 
 ### Key Requirements
-{{Extract from PRD:
+{Extract from PRD:
 - Latency targets
 - Throughput requirements
 - Availability needs
-- Security requirements}}
-
----
-
-## Architecture Principles
+- Security requirements}"""),
 
-{{List 6-10 guiding principles, e.g.:
+    ("Architecture Principles", """{List 6-10 guiding principles, e.g.:
 1. **Mobile-First Design:** Responsive, progressive enhancement
 2. **API-First Development:** RESTful/GraphQL, versioned
 3. **Event-Driven Where Appropriate:** Async workflows
 4. **AI Transparency:** Source attribution, confidence thresholds
 5. **Observability-First:** Metrics, logging, tracing
-6. **Cost Optimization:** Efficient scaling, caching}}
-
----
-
-## High-Level Architecture
+6. **Cost Optimization:** Efficient scaling, caching}"""),
 
-{{Create ASCII diagram showing all layers:
+    ("High-Level Architecture", """{Create ASCII diagram showing all layers:
 - Client Layer (Frontend)
 - API Gateway Layer
 - Application Layer (Backend services)
@@ -785,7 +825,7 @@ This will be generated in TWO parts due to length. This is PART 1.
 - AI/ML Layer (if applicable)
 - External Integrations
 
-Use box-drawing characters for clarity}}
+Use box-drawing characters for clarity}
 
 Example format:
 ```
@@ -800,26 +840,22 @@ Example format:
 ├─────────────────────────────────────────┤
 │  FastAPI / Express                       │
 └─────────────────────────────────────────┘
-{{etc}}
-```
-
----
-
-## Component Details
+{etc}
+```"""),
 
-### Frontend
+    ("Component Details", """### Frontend
 
 #### Technology Stack
-- **Framework:** {{Next.js/React/Vue/etc based on PRD}}
-- **Language:** {{TypeScript/JavaScript}}
-- **Styling:** {{Tailwind/CSS-in-JS/etc}}
-- **State Management:** {{Zustand/Redux/Context}}
-- **Data Fetching:** {{React Query/SWR/etc}}
+- **Framework:** {Next.js/React/Vue/etc based on PRD}
+- **Language:** {TypeScript/JavaScript}
+- **Styling:** {Tailwind/CSS-in-JS/etc}
+- **State Management:** {Zustand/Redux/Context}
+- **Data Fetching:** {React Query/SWR/etc}
 
 #### Key Features
-- {{Feature 1}}
-- {{Feature 2}}
-- {{Feature 3}}
+- {Feature 1}
+- {Feature 2}
+- {Feature 3}
 
 #### File Structure
 ```
@@ -829,10 +865,10 @@ app/ or src/
 │   └── register/
 ├── (dashboard)/
 │   ├── page.tsx
-│   └── {{routes based on PRD}}
+│   └── {routes based on PRD}
 ├── components/
 │   ├── ui/
-│   └── {{feature components}}
+│   └── {feature components}
 └── lib/
     ├── api-client.ts
     └── utils.ts
@@ -841,60 +877,33 @@ app/ or src/
 ### Backend
 
 #### Technology Stack
-- **Framework:** {{FastAPI/Express/Django based on PRD}}
-- **Language:** {{Python/Node.js/etc}}
-- **ORM:** {{SQLAlchemy/Prisma/TypeORM}}
-- **Validation:** {{Pydantic/Zod/etc}}
-- **Async:** {{asyncio/promises}}
+- **Framework:** {FastAPI/Express/Django based on PRD}
+- **Language:** {Python/Node.js/etc}
+- **ORM:** {SQLAlchemy/Prisma/TypeORM}
+- **Validation:** {Pydantic/Zod/etc}
+- **Async:** {asyncio/promises}
 
 #### Service Architecture
 ```
 services/
 ├── api/
 │   ├── routers/
-│   │   ├── {{route1}}.py
-│   │   ├── {{route2}}.py
-│   │   └── {{route3}}.py
+│   │   ├── {route1}.py
+│   │   ├── {route2}.py
+│   │   └── {route3}.py
 │   ├── dependencies.py
 │   └── main.py
 ├── models/
 ├── schemas/
 └── services/
-```
-
----
+```"""),
+]
 
-Generate this first part comprehensively. Include specific tech stack based on PRD requirements. Be detailed. Next, I'll request part 2 with Data Architecture, Security, etc."""
+# Independent sections, each written in its own call alongside the foundation
+ARCHITECTURE_SECTIONS = [
+    ("Data Architecture", """### Database Schema ({PostgreSQL/MySQL/MongoDB based on tech stack})
 
-    try:
-        # Use Sonnet for architecture (complex technical task with code examples)
-        model = get_claude_model("complex")
-
-        # Sonnet 4.5 supports up to 16384 output tokens
-        response = client.messages.create(
-            model=model,
-            max_tokens=16000,
-            temperature=0.3,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        arch_part1 = response.content[0].text.strip()
-
-        # Generate Part 2
-        prompt_part2 = f"""Continue the Architecture Document. This is PART 2.
-
-Here's what you generated in Part 1:
-{arch_part1[:1000]}
-
-Now generate the remaining sections:
-
----
-
-## Data Architecture
-
-### Database Schema ({{PostgreSQL/MySQL/MongoDB based on tech stack}})
-
-{{Generate CREATE TABLE statements for all main entities from PRD}}
+{Generate CREATE TABLE statements for all main entities from PRD}
 
 Example:
 ```sql
@@ -904,142 +913,335 @@ CREATE TABLE users (
     created_at TIMESTAMPTZ DEFAULT NOW()
 );
 
-{{Add more tables for all PRD entities}}
+{Add more tables for all PRD entities}
 ```
 
-{{If time-series data needed:}}
+{If time-series data needed:}
 ### Time-Series Tables (TimescaleDB)
 ```sql
-CREATE TABLE {{timeseries_table}} (
+CREATE TABLE {timeseries_table} (
     time TIMESTAMPTZ NOT NULL,
-    {{fields}},
-    PRIMARY KEY (time, {{partition_key}})
+    {fields},
+    PRIMARY KEY (time, {partition_key})
 );
 
-SELECT create_hypertable('{{table}}', 'time');
+SELECT create_hypertable('{table}', 'time');
 ```
 
-{{If AI features:}}
+{If AI features:}
 ### Vector Store (pgvector)
 ```sql
 CREATE EXTENSION vector;
 CREATE TABLE embeddings (
     id UUID PRIMARY KEY,
     embedding vector(1536),
-    {{fields}}
+    {fields}
 );
-```
-
----
+```"""),
 
-## Infrastructure
+    ("Infrastructure", """### MVP Deployment ({Railway/Vercel/etc})
+{Configuration, services, why chosen}
 
-### MVP Deployment ({{Railway/Vercel/etc}})
-{{Configuration, services, why chosen}}
+### Production Deployment ({GKE/ECS/etc})
+{When to migrate, architecture, cost}"""),
 
-### Production Deployment ({{GKE/ECS/etc}})
-{{When to migrate, architecture, cost}}
-
----
-
-## Security Architecture
-
-### Authentication & Authorization
-{{Flow diagram, JWT details, code examples}}
+    ("Security Architecture", """### Authentication & Authorization
+{Flow diagram, JWT details, code examples}
 
 ### Rate Limiting
-{{Tier-based limits, implementation with code}}
+{Tier-based limits, implementation with code}
 
 ### Data Encryption
-{{At rest, in transit}}
-
----
-
-## Deployment Strategy
+{At rest, in transit}"""),
 
-### CI/CD Pipeline
+    ("Deployment Strategy", """### CI/CD Pipeline
 ```yaml
-{{GitHub Actions or similar YAML}}
+{GitHub Actions or similar YAML}
 ```
 
 ### Database Migrations
-{{Alembic/Flyway examples}}
+{Alembic/Flyway examples}"""),
 
----
-
-## Monitoring & Observability
-
-### Metrics (Prometheus)
+    ("Monitoring & Observability", """### Metrics (Prometheus)
 ```python
-{{Code examples of metrics}}
+{Code examples of metrics}
 ```
 
 ### Logging
 ```python
-{{Structured logging examples}}
-```
-
----
-
-## Appendix
+{Structured logging examples}
+```"""),
 
-### Technology Decisions
+    ("Appendix", """### Technology Decisions
 
 | Component | Choice | Alternatives | Rationale |
 |-----------|--------|-------------|-----------|
-| Frontend | {{choice}} | {{alt1, alt2}} | {{why}} |
-| Backend | {{choice}} | {{alt1, alt2}} | {{why}} |
-| Database | {{choice}} | {{alt1, alt2}} | {{why}} |
+| Frontend | {choice} | {alt1, alt2} | {why} |
+| Backend | {choice} | {alt1, alt2} | {why} |
+| Database | {choice} | {alt1, alt2} | {why} |
 
 ### Performance Benchmarks
 
 | Metric | Target | Measurement |
 |--------|--------|-------------|
-| {{metric}} | {{target}} | {{how measured}} |
+| {metric} | {target} | {how measured} |
 
 ### Cost Estimates
 
 **MVP:**
-- {{Service 1}}: ${{X}}/month
-- {{Service 2}}: ${{Y}}/month
-- **Total: ~${{Z}}/month**
+- {Service 1}: ${X}/month
+- {Service 2}: ${Y}/month
+- **Total: ~${Z}/month**
 
 **Production:**
-- {{Scaled costs}}
+- {Scaled costs}"""),
+]
 
----
 
-**Document Status:** ✅ Ready for Implementation
-**Next Steps:** Epic breakdown, story writing
+# Output budget per independent section (the foundation call keeps 16000)
+SECTION_MAX_TOKENS = 4000
 
----
 
-Be comprehensive. Include real code examples. Be specific with costs."""
+def generate_architecture_outline(client, prd_excerpt: str) -> str:
+    """
+    Fix the decisions every architecture section has to agree on.
 
-        # Use same model for part 2 (Sonnet supports 16384 output tokens)
-        response_part2 = client.messages.create(
-            model=model,
-            max_tokens=16000,
-            temperature=0.3,
-            messages=[{"role": "user", "content": prompt_part2}]
+    One short call on the fast model settles the tech stack, components and
+    data entities, so sections generated in parallel stay consistent.
+
+    Args:
+        client: Anthropic client
+        prd_excerpt: Start of the PRD
+
+    Returns:
+        Outline as formatted JSON (or the raw response if it isn't JSON)
+    """
+    section_titles = "\n".join(f"- {title}" for title, _ in ARCHITECTURE_FOUNDATION + ARCHITECTURE_SECTIONS)
+    prompt = f"""You are planning an Architecture Document following BMAD methodology.
+
+Product Requirements Document:
+{prd_excerpt}
+
+Decide the architecture before the document is written. Its sections will be written
+separately from your outline, so every decision they must agree on belongs here:
+
+{section_titles}
+
+Return ONLY valid JSON in this format:
+{{
+  "tech_stack": {{"frontend": "...", "backend": "...", "database": "...", "cache": "...", "hosting_mvp": "...", "hosting_production": "...", "other": ["..."]}},
+  "components": [{{"name": "...", "responsibility": "..."}}],
+  "entities": [{{"name": "...", "key_fields": ["..."]}}],
+  "sections": {{"System Overview": "2-3 sentences on what this section covers for this project"}}
+}}
+
+Choose a specific tech stack based on the PRD requirements. Include every section listed above."""
+
+    started_at = time.monotonic()
+    response = client.messages.create(
+        model=get_claude_model("default"),
+        max_tokens=2000,
+        temperature=0.3,
+        messages=[{"role": "user", "content": prompt}]
+    )
+    record_response(response, started_at, "bmad_generator", "architecture", stage="outline")
+    print(f"⏱️  architecture (outline): {time.monotonic() - started_at:.1f}s")
+
+    outline = response.content[0].text.strip()
+    # Strip a markdown code fence around the JSON
+    outline = re.sub(r'^```(?:json)?\s*|\s*```$', '', outline)
+    try:
+        return json.dumps(json.loads(outline), indent=2)
+    except json.JSONDecodeError:
+        return outline  # Still useful as context for the sections
+
+
+def generate_architecture_foundation(client, sections_dir: Path, project_name: str, prd_excerpt: str,
+                                     outline: str) -> str:
+    """
+    Generate the foundation sections (overview through component details) in one call.
+
+    Streams into sections_dir/00-foundation.md.partial while the independent
+    sections are generated.
+
+    Returns:
+        The foundation sections' markdown
+    """
+    templates = "\n\n---\n\n".join(f"## {title}\n\n{template}" for title, template in ARCHITECTURE_FOUNDATION)
+    prompt = f"""You are writing the first sections of an Architecture Document for {project_name}, following BMAD methodology.
+
+Product Requirements Document:
+{prd_excerpt}
+
+Architecture outline (decided - use exactly this tech stack, these components and entities):
+{outline}
+
+Write ONLY these sections, in this order. The remaining sections (data, infrastructure,
+security, deployment, monitoring, appendix) are written separately: do not write them, and
+do not add a document title, table of contents or status footer.
+
+{templates}
+
+Separate the sections with "---". Be comprehensive and specific to this project."""
+
+    return generate_to_partial(
+        client, sections_dir / "00-foundation.md.partial", "architecture", label="foundation",
+        # Use Sonnet for architecture (complex technical task with code examples)
+        model=get_claude_model("complex"),
+        max_tokens=16000,
+        temperature=0.3,
+        messages=[{"role": "user", "content": prompt}]
+    )
+
+
+def generate_architecture_section(client, sections_dir: Path, index: int, title: str, template: str,
+                                  project_name: str, prd_excerpt: str, outline: str) -> str:
+    """
+    Generate one architecture section against the shared outline.
+
+    Streams into sections_dir/<NN>-<slug>.md.partial, so a failed run keeps
+    every section written so far.
+
+    Returns:
+        The section's markdown, starting with its "## {title}" heading
+    """
+    prompt = f"""You are writing one section of an Architecture Document for {project_name}, following BMAD methodology.
+
+Product Requirements Document:
+{prd_excerpt}
+
+Architecture outline (decided - use exactly this tech stack, these components and entities):
+{outline}
+
+Write ONLY the "{title}" section. The overview, principles, high-level architecture and
+component details are written separately, as are the other sections: do not repeat
+their content, and do not add a document title, table of contents or status footer.
+
+## {title}
+
+{template}
+
+Start with the "## {title}" heading. Be comprehensive and specific to this project.
+Include real code examples where the section calls for them. Be specific with costs."""
+
+    slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
+    section = generate_to_partial(
+        client, sections_dir / f"{index:02d}-{slug}.md.partial", "architecture", label=title,
+        # Use Sonnet for architecture (complex technical task with code examples)
+        model=get_claude_model("complex"),
+        max_tokens=SECTION_MAX_TOKENS,
+        temperature=0.3,
+        messages=[{"role": "user", "content": prompt}]
+    )
+
+    if not section.startswith("## "):
+        section = f"## {title}\n\n{section}"
+    return section
+
+
+def generate_architecture(prd_path: str, project_path: str) -> str:
+    """
+    Generate Architecture document from PRD.
+
+    Args:
+        prd_path: Path to prd.md
+        project_path: Project directory path
+
+    Returns:
+        Generated architecture content
+    """
+    load_dotenv()
+
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        print("Error: ANTHROPIC_API_KEY not found", file=sys.stderr)
+        sys.exit(1)
+
+    # Read PRD
+    try:
+        with open(prd_path, 'r', encoding='utf-8') as f:
+            prd_content = f.read()
+    except Exception as e:
+        print(f"Error reading PRD: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    from anthropic import Anthropic
+    client = Anthropic(api_key=api_key)
+
+    current_date = datetime.now().strftime("%B %d, %Y")
+    project_name = extract_project_name(prd_content)
+
+    arch_path = Path(project_path) / "bmad-backlog" / "architecture" / "architecture.md"
+    partial_path = partial_path_for(arch_path)
+    # Each section streams into its own file while the others are generated
+    sections_dir = arch_path.parent / ".architecture-sections"
+    prd_excerpt = prd_content[:3000]
+
+    try:
+        outline = generate_architecture_outline(client, prd_excerpt)
+
+        # Foundation call plus one per independent section, all at once by default
+        max_parallel = max(1, int(os.getenv("BMAD_MAX_PARALLEL", str(1 + len(ARCHITECTURE_SECTIONS)))))
+        shutil.rmtree(sections_dir, ignore_errors=True)
+        with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+            futures = [
+                executor.submit(generate_architecture_foundation, client, sections_dir,
+                                project_name, prd_excerpt, outline)
+            ] + [
+                executor.submit(generate_architecture_section, client, sections_dir, index,
+                                title, template, project_name, prd_excerpt, outline)
+                for index, (title, template) in enumerate(ARCHITECTURE_SECTIONS, 1)
+            ]
+            # Neither exit waits for in-flight sections (leaving the executor,
+            # and interpreter exit, would join them); their files are flushed
+            try:
+                for future in as_completed(futures):
+                    future.result()  # Fail on the first error, whichever section
+            except KeyboardInterrupt:
+                print(f"Interrupted{partial_note(sections_dir)}", file=sys.stderr, flush=True)
+                os._exit(130)
+            except Exception as e:
+                print(f"Error generating architecture: {e}{partial_note(sections_dir)}", file=sys.stderr, flush=True)
+                sys.stdout.flush()
+                os._exit(1)
+
+            # Stitched in document order, whichever finished first
+            sections = [future.result() for future in futures]
+
+        toc = "\n".join(
+            f"{index}. [{title}](#{title.lower().replace(' ', '-').replace('&', '')})"
+            for index, (title, _) in enumerate(ARCHITECTURE_FOUNDATION + ARCHITECTURE_SECTIONS, 1)
         )
+        arch_content = f"""# Architecture Document
+## {project_name}
+
+**Document Version:** 1.0
+**Last Updated:** {current_date}
+**Architecture Owner:** TBD
+**Status:** Draft
 
-        arch_part2 = response_part2.content[0].text.strip()
+---
 
-        # Combine parts
-        arch_content = arch_part1 + "\n\n" + arch_part2
+## Table of Contents
+{toc}
 
-        # Save to file
-        arch_path = Path(project_path) / "bmad-backlog" / "architecture" / "architecture.md"
-        arch_path.parent.mkdir(parents=True, exist_ok=True)
+---
+
+""" + "\n\n---\n\n".join(sections) + """
+
+---
 
-        with open(arch_path, 'w', encoding='utf-8', newline='\n') as f:
-            f.write(arch_content)
+**Document Status:** ✅ Ready for Implementation
+**Next Steps:** Epic breakdown, story writing"""
+
+        # Save to file
+        finalize_document(partial_path, arch_path, arch_content)
+        shutil.rmtree(sections_dir, ignore_errors=True)
 
         return arch_content
 
     except Exception as e:
-        print(f"Error generating architecture: {e}", file=sys.stderr)
+        print(f"Error generating architecture: {e}{partial_note(sections_dir)}", file=sys.stderr)
         sys.exit(1)
 
 
@@ -1211,36 +1413,36 @@ IMPORTANT:
 - Story format: STORY-{epic_number:03d}-{{num:02d}}
 - Make acceptance criteria specific and testable"""
 
+    epics_dir = Path(project_path) / "bmad-backlog" / "epics"
+    # Final name depends on the generated title
+    partial_path = partial_path_for(epics_dir / f"EPIC-{epic_number:03d}.md")
+
     try:
         # Use Haiku for epic generation (documentation)
         model = get_claude_model("default")
 
         # Haiku 4.5 supports up to 16384 output tokens
-        response = client.messages.create(
+        epic_content = generate_to_partial(
+            client, partial_path, "epic",
             model=model,
             max_tokens=16000,
             temperature=0.3,
             messages=[{"role": "user", "content": prompt}]
         )
 
-        epic_content = response.content[0].text.strip()
-
         # Extract epic title for filename
         title_match = re.search(r'EPIC-\d+:\s*(.+)', epic_content)
         epic_title = title_match.group(1).strip() if title_match else "epic"
         epic_slug = epic_title.lower().replace(' ', '-').replace('&', 'and')
 
         # Save to file
-        epic_path = Path(project_path) / "bmad-backlog" / "epics" / f"EPIC-{epic_number:03d}-{epic_slug}.md"
-        epic_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(epic_path, 'w', encoding='utf-8', newline='\n') as f:
-            f.write(epic_content)
+        epic_path = epics_dir / f"EPIC-{epic_number:03d}-{epic_slug}.md"
+        finalize_document(partial_path, epic_path, epic_content)
 
         return epic_content
 
     except Exception as e:
-        print(f"Error generating epic: {e}", file=sys.stderr)
+        print(f"Error generating epic: {e}{partial_note(partial_path)}", file=sys.stderr)
         sys.exit(1)
 
 
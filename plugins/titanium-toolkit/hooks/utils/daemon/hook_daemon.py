@@ -0,0 +1,375 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "python-dotenv",
+#     "openai",
+# ]
+# ///
+
+"""
+Titanium Hook Daemon
+
+Opt-in long-lived process that keeps the voice hooks (post_tool_use_elevenlabs,
+stop, subagent_stop, notification) imported and warm. hooks/hook_client.py
+forwards each event over a unix socket; the daemon forks a child per event so
+every hook runs with its own cwd, environment and stdin, without paying
+interpreter startup or dotenv/openai import cost again.
+
+The daemon acknowledges an event once a child has been forked for it; the
+client runs the hook itself when no acknowledgment arrives. Settings the hook
+modules read at import (TITANIUM_*, ENGINEER_NAME, provider keys and URLs)
+are fixed when the daemon starts, so an event whose settings differ is
+declined (the client runs it in-process) and the daemon restarts itself with
+the new environment; so does an edited .env. Each forked child loads .env
+into the client's environment again, as the hooks' own load_dotenv() does
+when run directly.
+
+Commands:
+    start     Start the daemon in the background
+    stop      Stop a running daemon
+    status    Report whether the daemon is running
+    serve     Run the daemon in the foreground
+
+Examples:
+    uv run hook_daemon.py start
+    uv run hook_daemon.py status
+    uv run hook_daemon.py stop
+
+Environment:
+    TITANIUM_HOME          State directory (default: ~/.titanium)
+    TITANIUM_HOOK_SOCKET   Socket path (default: $TITANIUM_HOME/hookd.sock)
+"""
+
+import importlib.util
+import io
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "runtime"))
+from plugin_runtime import runtime_command
+
+# Constants
+HOOKS_DIR = Path(__file__).parent.parent.parent
+HOOK_NAMES = ("post_tool_use_elevenlabs", "stop", "subagent_stop", "notification")
+TITANIUM_HOME = Path(os.getenv("TITANIUM_HOME", Path.home() / ".titanium"))
+SOCKET_PATH = Path(os.getenv("TITANIUM_HOOK_SOCKET", TITANIUM_HOME / "hookd.sock"))
+PID_PATH = TITANIUM_HOME / "hookd.pid"
+LOG_PATH = TITANIUM_HOME / "hookd.log"
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+# Imported lazily by the hooks (after skip checks); warmed here so forked
+# children find them in sys.modules
+WARM_MODULES = ("dotenv", "announce_spool", "tool_summary", "tts_router", "log_store", "llm_client",
+                "openai", "anthropic")
+# Variables read into module constants at import; a change needs a restart
+CONFIG_PREFIXES = ("TITANIUM_", "ENGINEER_NAME", "OPENAI_", "ANTHROPIC_", "ELEVENLABS_")
+ACK = b"ok"
+DECLINE = b"restart"
+
+
+class HookRegistry:
+    """Imported hook modules, reloaded when their source file changes."""
+
+    def __init__(self):
+        self.modules = {}
+        self.mtimes = {}
+
+    def get(self, hook_name):
+        script_path = HOOKS_DIR / f"{hook_name}.py"
+        mtime = script_path.stat().st_mtime
+
+        if self.mtimes.get(hook_name) != mtime:
+            spec = importlib.util.spec_from_file_location(f"titanium_hook_{hook_name}", script_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self.modules[hook_name] = module
+            self.mtimes[hook_name] = mtime
+
+        return self.modules[hook_name]
+
+    def warm(self):
+        """Import every hook and the utilities and provider SDKs they lazily import."""
+        for hook_name in HOOK_NAMES:
+            try:
+                self.get(hook_name)
+            except Exception as e:
+                print(f"Failed to load {hook_name}: {e}", file=sys.stderr)
+
+        for module_name in WARM_MODULES:
+            try:
+                importlib.import_module(module_name)
+            except ImportError:
+                pass
+
+        # Build the shared LLM clients once; children inherit them with no
+        # connections open yet and reuse them for every request they make
+        llm_client = sys.modules.get("llm_client")
+        if llm_client is not None:
+            for provider in llm_client.available_providers():
+                try:
+                    llm_client.get_client(provider)
+                except Exception:
+                    pass
+
+
+def config_env(env):
+    """The settings in an environment that hook modules read at import."""
+    return {name: value for name, value in env.items() if name.startswith(CONFIG_PREFIXES)}
+
+
+def find_dotenv_path():
+    """The .env the hooks' load_dotenv() finds: nearest one walking up from hooks/."""
+    hooks_dir = HOOKS_DIR.resolve()
+    for directory in (hooks_dir, *hooks_dir.parents):
+        if (directory / ".env").is_file():
+            return directory / ".env"
+    return None
+
+
+def dotenv_mtime():
+    """Modification time of the hooks' .env (None without one)."""
+    path = find_dotenv_path()
+    try:
+        return path.stat().st_mtime if path else None
+    except OSError:
+        return None
+
+
+def read_request(conn):
+    """
+    Read one JSON request; the client closes its side when done.
+
+    Returns:
+        dict: The request, or None for an empty connection (status probe)
+    """
+    chunks = []
+    received = 0
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        received += len(chunk)
+        if received > MAX_REQUEST_BYTES:
+            raise ValueError("Request too large")
+        chunks.append(chunk)
+    if not chunks:
+        return None
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+
+def run_hook(module, request):
+    """Run a hook's main() inside a forked child and exit the child."""
+    exit_code = 0
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    try:
+        # Replace, not merge: variables the client unset must stay unset
+        os.environ.clear()
+        os.environ.update(request.get("env", {}))
+        # The hooks loaded .env at import, in the daemon; put it back
+        dotenv_path = find_dotenv_path()
+        if dotenv_path is not None and "dotenv" in sys.modules:
+            sys.modules["dotenv"].load_dotenv(dotenv_path)
+        os.chdir(request.get("cwd") or "/")
+        sys.argv = [module.__file__] + list(request.get("argv", []))
+        sys.stdin = io.StringIO(request.get("stdin", ""))
+        module.main()
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 0
+    except Exception as e:
+        print(f"Hook error ({request.get('hook')}): {e}", file=sys.stderr)
+        exit_code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    os._exit(exit_code)
+
+
+def reap_children():
+    """Collect finished hook children without blocking."""
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+
+
+def serve():
+    """Accept hook events until terminated."""
+    TITANIUM_HOME.mkdir(parents=True, exist_ok=True, mode=0o700)
+
+    # Snapshot before warming: dotenv loading adds to os.environ
+    startup_config = config_env(os.environ)
+    startup_dotenv_mtime = dotenv_mtime()
+    registry = HookRegistry()
+    registry.warm()
+
+    if SOCKET_PATH.exists():
+        SOCKET_PATH.unlink()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(SOCKET_PATH))
+    os.chmod(SOCKET_PATH, 0o600)
+    server.listen(64)
+    server.settimeout(5)
+
+    PID_PATH.write_text(str(os.getpid()))
+
+    def shutdown(signum, frame):
+        server.close()
+        for path in (SOCKET_PATH, PID_PATH):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    print(f"Hook daemon listening on {SOCKET_PATH} (pid {os.getpid()})", flush=True)
+
+    while True:
+        reap_children()
+        try:
+            conn, _ = server.accept()
+        except socket.timeout:
+            continue
+
+        with conn:
+            try:
+                conn.settimeout(5)
+                request = read_request(conn)
+                if request is None:
+                    continue
+                module = registry.get(request["hook"]) if request.get("hook") in HOOK_NAMES else None
+            except Exception as e:
+                print(f"Bad request: {e}", file=sys.stderr, flush=True)
+                continue
+
+            if module is None:
+                print(f"Unknown hook: {request.get('hook')}", file=sys.stderr, flush=True)
+                continue
+
+            env = request.get("env", {})
+            if config_env(env) != startup_config or dotenv_mtime() != startup_dotenv_mtime:
+                send_reply(conn, DECLINE)
+                conn.close()
+                restart(server, env)
+
+            if os.fork() == 0:
+                server.close()
+                conn.close()
+                run_hook(module, request)
+            send_reply(conn, ACK)
+
+
+def send_reply(conn, reply):
+    """Answer the client; it runs the hook itself if this never arrives."""
+    try:
+        conn.sendall(reply)
+    except OSError:
+        pass
+
+
+def restart(server, env):
+    """Re-exec the daemon with a client's environment (its settings changed)."""
+    print("Hook settings changed, restarting with the new environment", flush=True)
+    server.close()
+    SOCKET_PATH.unlink(missing_ok=True)
+    os.execve(sys.executable, [sys.executable, str(Path(__file__).resolve()), "serve"], env)
+
+
+def is_running():
+    """Check whether a daemon is accepting connections."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1)
+            sock.connect(str(SOCKET_PATH))
+        return True
+    except OSError:
+        return False
+
+
+def start():
+    """Start the daemon in the background."""
+    if is_running():
+        print(f"Hook daemon already running on {SOCKET_PATH}")
+        return
+
+    TITANIUM_HOME.mkdir(parents=True, exist_ok=True, mode=0o700)
+    with open(LOG_PATH, 'a') as log_file:
+        subprocess.Popen(
+            runtime_command(Path(__file__).resolve(), "serve"),
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=log_file,
+            start_new_session=True,
+        )
+
+    # Wait briefly for the socket so `start && <use hooks>` works
+    for _ in range(50):
+        if is_running():
+            print(f"✅ Hook daemon started on {SOCKET_PATH}")
+            return
+        time.sleep(0.1)
+
+    print(f"Error: Hook daemon did not start, see {LOG_PATH}", file=sys.stderr)
+    sys.exit(1)
+
+
+def stop():
+    """Stop a running daemon."""
+    if not PID_PATH.exists():
+        print("Hook daemon not running")
+        return
+
+    try:
+        os.kill(int(PID_PATH.read_text().strip()), signal.SIGTERM)
+        print("✅ Hook daemon stopped")
+    except (ValueError, ProcessLookupError):
+        PID_PATH.unlink(missing_ok=True)
+        print("Hook daemon not running (removed stale pid file)")
+
+
+def main():
+    """CLI interface for the hook daemon."""
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("Error: hook daemon requires unix domain sockets", file=sys.stderr)
+        sys.exit(1)
+
+    if len(sys.argv) < 2:
+        print("Usage: hook_daemon.py <start|stop|status|serve>", file=sys.stderr)
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == "start":
+        start()
+    elif command == "stop":
+        stop()
+    elif command == "status":
+        if is_running():
+            print(f"Hook daemon running on {SOCKET_PATH}")
+        else:
+            print("Hook daemon not running")
+            sys.exit(1)
+    elif command == "serve":
+        serve()
+    else:
+        print(f"Error: Unknown command: {command}", file=sys.stderr)
+        print("\nValid commands: start, stop, status, serve", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache
+
+Disk cache of LLM responses shared by every hook and by oai.py/anth.py.
+Responses are keyed by (model, normalized prompt, max_tokens, temperature), so
+a reply cut short by a small token limit is never served to a call allowing
+more. Normalizing collapses
+whitespace, so a prompt that differs only in spacing still hits. Recurring
+contexts ("Tool: Edit / File: src/app.py / Modified existing file") are then
+answered from disk with zero API calls.
+
+Entries expire after a TTL. Eviction is least-recently-used: a hit
+refreshes the file's mtime, and the oldest files are removed once the cache
+exceeds its size cap. Only deterministic-purpose calls opt in (cache=True in
+llm_client.generate); completion messages are meant to vary and skip it.
+
+Commands:
+    stats     Show cache usage
+    prune     Drop expired entries and evict down to the size cap
+    clear     Delete all cached responses
+
+Examples:
+    python3 llm_cache.py stats
+
+Environment:
+    TITANIUM_LLM_CACHE_MB            Cache size cap in megabytes (default: 5, 0 disables)
+    TITANIUM_LLM_CACHE_TTL_SECONDS   Entry lifetime (default: 604800, one week)
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Constants
+TITANIUM_HOME = Path(os.getenv("TITANIUM_HOME", Path.home() / ".titanium"))
+CACHE_DIR = TITANIUM_HOME / "llm-cache"
+MAX_BYTES = int(float(os.getenv("TITANIUM_LLM_CACHE_MB", "5")) * 1024 * 1024)
+TTL_SECONDS = float(os.getenv("TITANIUM_LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+
+def normalize_prompt(prompt):
+    """Prompt with runs of whitespace collapsed, so formatting noise still hits."""
+    return " ".join(prompt.split())
+
+
+def cache_path(model, prompt, max_tokens=None, temperature=None):
+    """Location of the cached response for (model, normalized prompt, max_tokens, temperature)."""
+    material = json.dumps([model, normalize_prompt(prompt), max_tokens, temperature])
+    return CACHE_DIR / f"{hashlib.sha256(material.encode('utf-8')).hexdigest()}.json"
+
+
+def get_cached(model, prompt, max_tokens=None, temperature=None):
+    """
+    Look up a cached response and mark it as recently used.
+
+    Returns:
+        dict: Stored entry (text, provider, model, created_at), or None on a
+        miss or an expired entry
+    """
+    if MAX_BYTES <= 0:
+        return None
+
+    path = cache_path(model, prompt, max_tokens, temperature)
+    try:
+        with open(path, 'r') as f:
+            entry = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if time.time() - entry.get("created_at", 0) > TTL_SECONDS:
+        path.unlink(missing_ok=True)
+        return None
+
+    try:
+        os.utime(path)  # Refresh LRU position
+    except FileNotFoundError:
+        pass
+    return entry
+
+
+def store(model, prompt, result, max_tokens=None, temperature=None):
+    """
+    Cache a response and evict old entries if over the size cap.
+
+    Args:
+        result: Result dict from llm_client.call_provider()
+
+    Returns:
+        Path: Cached entry file, or None if caching is disabled
+    """
+    if MAX_BYTES <= 0 or not result.get("text"):
+        return None
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = cache_path(model, prompt, max_tokens, temperature)
+    entry = {
+        "text": result["text"],
+        "provider": result.get("provider"),
+        "model": model,
+        "created_at": time.time(),
+    }
+
+    # Atomic write so a concurrent reader never sees a partial entry
+    temp_path = CACHE_DIR / f".{uuid.uuid4().hex}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(entry, f)
+    temp_path.replace(path)
+
+    evict(keep=path)
+    return path
+
+
+def list_entries():
+    """Cached responses as (path, size, mtime), oldest first."""
+    entries = []
+    if not CACHE_DIR.exists():
+        return entries
+    for path in CACHE_DIR.iterdir():
+        if path.name.startswith("."):
+            continue
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((path, stat.st_size, stat.st_mtime))
+    entries.sort(key=lambda entry: entry[2])
+    return entries
+
+
+def evict(max_bytes=None, keep=None):
+    """
+    Remove least-recently-used entries until the cache fits in max_bytes.
+
+    Returns:
+        int: Number of entries removed
+    """
+    max_bytes = MAX_BYTES if max_bytes is None else max_bytes
+    entries = list_entries()
+    total = sum(size for _, size, _ in entries)
+
+    removed = 0
+    for path, size, _ in entries:
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            path.unlink()
+            total -= size
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def prune():
+    """
+    Drop expired entries, then evict down to the size cap.
+
+    Entries untouched for longer than the TTL are expired without reading
+    them (a hit refreshes mtime, but never beyond created_at + TTL).
+
+    Returns:
+        int: Number of entries removed
+    """
+    cutoff = time.time() - TTL_SECONDS
+    removed = 0
+    for path, _, mtime in list_entries():
+        if mtime < cutoff:
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed + evict()
+
+
+def main():
+    """CLI interface for the LLM response cache."""
+
+    if len(sys.argv) < 2:
+        print("Usage: llm_cache.py <stats|prune|clear>", file=sys.stderr)
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == "stats":
+        entries = list_entries()
+        total = sum(size for _, size, _ in entries)
+        print(f"Cache: {CACHE_DIR}")
+        print(f"Entries: {len(entries)}")
+        print(f"Size: {total / 1024:.1f} KB / {MAX_BYTES / 1024 / 1024:.1f} MB cap")
+        print(f"TTL: {TTL_SECONDS / 3600:g} hours")
+
+    elif command == "prune":
+        print(f"Removed {prune()} cached responses")
+
+    elif command == "clear":
+        removed = 0
+        for path, _, _ in list_entries():
+            path.unlink(missing_ok=True)
+            removed += 1
+        print(f"Removed {removed} cached responses")
+
+    else:
+        print(f"Error: Unknown command: {command}", file=sys.stderr)
+        print("\nValid commands: stats, prune, clear", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,538 @@
+#!/usr/bin/env python3
+"""
+LLM Client
+
+One in-process access layer for the short LLM calls the hooks make (tool
+summaries, notifications, session summaries, completion messages). Each
+provider's SDK client is built once per process and reused, so the daemon,
+the announcement worker and repeated calls in one hook share a pooled HTTPS
+connection. Every call runs under one deadline: if the first provider fails
+or returns nothing, the next one gets whatever time is left.
+
+Calls with a fixed purpose (summaries, prompt_llm) pass cache=True and are
+answered from llm_cache's disk cache when the same prompt was seen recently.
+
+Latency-critical calls can be hedged (hedge=True): the second provider is
+also asked once the first has taken longer than its own p90 latency (or at
+once, in race mode), and the first valid answer wins. The losing request is
+abandoned on a daemon thread; its answer is discarded and nobody waits for
+it. Latency samples and hedge outcomes are kept in
+$TITANIUM_HOME/llm-stats.json (updated under llm-stats.lock).
+
+Providers (tried in order, skipped without an API key):
+    openai      OpenAI chat completions (OPENAI_API_KEY, OPENAI_BASE_URL)
+    anthropic   Anthropic messages (ANTHROPIC_API_KEY, ANTHROPIC_BASE_URL)
+
+SDKs are imported on first use, so importing this module is cheap.
+
+Usage:
+    from llm_client import complete
+
+    summary = complete(prompt, max_tokens=15)
+    summary = complete(prompt, max_tokens=100, models={"openai": "gpt-5-mini"})
+
+Commands:
+    complete <prompt>   Print a completion (testing)
+    providers           List configured providers in order
+    stats               Show provider latency and how often hedging won
+
+Environment:
+    TITANIUM_LLM_PROVIDERS         Provider order (default: openai,anthropic)
+    TITANIUM_LLM_TIMEOUT_SECONDS   Deadline per call, across fallbacks (default: 10)
+    TITANIUM_LLM_HEDGE             Hedged calls: delay (p90), race or off (default: delay)
+"""
+
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: stats updates are best effort
+    fcntl = None
+
+sys.path.insert(0, str(Path(__file__).parent))
+import llm_cache
+import usage_ledger
+
+# Constants
+PROVIDERS = ("openai", "anthropic")
+API_KEY_VARS = {"openai": "OPENAI_API_KEY", "anthropic": "ANTHROPIC_API_KEY"}
+DEFAULT_MODELS = {
+    "openai": "gpt-5-nano",                      # Fastest OpenAI model
+    "anthropic": "claude-3-5-haiku-20241022",    # Fastest Anthropic model
+}
+TIMEOUT_SECONDS = float(os.getenv("TITANIUM_LLM_TIMEOUT_SECONDS", "10"))
+MIN_ATTEMPT_SECONDS = 0.5  # Don't start a fallback with less time than this
+
+TITANIUM_HOME = Path(os.getenv("TITANIUM_HOME", Path.home() / ".titanium"))
+STATS_PATH = TITANIUM_HOME / "llm-stats.json"
+STATS_LOCK_PATH = TITANIUM_HOME / "llm-stats.lock"
+HEDGE_MODE = os.getenv("TITANIUM_LLM_HEDGE", "delay")
+HEDGE_MODES = ("delay", "race", "off")
+LATENCY_SAMPLES = 50           # Recent successful latencies kept per provider
+MIN_HEDGE_SAMPLES = 5          # Below this, hedge after the default delay
+DEFAULT_HEDGE_DELAY_MS = 1000
+MIN_HEDGE_DELAY_MS = 100
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+class LLMError(Exception):
+    """A provider call failed or returned no text."""
+
+
+def provider_order():
+    """Providers in preference order (TITANIUM_LLM_PROVIDERS overrides)."""
+    configured = os.getenv("TITANIUM_LLM_PROVIDERS")
+    if not configured:
+        return list(PROVIDERS)
+    return [name.strip() for name in configured.split(",") if name.strip() in PROVIDERS]
+
+
+def available_providers(providers=None):
+    """Providers to try, in order, that have an API key configured."""
+    return [name for name in (providers or provider_order()) if os.getenv(API_KEY_VARS[name])]
+
+
+def llm_available(providers=None):
+    """Whether any LLM provider is configured."""
+    return bool(available_providers(providers))
+
+
+def get_client(provider):
+    """
+    Shared SDK client for a provider (built once per process).
+
+    Clients retry nothing themselves: fallback to the next provider is
+    cheaper than a retry against a struggling one.
+    """
+    if provider in _clients:
+        return _clients[provider]
+
+    # Import outside the lock so a hedged call can load both SDKs at once
+    if provider == "openai":
+        from openai import OpenAI as client_class
+    else:
+        from anthropic import Anthropic as client_class
+
+    with _clients_lock:
+        if provider not in _clients:
+            _clients[provider] = client_class(api_key=os.getenv(API_KEY_VARS[provider]), max_retries=0)
+        return _clients[provider]
+
+
+def call_provider(provider, prompt, max_tokens, model, temperature=None, timeout=TIMEOUT_SECONDS):
+    """
+    Make one request to one provider.
+
+    Returns:
+        dict: text, provider, model, input_tokens, output_tokens, stop_reason
+        and latency_ms
+
+    Raises:
+        LLMError: If the request fails or returns no text
+    """
+    started_at = time.monotonic()
+
+    try:
+        client = get_client(provider)
+        if provider == "openai":
+            response = client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                max_completion_tokens=max_tokens,
+                timeout=timeout,
+                **({} if temperature is None else {"temperature": temperature}),
+            )
+            choice = response.choices[0]
+            text = choice.message.content or ""
+            usage = response.usage
+            input_tokens = usage.prompt_tokens if usage else None
+            output_tokens = usage.completion_tokens if usage else None
+            stop_reason = choice.finish_reason
+        else:
+            response = client.messages.create(
+                model=model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}],
+                timeout=timeout,
+                **({} if temperature is None else {"temperature": temperature}),
+            )
+            text = "".join(block.text for block in response.content if getattr(block, "type", None) == "text")
+            input_tokens = response.usage.input_tokens
+            output_tokens = response.usage.output_tokens
+            stop_reason = response.stop_reason
+    except ImportError:
+        raise LLMError(f"{provider} SDK not installed")
+    except Exception as e:
+        raise LLMError(f"{provider} request failed: {e}") from e
+
+    text = text.strip()
+    if not text:
+        raise LLMError(f"{provider} returned no text (stop reason: {stop_reason})")
+
+    return {
+        "text": text,
+        "provider": provider,
+        "model": model,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "stop_reason": stop_reason,
+        "latency_ms": (time.monotonic() - started_at) * 1000,
+    }
+
+
+def load_stats():
+    """Latency samples and hedge counters (written atomically, so safe to read unlocked)."""
+    try:
+        with open(STATS_PATH, 'r') as f:
+            stats = json.load(f)
+        return stats if isinstance(stats, dict) else {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+@contextmanager
+def locked_stats():
+    """Load, yield and atomically save the stats under the stats lock."""
+    TITANIUM_HOME.mkdir(parents=True, exist_ok=True)
+    with open(STATS_LOCK_PATH, 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        stats = load_stats()
+        yield stats
+
+        temp_path = STATS_PATH.with_name(f".{STATS_PATH.name}.{uuid.uuid4().hex[:8]}.tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(stats, f, indent=2)
+        temp_path.replace(STATS_PATH)
+
+
+def record_attempt(provider, latency_ms=None):
+    """Record one provider attempt: its latency, or a failure when None."""
+    try:
+        with locked_stats() as stats:
+            entry = stats.setdefault("providers", {}).setdefault(provider, {})
+            if latency_ms is None:
+                entry["failures"] = entry.get("failures", 0) + 1
+            else:
+                samples = entry.setdefault("latencies_ms", [])
+                samples.append(round(latency_ms, 1))
+                del samples[:-LATENCY_SAMPLES]
+    except OSError:
+        pass
+
+
+def record_hedge(winner, hedge_fired, hedge_won):
+    """Record the outcome of one hedged call."""
+    try:
+        with locked_stats() as stats:
+            hedge = stats.setdefault("hedge", {})
+            hedge["calls"] = hedge.get("calls", 0) + 1
+            hedge["fired"] = hedge.get("fired", 0) + int(hedge_fired)
+            hedge["won"] = hedge.get("won", 0) + int(hedge_won)
+            if winner:
+                wins = hedge.setdefault("wins_by_provider", {})
+                wins[winner] = wins.get(winner, 0) + 1
+            else:
+                hedge["failed"] = hedge.get("failed", 0) + 1
+    except OSError:
+        pass
+
+
+def latency_p90(stats, provider):
+    """p90 of a provider's recent latencies in ms, or None with too few samples."""
+    samples = sorted(stats.get("providers", {}).get(provider, {}).get("latencies_ms", []))
+    if len(samples) < MIN_HEDGE_SAMPLES:
+        return None
+    return samples[min(len(samples) - 1, int(len(samples) * 0.9))]
+
+
+def hedge_delay_ms(provider):
+    """How long to wait on a provider before hedging with the next one."""
+    if HEDGE_MODE == "race":
+        return 0
+    p90 = latency_p90(load_stats(), provider)
+    return max(MIN_HEDGE_DELAY_MS, p90 if p90 is not None else DEFAULT_HEDGE_DELAY_MS)
+
+
+def attempt(provider, prompt, max_tokens, model, temperature, deadline):
+    """
+    call_provider() within a deadline, recording the outcome (latency stats
+    and the usage ledger).
+
+    Returns:
+        dict: Result from call_provider(), or None if it failed
+    """
+    started_at = time.monotonic()
+    try:
+        result = call_provider(provider, prompt, max_tokens, model, temperature, deadline - started_at)
+    except LLMError as e:
+        print(f"LLM error: {e}", file=sys.stderr)
+        record_attempt(provider)
+        usage_ledger.record_call(model, None, None, (time.monotonic() - started_at) * 1000, "error",
+                                 provider=provider, error=str(e)[:200])
+        return None
+    record_attempt(provider, result["latency_ms"])
+    usage_ledger.record_call(model, result["input_tokens"], result["output_tokens"], result["latency_ms"],
+                             result["stop_reason"], provider=provider)
+    return result
+
+
+def generate_hedged(prompt, max_tokens, models, temperature, providers, deadline):
+    """
+    Race the first two providers; see the module docstring.
+
+    The second provider starts after the first's hedge delay, or as soon as
+    the first fails. Remaining providers are not tried.
+
+    Returns:
+        dict: The first valid result, or None if both failed or time ran out
+    """
+    primary, secondary = providers[:2]
+    results = queue.Queue()
+
+    def run(provider):
+        result = None
+        try:
+            result = attempt(provider, prompt, max_tokens, models[provider], temperature, deadline)
+        except Exception as e:
+            print(f"LLM error: {provider} attempt failed: {e}", file=sys.stderr)
+        finally:
+            results.put(result)  # Always report back, or the race waits out the deadline
+
+    def start(provider):
+        thread = threading.Thread(
+            target=run,
+            args=(provider,),
+            daemon=True,  # A losing request must not keep the hook alive
+        )
+        thread.start()
+
+    start(primary)
+    hedge_at = time.monotonic() + hedge_delay_ms(primary) / 1000
+    hedge_fired = False
+    pending = 1
+    winner = None
+
+    while pending and winner is None:
+        wait_until = deadline if hedge_fired else min(deadline, hedge_at)
+        try:
+            result = results.get(timeout=max(0, wait_until - time.monotonic()))
+        except queue.Empty:
+            if hedge_fired or deadline - time.monotonic() < MIN_ATTEMPT_SECONDS:
+                break  # Out of time
+            result = False  # Hedge delay passed
+
+        if result:
+            winner = result
+            continue
+        if result is None:
+            pending -= 1
+        if not hedge_fired and deadline - time.monotonic() >= MIN_ATTEMPT_SECONDS:
+            start(secondary)
+            hedge_fired = True
+            pending += 1
+
+    record_hedge(
+        winner["provider"] if winner else None,
+        hedge_fired,
+        bool(winner) and winner["provider"] == secondary,
+    )
+    return winner
+
+
+def generate(prompt, max_tokens=100, models=None, temperature=None, providers=None, timeout=None,
+             hedge=False, cache=False):
+    """
+    Complete a prompt with the first provider that answers, within one deadline.
+
+    Args:
+        prompt: User prompt
+        max_tokens: Output token limit
+        models: Per-provider model overrides, e.g. {"openai": "gpt-5-mini"}
+        temperature: Sampling temperature (None: model default)
+        providers: Provider names to try in order (default: provider_order())
+        timeout: Deadline in seconds for all attempts (default: TITANIUM_LLM_TIMEOUT_SECONDS)
+        hedge: Race the first two providers (unless TITANIUM_LLM_HEDGE=off)
+        cache: Answer from (and store into) the llm_cache response cache
+
+    Returns:
+        dict: Result from call_provider() ("cached": True for cache hits),
+        or None if every provider failed
+    """
+    models = {**DEFAULT_MODELS, **(models or {})}
+    deadline = time.monotonic() + (timeout or TIMEOUT_SECONDS)
+    providers = available_providers(providers)
+
+    if cache:
+        for provider in providers:
+            entry = llm_cache.get_cached(models[provider], prompt, max_tokens, temperature)
+            if entry:
+                usage_ledger.record_call(models[provider], 0, 0, 0.0, "cached", provider=provider, cached=True)
+                return {
+                    "text": entry["text"],
+                    "provider": provider,
+                    "model": models[provider],
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                    "stop_reason": "cached",
+                    "latency_ms": 0.0,
+                    "cached": True,
+                }
+
+    result = None
+    if hedge and HEDGE_MODE != "off" and len(providers) > 1:
+        result = generate_hedged(prompt, max_tokens, models, temperature, providers, deadline)
+    else:
+        for provider in providers:
+            if deadline - time.monotonic() < MIN_ATTEMPT_SECONDS:
+                break
+            result = attempt(provider, prompt, max_tokens, models[provider], temperature, deadline)
+            if result:
+                break
+
+    if cache and result:
+        try:
+            llm_cache.store(result["model"], prompt, result, max_tokens, temperature)
+        except OSError:
+            pass  # Caching is best effort
+    return result
+
+
+def complete(prompt, **kwargs):
+    """
+    Complete a prompt; see generate() for arguments.
+
+    Returns:
+        str: Response text (stripped), or None if no provider answered
+    """
+    result = generate(prompt, **kwargs)
+    return result["text"] if result else None
+
+
+def completion_message_prompt(count=1):
+    """Prompt for short "All done!"-style completion messages (one per line)."""
+    engineer_name = os.getenv("ENGINEER_NAME", "").strip()
+
+    if engineer_name:
+        name_instruction = f"Sometimes (about 30% of the time) include the engineer's name '{engineer_name}' in a natural way."
+        examples = f"""Examples of the style:
+- Standard: "Work complete!", "All done!", "Task finished!", "Ready for your next move!"
+- Personalized: "{engineer_name}, all set!", "Ready for you, {engineer_name}!", "Complete, {engineer_name}!", "{engineer_name}, we're done!" """
+    else:
+        name_instruction = ""
+        examples = """Examples of the style: "Work complete!", "All done!", "Task finished!", "Ready for your next move!" """
+
+    return f"""Generate a short, friendly completion message for when an AI coding assistant finishes a task.
+
+Requirements:
+- Keep it under 10 words
+- Make it positive and future focused
+- Use natural, conversational language
+- Focus on completion/readiness
+- Do NOT include quotes, formatting, or explanations
+- Return ONLY the completion message text
+{name_instruction}
+
+{examples}
+
+""" + ("Generate ONE completion message:" if count == 1 else
+       f"Generate {count} different completion messages, one per line:")
+
+
+def clean_message(text):
+    """Strip quotes and keep the first line of a short generated message."""
+    if not text:
+        return text
+    text = text.strip().strip('"').strip("'").strip()
+    return text.split("\n")[0].strip()
+
+
+def generate_completion_message(providers=None, timeout=None):
+    """
+    Generate a completion message with the first provider that answers.
+
+    Returns:
+        str: A natural language completion message, or None if error
+    """
+    return clean_message(complete(
+        completion_message_prompt(),
+        max_tokens=100,
+        models={"openai": "gpt-4o-mini"},
+        temperature=0.7,
+        providers=providers,
+        timeout=timeout,
+        hedge=True,
+    ))
+
+
+def main():
+    """CLI interface for testing."""
+
+    if len(sys.argv) < 2:
+        print("Usage: llm_client.py <complete <prompt>|providers|stats>", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass  # dotenv is optional
+
+    command = sys.argv[1]
+
+    if command == "providers":
+        configured = available_providers()
+        for name in provider_order():
+            status = "configured" if name in configured else f"no {API_KEY_VARS[name]}"
+            print(f"{name:<10} {DEFAULT_MODELS[name]:<28} {status}")
+
+    elif command == "complete":
+        if len(sys.argv) < 3:
+            print("Error: complete requires a prompt", file=sys.stderr)
+            sys.exit(1)
+        result = generate(" ".join(sys.argv[2:]))
+        if result is None:
+            print("Error: No LLM provider answered", file=sys.stderr)
+            sys.exit(1)
+        print(result["text"])
+        print(f"({result['provider']} {result['model']}, {result['latency_ms']:.0f} ms)", file=sys.stderr)
+
+    elif command == "stats":
+        stats = load_stats()
+        print(f"{'Provider':<10} {'Calls':>6} {'Failed':>6} {'p50 ms':>8} {'p90 ms':>8}")
+        for name, entry in stats.get("providers", {}).items():
+            samples = sorted(entry.get("latencies_ms", []))
+            p50 = f"{samples[len(samples) // 2]:.0f}" if samples else "-"
+            p90 = latency_p90(stats, name)
+            print(f"{name:<10} {len(samples):>6} {entry.get('failures', 0):>6} {p50:>8} "
+                  f"{'-' if p90 is None else f'{p90:.0f}':>8}")
+
+        hedge = stats.get("hedge", {})
+        calls = hedge.get("calls", 0)
+        print(f"\nHedged calls: {calls} (mode: {HEDGE_MODE})")
+        if calls:
+            print(f"  Hedge fired: {hedge.get('fired', 0)} ({hedge.get('fired', 0) / calls:.0%})")
+            print(f"  Hedge won:   {hedge.get('won', 0)} ({hedge.get('won', 0) / calls:.0%})")
+            print(f"  No answer:   {hedge.get('failed', 0)}")
+            for name, wins in hedge.get("wins_by_provider", {}).items():
+                print(f"  {name} answered first: {wins}")
+
+    else:
+        print(f"Error: Unknown command: {command}", file=sys.stderr)
+        print("\nValid commands: complete, providers, stats", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.8"
+# dependencies = [
+#     "anthropic",
+#     "openai",
+#     "python-dotenv",
+# ]
+# ///
+"""
+Completion Message Pool
+
+Pregenerated "All done!"-style completion messages, so the Stop hook never
+waits on an LLM for flavor text. take_message() pops the next message from
+a small pool on disk; when the pool runs low it starts a detached refill
+process that generates a whole batch with one LLM call. Messages are
+personalized with ENGINEER_NAME; changing the name discards the pool.
+
+Pool file: $TITANIUM_HOME/completion-messages.json (updated under
+completion-messages.lock; one refill at a time via completion-messages.refill.lock)
+
+Commands:
+    take      Print (and consume) the next message
+    refill    Top the pool up now (what the background refill runs)
+    status    Show pooled messages
+    clear     Empty the pool
+
+Examples:
+    python3 message_pool.py refill
+    python3 message_pool.py status
+
+Environment:
+    TITANIUM_MESSAGE_POOL_SIZE   Messages kept in the pool (default: 12)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: pool updates are best effort
+    fcntl = None
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "runtime"))
+from llm_client import clean_message, complete, completion_message_prompt, llm_available
+from plugin_runtime import runtime_command
+
+# Constants
+TITANIUM_HOME = Path(os.getenv("TITANIUM_HOME", Path.home() / ".titanium"))
+POOL_PATH = TITANIUM_HOME / "completion-messages.json"
+LOCK_PATH = TITANIUM_HOME / "completion-messages.lock"
+REFILL_LOCK_PATH = TITANIUM_HOME / "completion-messages.refill.lock"
+REFILL_LOG_PATH = TITANIUM_HOME / "completion-messages.log"
+
+POOL_SIZE = int(os.getenv("TITANIUM_MESSAGE_POOL_SIZE", "12"))
+LOW_WATER = max(1, POOL_SIZE // 3)  # Refill when this few are left
+MAX_MESSAGE_WORDS = 12
+
+
+def engineer_name():
+    """Name the pooled messages are personalized for."""
+    return os.getenv("ENGINEER_NAME", "").strip()
+
+
+def load_pool():
+    """Current pool (written atomically, so safe to read unlocked)."""
+    try:
+        with open(POOL_PATH, 'r') as f:
+            pool = json.load(f)
+        if isinstance(pool, dict) and isinstance(pool.get("messages"), list):
+            return pool
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return {"engineer_name": engineer_name(), "messages": []}
+
+
+@contextmanager
+def locked_pool():
+    """
+    Load, yield and atomically save the pool under the pool lock.
+
+    A pool generated for another ENGINEER_NAME is yielded empty.
+    """
+    TITANIUM_HOME.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_PATH, 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        pool = load_pool()
+        if pool.get("engineer_name", "") != engineer_name():
+            pool = {"engineer_name": engineer_name(), "messages": []}
+        yield pool
+
+        temp_path = POOL_PATH.with_name(f".{POOL_PATH.name}.{uuid.uuid4().hex[:8]}.tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(pool, f, indent=2)
+        temp_path.replace(POOL_PATH)
+
+
+def take_message(refill=True):
+    """
+    Pop the next pregenerated completion message.
+
+    Never calls an LLM: when the pool is low, a detached refill is started
+    for the next Stop.
+
+    Args:
+        refill: Start a background refill if the pool is running low
+
+    Returns:
+        str: A completion message, or None if the pool is empty
+    """
+    try:
+        with locked_pool() as pool:
+            message = pool["messages"].pop(0) if pool["messages"] else None
+            remaining = len(pool["messages"])
+    except OSError:
+        return None
+
+    if refill and remaining <= LOW_WATER:
+        start_refill()
+    return message
+
+
+def start_refill():
+    """Refill the pool in a detached process, if an LLM is configured."""
+    if not llm_available():
+        return
+    try:
+        TITANIUM_HOME.mkdir(parents=True, exist_ok=True)
+        with open(REFILL_LOG_PATH, 'a') as log_file:
+            # Detach fully: the hook's stdout is a pipe Claude Code waits on
+            subprocess.Popen(
+                runtime_command(Path(__file__).resolve(), "refill"),
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=log_file,
+                start_new_session=True,
+            )
+    except OSError:
+        pass
+
+
+def parse_messages(text):
+    """Split a batch response into clean, short, unique messages."""
+    messages = []
+    for line in (text or "").splitlines():
+        line = line.strip().lstrip("-*•0123456789.) ").strip()
+        message = clean_message(line)
+        if message and len(message.split()) <= MAX_MESSAGE_WORDS and message not in messages:
+            messages.append(message)
+    return messages
+
+
+def refill():
+    """
+    Generate a batch of messages and top the pool up to POOL_SIZE.
+
+    Returns:
+        int: Messages added (0 if another refill is running or the LLM failed)
+    """
+    TITANIUM_HOME.mkdir(parents=True, exist_ok=True)
+    with open(REFILL_LOCK_PATH, 'a') as lock_file:
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return 0  # Another refill is already generating
+
+        needed = POOL_SIZE - len(load_pool()["messages"])
+        if needed <= 0:
+            return 0
+
+        response = complete(
+            completion_message_prompt(count=needed),
+            max_tokens=30 * needed,
+            models={"openai": "gpt-4o-mini"},
+            temperature=0.9,
+        )
+        generated = parse_messages(response)
+
+        with locked_pool() as pool:
+            new = [message for message in generated if message not in pool["messages"]]
+            new = new[:max(0, POOL_SIZE - len(pool["messages"]))]
+            pool["messages"].extend(new)
+            pool["updated_at"] = time.time()
+        return len(new)
+
+
+def main():
+    """CLI interface for the completion message pool."""
+
+    if len(sys.argv) < 2:
+        print("Usage: message_pool.py <take|refill|status|clear>", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass  # dotenv is optional
+
+    command = sys.argv[1]
+
+    if command == "take":
+        message = take_message(refill=False)
+        if message is None:
+            print("Error: Message pool is empty (run: message_pool.py refill)", file=sys.stderr)
+            sys.exit(1)
+        print(message)
+
+    elif command == "refill":
+        if not llm_available():
+            print("Error: No LLM provider configured (OPENAI_API_KEY or ANTHROPIC_API_KEY)", file=sys.stderr)
+            sys.exit(1)
+        added = refill()
+        print(f"Added {added} messages ({len(load_pool()['messages'])} pooled)")
+
+    elif command == "status":
+        pool = load_pool()
+        name = pool.get("engineer_name") or "(no ENGINEER_NAME)"
+        print(f"{len(pool['messages'])}/{POOL_SIZE} messages for {name}, refill at {LOW_WATER}")
+        if pool.get("engineer_name", "") != engineer_name():
+            print("Stale: ENGINEER_NAME changed; the pool is discarded on next use")
+        for message in pool["messages"]:
+            print(f"  {message}")
+
+    elif command == "clear":
+        with locked_pool() as pool:
+            pool["messages"] = []
+        print("Message pool cleared")
+
+    else:
+        print(f"Error: Unknown command: {command}", file=sys.stderr)
+        print("\nValid commands: take, refill, status, clear", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,13 @@
 # ]
 # ///
 
-import os
 import sys
+from pathlib import Path
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).parent))
+import llm_client
+
 
 def prompt_llm(prompt_text):
     """
@@ -24,26 +27,14 @@ def prompt_llm(prompt_text):
     """
     load_dotenv()
 
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        return None
-
-    try:
-        from openai import OpenAI
-
-        client = OpenAI(api_key=api_key)
-
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",  # Fast OpenAI model
-            messages=[{"role": "user", "content": prompt_text}],
-            max_tokens=100,
-            temperature=0.7,
-        )
-
-        return response.choices[0].message.content.strip()
-
-    except Exception:
-        return None
+    return llm_client.complete(
+        prompt_text,
+        max_tokens=100,
+        models={"openai": "gpt-4o-mini"},  # Fast OpenAI model
+        temperature=0.7,
+        providers=["openai"],
+        cache=True,
+    )
 
 
 def generate_completion_message():
@@ -53,41 +44,9 @@ def generate_completion_message():
     Returns:
         str: A natural language completion message, or None if error
     """
-    engineer_name = os.getenv("ENGINEER_NAME", "").strip()
-
-    if engineer_name:
-        name_instruction = f"Sometimes (about 30% of the time) include the engineer's name '{engineer_name}' in a natural way."
-        examples = f"""Examples of the style: 
-- Standard: "Work complete!", "All done!", "Task finished!", "Ready for your next move!"
-- Personalized: "{engineer_name}, all set!", "Ready for you, {engineer_name}!", "Complete, {engineer_name}!", "{engineer_name}, we're done!" """
-    else:
-        name_instruction = ""
-        examples = """Examples of the style: "Work complete!", "All done!", "Task finished!", "Ready for your next move!" """
-
-    prompt = f"""Generate a short, friendly completion message for when an AI coding assistant finishes a task. 
-
-Requirements:
-- Keep it under 10 words
-- Make it positive and future focused
-- Use natural, conversational language
-- Focus on completion/readiness
-- Do NOT include quotes, formatting, or explanations
-- Return ONLY the completion message text
-{name_instruction}
-
-{examples}
-
-Generate ONE completion message:"""
-
-    response = prompt_llm(prompt)
-
-    # Clean up response - remove quotes and extra formatting
-    if response:
-        response = response.strip().strip('"').strip("'").strip()
-        # Take first line if multiple lines
-        response = response.split("\\n")[0].strip()
+    load_dotenv()
 
-    return response
+    return llm_client.generate_completion_message(providers=["openai"])
 
 
 def main():
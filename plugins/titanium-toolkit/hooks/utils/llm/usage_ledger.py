@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+LLM Usage Ledger
+
+Local record of every LLM call the plugin makes: model, input and output
+tokens, latency, stop reason and who made it. Calls from the hooks
+(through llm_client) are attributed to the hook; calls from the command
+utilities (bmad_generator, plan_parser) to their command. One JSON line per
+call is appended to $TITANIUM_HOME/usage/llm_calls.jsonl with the shared log
+store (rotated monthly, a year of segments kept).
+
+Cost is estimated from per-million-token prices for known models
+(PRICES_PER_MTOK, prefix match); TITANIUM_LLM_PRICES overrides or extends it
+with JSON such as {"claude-sonnet-4-5": [3.0, 15.0]} (input, output USD).
+
+Commands:
+    report [--since 30d]   Spend and throughput by command, by hook and by model
+
+Examples:
+    python3 usage_ledger.py report
+    python3 usage_ledger.py report --since 24h
+
+Environment:
+    TITANIUM_LLM_LEDGER=0   Stop recording (default: on)
+    TITANIUM_LLM_PRICES     Price overrides (JSON)
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "metrics"))
+from hook_metrics import parse_window, percentile
+
+# Constants
+TITANIUM_HOME = Path(os.getenv("TITANIUM_HOME", Path.home() / ".titanium"))
+LEDGER_DIR = TITANIUM_HOME / "usage"
+LOG_NAME = "llm_calls"
+SEGMENT_MAX_AGE_SECONDS = 30 * 86400
+SEGMENT_BACKUPS = 12
+
+# USD per million tokens (input, output); the longest matching prefix wins
+PRICES_PER_MTOK = {
+    "claude-sonnet-4": (3.00, 15.00),
+    "claude-haiku-4": (1.00, 5.00),
+    "claude-3-5-haiku": (0.80, 4.00),
+    "claude-opus-4": (15.00, 75.00),
+    "gpt-5-nano": (0.05, 0.40),
+    "gpt-5-mini": (0.25, 2.00),
+    "gpt-5": (1.25, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+}
+
+_source = None
+
+
+def ledger_enabled():
+    """Calls are recorded unless TITANIUM_LLM_LEDGER=0."""
+    return os.getenv("TITANIUM_LLM_LEDGER", "1") != "0"
+
+
+def set_source(name):
+    """Attribute this process's subsequent LLM calls to a hook or tool."""
+    global _source
+    _source = name
+
+
+def current_source():
+    """Source set with set_source(), or the running script's name."""
+    return _source or Path(sys.argv[0]).stem or "unknown"
+
+
+def prices():
+    """Price table with TITANIUM_LLM_PRICES overrides applied."""
+    table = dict(PRICES_PER_MTOK)
+    try:
+        table.update({model: tuple(price) for model, price in json.loads(os.getenv("TITANIUM_LLM_PRICES", "{}")).items()})
+    except (json.JSONDecodeError, TypeError, AttributeError):
+        pass
+    return table
+
+
+def estimate_cost(model, input_tokens, output_tokens, table=None):
+    """
+    Estimated USD cost of one call.
+
+    Returns:
+        float: Cost, or None for a model without a known price
+    """
+    table = prices() if table is None else table
+    matches = [prefix for prefix in table if (model or "").startswith(prefix)]
+    if not matches:
+        return None
+    input_price, output_price = table[max(matches, key=len)]
+    return ((input_tokens or 0) * input_price + (output_tokens or 0) * output_price) / 1_000_000
+
+
+def record_call(model, input_tokens, output_tokens, latency_ms, stop_reason, provider=None,
+                source=None, command=None, **fields):
+    """
+    Append one LLM call to the ledger (never raises).
+
+    Args:
+        model: Model that answered
+        input_tokens: Prompt tokens billed (None if unknown)
+        output_tokens: Completion tokens billed (None if unknown)
+        latency_ms: Wall time of the request
+        stop_reason: Provider's stop/finish reason ("error" for failed calls)
+        provider: "anthropic" or "openai"
+        source: Hook or tool making the call (default: current_source())
+        command: Command for tool calls (brief, prd, architecture, epic, plan)
+        **fields: Extra fields (e.g. cached=True, part=2)
+    """
+    if not ledger_enabled():
+        return
+    try:
+        # Imported only when recording, keeping hook startup lean
+        sys.path.insert(0, str(Path(__file__).parent.parent / "logs"))
+        from log_store import append_log
+
+        append_log(LEDGER_DIR, LOG_NAME, {
+            "ts": time.time(),
+            "source": source or current_source(),
+            "command": command,
+            "provider": provider,
+            "model": model,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "latency_ms": round(latency_ms, 1) if latency_ms is not None else None,
+            "stop_reason": stop_reason,
+            **fields,
+        }, max_age_seconds=SEGMENT_MAX_AGE_SECONDS, backups=SEGMENT_BACKUPS)
+    except OSError:
+        pass  # Accounting must never break a hook or command
+
+
+def record_response(response, started_at, source, command=None, **fields):
+    """
+    Record an Anthropic Messages API response.
+
+    Args:
+        response: Message returned by client.messages.create() (or a stream's final message)
+        started_at: time.monotonic() when the request was sent
+        source: Tool making the call (e.g. "bmad_generator")
+        command: Command being run (e.g. "prd")
+    """
+    usage = getattr(response, "usage", None)
+    record_call(
+        getattr(response, "model", None),
+        getattr(usage, "input_tokens", None),
+        getattr(usage, "output_tokens", None),
+        (time.monotonic() - started_at) * 1000,
+        getattr(response, "stop_reason", None),
+        provider="anthropic",
+        source=source,
+        command=command,
+        **fields,
+    )
+
+
+def iter_records(since=None):
+    """Yield ledger records from the current and rotated segments."""
+    import gzip
+
+    paths = sorted(LEDGER_DIR.glob(f"{LOG_NAME}.*.jsonl*")) + [LEDGER_DIR / f"{LOG_NAME}.jsonl"]
+    for path in paths:
+        if not path.exists():
+            continue
+        if since is not None and path.stat().st_mtime < since:
+            continue  # Segment closed before the window started
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, 'rt') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if since is None or record.get("ts", 0) >= since:
+                    yield record
+
+
+def print_table(title, groups, table):
+    """Print one aggregated table, most expensive group first."""
+    print(f"\n{title}")
+    print(f"{'':<28} {'calls':>6} {'cached':>6} {'in tok':>10} {'out tok':>10} {'cost $':>9} "
+          f"{'p50 s':>7} {'tok/s':>7} {'truncated':>9}")
+
+    rows = []
+    for name, records in groups.items():
+        billed = [r for r in records if not r.get("cached") and r.get("stop_reason") != "error"]
+        input_tokens = sum(r.get("input_tokens") or 0 for r in billed)
+        output_tokens = sum(r.get("output_tokens") or 0 for r in billed)
+        costs = [estimate_cost(r.get("model"), r.get("input_tokens"), r.get("output_tokens"), table) for r in billed]
+        latencies = [r["latency_ms"] for r in billed if r.get("latency_ms")]
+        rows.append((
+            name, len(records), sum(bool(r.get("cached")) for r in records),
+            input_tokens, output_tokens,
+            sum(cost for cost in costs if cost is not None), None in costs,
+            percentile(latencies, 50) / 1000 if latencies else None,
+            output_tokens / (sum(latencies) / 1000) if latencies else None,
+            sum(r.get("stop_reason") in ("max_tokens", "length") for r in billed),
+        ))
+
+    for name, calls, cached, input_tokens, output_tokens, cost, unpriced, p50, rate, truncated in \
+            sorted(rows, key=lambda row: -row[5]):
+        cost_text = f"{cost:.4f}{'+' if unpriced else ''}"
+        print(f"{name[:28]:<28} {calls:>6} {cached:>6} {input_tokens:>10,} {output_tokens:>10,} {cost_text:>9} "
+              f"{'-' if p50 is None else f'{p50:.1f}':>7} {'-' if rate is None else f'{rate:.0f}':>7} {truncated:>9}")
+
+
+def report(window_seconds):
+    """Print spend and throughput by command, by hook and by model."""
+    by_command, by_hook, by_model = {}, {}, {}
+    for record in iter_records(time.time() - window_seconds):
+        if record.get("command"):
+            by_command.setdefault(record["command"], []).append(record)
+        else:
+            by_hook.setdefault(record.get("source", "?"), []).append(record)
+        by_model.setdefault(record.get("model") or "?", []).append(record)
+
+    if not by_model:
+        print("No LLM calls recorded in this window.")
+        return
+
+    table = prices()
+    if by_command:
+        print_table("By command", by_command, table)
+    if by_hook:
+        print_table("By hook / tool", by_hook, table)
+    print_table("By model", by_model, table)
+    print("\ncost: estimated USD (+: includes calls to models without a known price); "
+          "tok/s: output tokens per second of request time; truncated: stopped at max_tokens")
+
+
+def main():
+    """CLI interface for the usage ledger."""
+
+    if len(sys.argv) < 2 or sys.argv[1] != "report":
+        print("Usage: usage_ledger.py report [--since 30d]", file=sys.stderr)
+        sys.exit(1)
+
+    args = sys.argv[2:]
+    window = "30d"
+    while args:
+        if args[0] == "--since" and len(args) > 1:
+            window = args[1]
+        else:
+            print(f"Error: Unknown argument: {args[0]}", file=sys.stderr)
+            sys.exit(1)
+        args = args[2:]
+
+    try:
+        window_seconds = parse_window(window)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    report(window_seconds)
+
+
+if __name__ == "__main__":
+    main()
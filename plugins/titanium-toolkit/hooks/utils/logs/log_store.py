@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Append-Only Hook Log Store
+
+Shared JSONL log writer for all hooks. Each record is one line appended with
+O_APPEND, so logging costs O(1) regardless of log size. Segments rotate when
+they exceed a size or age limit, rotated segments are optionally gzipped, and
+only the newest few are kept.
+
+Writes and rotation happen under an advisory lock (<name>.jsonl.lock), so
+parallel subagents firing hooks at the same time cannot clobber each other.
+
+Layout (inside the log directory):
+    <name>.jsonl                  Current segment
+    <name>.<timestamp>.jsonl.gz   Rotated segments (newest N kept)
+    <name>.jsonl.lock             Lock file; holds the segment start time
+
+Usage:
+    python3 log_store.py tail <log_dir> <name> [count]
+
+Environment:
+    TITANIUM_LOG_MAX_MB         Rotate when a segment exceeds this size (default: 5)
+    TITANIUM_LOG_MAX_AGE_DAYS   Rotate when a segment is older than this (default: 7)
+    TITANIUM_LOG_BACKUPS        Rotated segments to keep (default: 5)
+    TITANIUM_LOG_COMPRESS       Gzip rotated segments (default: 1)
+"""
+
+import gzip
+import json
+import os
+import shutil
+import sys
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends stay atomic, rotation is best effort
+    fcntl = None
+
+# Constants
+DEFAULT_MAX_BYTES = int(float(os.getenv("TITANIUM_LOG_MAX_MB", "5")) * 1024 * 1024)
+DEFAULT_MAX_AGE_SECONDS = float(os.getenv("TITANIUM_LOG_MAX_AGE_DAYS", "7")) * 86400
+DEFAULT_BACKUPS = int(os.getenv("TITANIUM_LOG_BACKUPS", "5"))
+DEFAULT_COMPRESS = os.getenv("TITANIUM_LOG_COMPRESS", "1") != "0"
+
+
+def read_segment_start(lock_file):
+    """Segment start time stored in the lock file, or None if not recorded yet."""
+    lock_file.seek(0)
+    try:
+        return float(lock_file.read().strip())
+    except ValueError:
+        return None
+
+
+def write_segment_start(lock_file, started_at):
+    """Record when the current segment was started."""
+    lock_file.seek(0)
+    lock_file.truncate()
+    lock_file.write(str(started_at))
+    lock_file.flush()
+
+
+def rotate(log_path, compress, backups):
+    """Move the current segment aside and prune old segments."""
+    stamp = datetime.now().strftime("%Y%m%dT%H%M%S.%f")
+    stem = log_path.name[:-len(".jsonl")]
+    rotated_path = log_path.with_name(f"{stem}.{stamp}.jsonl")
+
+    log_path.replace(rotated_path)
+
+    if compress:
+        with open(rotated_path, 'rb') as src, gzip.open(f"{rotated_path}.gz", 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        rotated_path.unlink()
+
+    segments = sorted(log_path.parent.glob(f"{stem}.????????T??????.??????.jsonl*"))
+    for old_segment in segments[:-backups] if backups > 0 else segments:
+        try:
+            old_segment.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def append_log(log_dir, name, record, max_bytes=None, max_age_seconds=None, backups=None, compress=None):
+    """
+    Append one record to <log_dir>/<name>.jsonl, rotating the segment first if
+    it is too large or too old.
+
+    Args:
+        log_dir: Directory holding the log (created if missing)
+        name: Log name without extension (e.g. "stop")
+        record: JSON-serializable record
+        max_bytes: Rotate when the segment exceeds this size
+        max_age_seconds: Rotate when the segment is older than this
+        backups: Number of rotated segments to keep
+        compress: Gzip rotated segments
+
+    Returns:
+        Path to the current segment
+    """
+    max_bytes = DEFAULT_MAX_BYTES if max_bytes is None else max_bytes
+    max_age_seconds = DEFAULT_MAX_AGE_SECONDS if max_age_seconds is None else max_age_seconds
+    backups = DEFAULT_BACKUPS if backups is None else backups
+    compress = DEFAULT_COMPRESS if compress is None else compress
+
+    log_dir = Path(log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    log_path = log_dir / f"{name}.jsonl"
+    line = (json.dumps(record, default=str) + "\n").encode("utf-8")
+
+    with open(log_dir / f"{name}.jsonl.lock", 'a+') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        now = time.time()
+        started_at = read_segment_start(lock_file)
+
+        try:
+            size = log_path.stat().st_size
+        except FileNotFoundError:
+            size = None
+
+        if size is None or started_at is None:
+            write_segment_start(lock_file, now)
+        elif size + len(line) > max_bytes or now - started_at > max_age_seconds:
+            rotate(log_path, compress, backups)
+            write_segment_start(lock_file, now)
+
+        fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+    return log_path
+
+
+def tail_log(log_dir, name, count=10):
+    """Return the last count records of the current segment."""
+    log_path = Path(log_dir) / f"{name}.jsonl"
+    if not log_path.exists():
+        return []
+
+    records = []
+    with open(log_path, 'r') as f:
+        for line in deque(f, maxlen=count):
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                pass
+    return records
+
+
+def main():
+    """CLI interface for reading hook logs."""
+
+    if len(sys.argv) < 4 or sys.argv[1] != "tail":
+        print("Usage: log_store.py tail <log_dir> <name> [count]", file=sys.stderr)
+        sys.exit(1)
+
+    count = int(sys.argv[4]) if len(sys.argv) > 4 else 10
+    for record in tail_log(sys.argv[2], sys.argv[3], count):
+        print(json.dumps(record))
+
+
+if __name__ == "__main__":
+    main()
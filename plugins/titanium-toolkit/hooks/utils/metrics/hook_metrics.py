@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Hook Latency Metrics
+
+Opt-in per-phase timing for the voice hooks and the announcement worker.
+Each hook invocation appends one record with its total time and the time
+spent in each phase (dotenv, imports, AI summary, TTS, logging, ...) to
+$TITANIUM_HOME/metrics/hook_spans.jsonl, using the shared append-only log
+store (rotated and compressed like the hook logs).
+
+Startup phases recorded at import time (dotenv, imports) are attached to the
+first invocation in the process that paid them only, so daemon-served hooks
+(forked after the daemon's warm-up imports) show what they actually paid. Interpreter startup itself is not included; see
+startup_budget.py.
+
+Commands:
+    report [--since 24h] [--hook NAME]   p50/p95/p99 per hook and phase
+
+Examples:
+    TITANIUM_HOOK_METRICS=1 claude      # collect
+    python3 hook_metrics.py report
+    python3 hook_metrics.py report --since 30m --hook stop
+
+Environment:
+    TITANIUM_HOOK_METRICS=1   Record spans (default: off)
+"""
+
+import json
+import math
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Constants
+TITANIUM_HOME = Path(os.getenv("TITANIUM_HOME", Path.home() / ".titanium"))
+METRICS_DIR = TITANIUM_HOME / "metrics"
+LOG_NAME = "hook_spans"
+WINDOW_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# Startup phases measured before the first HookTimer exists, and the process
+# that measured them (a forked child inherits the dict but didn't pay for it)
+_startup_spans = {}
+_startup_pid = os.getpid()
+
+
+def metrics_enabled():
+    """Spans are only written with TITANIUM_HOOK_METRICS=1."""
+    return os.getenv("TITANIUM_HOOK_METRICS", "0") == "1"
+
+
+@contextmanager
+def startup_phase(name):
+    """Time a module-level startup phase (attached to the next HookTimer)."""
+    global _startup_pid
+    if _startup_pid != os.getpid():
+        _startup_spans.clear()
+        _startup_pid = os.getpid()
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        _startup_spans[name] = _startup_spans.get(name, 0) + (time.perf_counter() - started_at) * 1000
+
+
+class HookTimer:
+    """Collects phase durations for one hook invocation and writes them once."""
+
+    def __init__(self, hook):
+        self.hook = hook
+        self.started_at = time.perf_counter()
+        spans = _startup_spans if _startup_pid == os.getpid() else {}
+        self.phases = dict(spans)
+        self.startup_ms = sum(spans.values())
+        _startup_spans.clear()
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block as the named phase (repeated phases accumulate)."""
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - started_at) * 1000)
+
+    def add(self, name, ms):
+        """Record a phase measured elsewhere (e.g. synthesis inside a provider)."""
+        if ms is not None:
+            self.phases[name] = self.phases.get(name, 0) + ms
+
+    def flush(self, **fields):
+        """Append this invocation's record, if metrics are enabled."""
+        if not metrics_enabled():
+            return
+        total_ms = (time.perf_counter() - self.started_at) * 1000 + self.startup_ms
+        try:
+            # Imported only when recording, keeping hook startup lean
+            sys.path.insert(0, str(Path(__file__).parent.parent / "logs"))
+            from log_store import append_log
+
+            append_log(METRICS_DIR, LOG_NAME, {
+                "ts": time.time(),
+                "hook": self.hook,
+                "pid": os.getpid(),
+                "total_ms": round(total_ms, 2),
+                "phases": {name: round(ms, 2) for name, ms in self.phases.items()},
+                **fields,
+            })
+        except OSError:
+            pass  # Metrics must never break a hook
+
+
+def iter_records(since=None):
+    """Yield metric records from the current and rotated segments."""
+    import gzip
+
+    paths = sorted(METRICS_DIR.glob(f"{LOG_NAME}.*.jsonl*")) + [METRICS_DIR / f"{LOG_NAME}.jsonl"]
+    for path in paths:
+        if not path.exists():
+            continue
+        if since is not None and path.stat().st_mtime < since:
+            continue  # Segment closed before the window started
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, 'rt') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if since is None or record.get("ts", 0) >= since:
+                    yield record
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def parse_window(text):
+    """Parse a window such as 30m, 24h or 7d into seconds."""
+    try:
+        return float(text[:-1]) * WINDOW_UNITS[text[-1]]
+    except (KeyError, ValueError, IndexError):
+        raise ValueError(f"Invalid window: {text} (use e.g. 30m, 24h, 7d)")
+
+
+def report(window_seconds, hook=None):
+    """Print p50/p95/p99 per hook and phase for the last window_seconds."""
+    samples = {}
+    for record in iter_records(time.time() - window_seconds):
+        if hook and record.get("hook") != hook:
+            continue
+        name = record.get("hook", "?")
+        samples.setdefault((name, "total"), []).append(record.get("total_ms", 0))
+        for phase, ms in record.get("phases", {}).items():
+            samples.setdefault((name, phase), []).append(ms)
+
+    if not samples:
+        print("No hook metrics recorded in this window (set TITANIUM_HOOK_METRICS=1 to collect).")
+        return
+
+    print(f"{'hook':<24} {'phase':<20} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    # Slowest hooks first; within a hook, total then phases by p95
+    hooks = sorted({name for name, _ in samples}, key=lambda name: -percentile(samples[(name, "total")], 95))
+    for name in hooks:
+        phases = sorted(
+            (phase for hook_name, phase in samples if hook_name == name and phase != "total"),
+            key=lambda phase: -percentile(samples[(name, phase)], 95),
+        )
+        for phase in ["total"] + phases:
+            values = samples[(name, phase)]
+            print(
+                f"{name:<24} {phase:<20} {len(values):>6} "
+                f"{percentile(values, 50):>9.1f} {percentile(values, 95):>9.1f} "
+                f"{percentile(values, 99):>9.1f} {max(values):>9.1f}"
+            )
+
+
+def main():
+    """CLI interface for hook metrics."""
+
+    if len(sys.argv) < 2 or sys.argv[1] != "report":
+        print("Usage: hook_metrics.py report [--since 24h] [--hook NAME]", file=sys.stderr)
+        sys.exit(1)
+
+    args = sys.argv[2:]
+    window = "24h"
+    hook = None
+    while args:
+        if args[0] == "--since" and len(args) > 1:
+            window = args[1]
+        elif args[0] == "--hook" and len(args) > 1:
+            hook = args[1]
+        else:
+            print(f"Error: Unknown argument: {args[0]}", file=sys.stderr)
+            sys.exit(1)
+        args = args[2:]
+
+    try:
+        window_seconds = parse_window(window)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    report(window_seconds, hook)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+Mock Provider API Server
+
+Local stand-in for the subset of the OpenAI, Anthropic and ElevenLabs APIs
+that the hooks, oai.py/anth.py, plan_parser.py, bmad_generator.py and the TTS
+providers call, so they can be exercised, load-tested and benchmarked offline.
+
+Endpoints:
+    POST /v1/chat/completions              OpenAI chat completion ("stream": true -> SSE)
+    POST /v1/audio/speech                  OpenAI text-to-speech (chunked MP3)
+    POST /v1/messages                      Anthropic message ("stream": true -> SSE)
+    POST /v1/text-to-speech/<voice>        ElevenLabs text-to-speech (MP3)
+    POST /v1/text-to-speech/<voice>/stream ElevenLabs streaming text-to-speech (chunked MP3)
+    GET  /health                           Request counts per endpoint
+
+Every response waits --latency-ms (plus up to --jitter-ms) before the first
+byte; streamed responses wait --chunk-delay-ms between chunks. --error-rate
+answers that fraction of requests with HTTP 429 in the provider's error
+format, with a Retry-After header.
+
+Text responses are canned: a short sentence for small max_tokens, a markdown
+document (about --doc-tokens tokens) for large ones, numbered short lines for
+"one per line" batch prompts, and a valid plan for plan_parser's JSON plan
+prompt. A script file overrides this per request:
+
+    {"rules": [
+        {"endpoint": "anthropic_messages", "status": 429, "times": 2},
+        {"endpoint": "anthropic_messages", "match": "PRD", "text": "# PRD ...", "latency_ms": 800},
+        {"match": "completion message", "text": "All set!"}
+    ]}
+
+Rules are tried in order; a rule applies when its endpoint (if given) and
+prompt substring (if given) match and it has uses left ("times", default
+unlimited). Rule fields: text, status, latency_ms, chunk_delay_ms, retry_after.
+
+Point clients at it with:
+    OPENAI_BASE_URL=http://127.0.0.1:<port>/v1
+    ANTHROPIC_BASE_URL=http://127.0.0.1:<port>
+    ELEVENLABS_BASE_URL=http://127.0.0.1:<port>
+
+Commands:
+    serve [--port 8787] [--latency-ms 0] [--jitter-ms 0] [--chunk-delay-ms 20]
+          [--error-rate 0] [--doc-tokens 1500] [--script rules.json]
+
+Examples:
+    python3 mock_api.py serve --latency-ms 300
+    python3 mock_api.py serve --error-rate 0.2 --script rules.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Constants
+DEFAULT_PORT = 8787
+MOCK_TEXT = "I finished the requested changes and everything is ready."
+# One silent MPEG-1 Layer III frame header followed by padding
+MOCK_AUDIO = b"\xff\xfb\x90\x64" + b"\x00" * 413
+AUDIO_CHARS_PER_CHUNK = 20
+SHORT_RESPONSE_MAX_TOKENS = 200
+STREAM_WORDS_PER_CHUNK = 4
+MOCK_LINES = ("All done!", "Work complete!", "Task finished!", "Ready for your next move!",
+              "Everything is in place!", "Done and ready!", "Changes are ready!", "All set for review!")
+MOCK_PLAN = {
+    "epics": [{
+        "name": "Mock Epic",
+        "description": "Generated by the mock API server",
+        "stories": [{
+            "name": "Mock Story",
+            "description": "As a developer I can run workflows offline",
+            "tasks": [
+                {"name": "Validate requirements", "agent": "@product-manager", "estimated_time": "15m", "dependencies": []},
+                {"name": "Implement feature", "agent": "@api-developer", "estimated_time": "1h",
+                 "dependencies": ["Validate requirements"]},
+                {"name": "Write tests", "agent": "@tdd-specialist", "estimated_time": "30m",
+                 "dependencies": ["Implement feature"]},
+            ],
+        }],
+    }],
+    "agents_needed": ["@product-manager", "@api-developer", "@tdd-specialist"],
+    "estimated_total_time": "1h45m",
+}
+
+DOC_WORDS = (
+    "the", "service", "handles", "requests", "with", "a", "layered", "architecture",
+    "and", "stores", "data", "in", "PostgreSQL", "while", "caching", "hot", "paths",
+    "users", "authenticate", "through", "OAuth", "tokens", "that", "expire",
+)
+
+
+def estimate_tokens(text):
+    """Rough token count (about four characters per token)."""
+    return max(1, len(text) // 4)
+
+
+def mock_document(tokens):
+    """Deterministic markdown document of roughly the given token count."""
+    rng = random.Random(tokens)
+    sections = []
+    section = 0
+    while estimate_tokens("\n".join(sections)) < tokens:
+        section += 1
+        paragraph = " ".join(rng.choice(DOC_WORDS) for _ in range(60)).capitalize() + "."
+        sections.append(f"## Section {section}\n\n{paragraph}\n\n- {rng.choice(DOC_WORDS)} requirement\n")
+    return "# Mock Document\n\n" + "\n".join(sections)
+
+
+def request_prompt(body):
+    """Prompt text of a request (chat/messages content or TTS input)."""
+    if "messages" in body:
+        parts = []
+        for message in body.get("messages") or []:
+            content = message.get("content", "") if isinstance(message, dict) else ""
+            if isinstance(content, list):
+                content = " ".join(block.get("text", "") for block in content if isinstance(block, dict))
+            parts.append(str(content))
+        return "\n".join(parts)
+    return str(body.get("input") or body.get("text") or "")
+
+
+def endpoint_name(path):
+    """Normalize a request path to the endpoint it hits (voice ids stripped)."""
+    path = path.split("?", 1)[0].rstrip("/")
+    if path.startswith("/v1/text-to-speech/"):
+        return "elevenlabs_stream" if path.endswith("/stream") else "elevenlabs_tts"
+    return {
+        "/v1/chat/completions": "openai_chat",
+        "/v1/audio/speech": "openai_tts",
+        "/v1/messages": "anthropic_messages",
+    }.get(path)
+
+
+def rate_limit_error(endpoint):
+    """429 body in the provider's error format."""
+    message = "Rate limit exceeded (mock)"
+    if endpoint == "anthropic_messages":
+        return {"type": "error", "error": {"type": "rate_limit_error", "message": message}}
+    if endpoint and endpoint.startswith("elevenlabs"):
+        return {"detail": {"status": "too_many_requests", "message": message}}
+    return {"error": {"message": message, "type": "rate_limit_error", "code": "rate_limit_exceeded"}}
+
+
+def chat_completion(model, text, prompt):
+    """OpenAI chat.completion response."""
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": text},
+            "finish_reason": "stop",
+        }],
+        "usage": {
+            "prompt_tokens": estimate_tokens(prompt),
+            "completion_tokens": estimate_tokens(text),
+            "total_tokens": estimate_tokens(prompt) + estimate_tokens(text),
+        },
+    }
+
+
+def anthropic_message(model, text, prompt):
+    """Anthropic messages response."""
+    return {
+        "id": f"msg_{uuid.uuid4().hex[:12]}",
+        "type": "message",
+        "role": "assistant",
+        "model": model,
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": estimate_tokens(prompt), "output_tokens": estimate_tokens(text)},
+    }
+
+
+def text_chunks(text):
+    """Split text into small streaming deltas, keeping whitespace."""
+    words = text.split(" ")
+    for start in range(0, len(words), STREAM_WORDS_PER_CHUNK):
+        chunk = " ".join(words[start:start + STREAM_WORDS_PER_CHUNK])
+        yield chunk if start + STREAM_WORDS_PER_CHUNK >= len(words) else chunk + " "
+
+
+class MockAPIHandler(BaseHTTPRequestHandler):
+    """Serves canned or scripted provider responses."""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, so pooled clients reuse connections
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/health":
+            self.send_json({"ok": True, "requests": self.server.request_counts()})
+        else:
+            self.send_json({"error": {"message": f"Unknown endpoint: {self.path}"}}, status=404)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            body = {}
+
+        endpoint = endpoint_name(self.path)
+        self.server.record(endpoint or "unknown")
+        if endpoint is None:
+            self.send_json({"error": {"message": f"Unknown endpoint: {self.path}"}}, status=404)
+            return
+
+        prompt = request_prompt(body)
+        rule = self.server.match_rule(endpoint, prompt)
+        time.sleep(self.server.first_byte_delay(rule))
+
+        status = rule.get("status", 200)
+        if status == 200 and self.server.should_rate_limit():
+            status = 429
+        if status != 200:
+            headers = {"Retry-After": str(rule.get("retry_after", 1))} if status == 429 else {}
+            error = rate_limit_error(endpoint) if status == 429 else {"error": {"message": f"Mock error {status}"}}
+            self.send_json(error, status=status, headers=headers)
+            return
+
+        chunk_delay = rule.get("chunk_delay_ms", self.server.chunk_delay_ms) / 1000
+        model = body.get("model") or "mock"
+
+        if endpoint in ("openai_chat", "anthropic_messages"):
+            text = rule.get("text") or self.server.default_text(endpoint, prompt, body)
+            if body.get("stream"):
+                if endpoint == "openai_chat":
+                    self.stream_chat_completion(model, text, prompt, body, chunk_delay)
+                else:
+                    self.stream_anthropic_message(model, text, prompt, chunk_delay)
+            elif endpoint == "openai_chat":
+                self.send_json(chat_completion(model, text, prompt))
+            else:
+                self.send_json(anthropic_message(model, text, prompt))
+        else:
+            chunks = max(1, len(prompt) // AUDIO_CHARS_PER_CHUNK)
+            if endpoint == "elevenlabs_tts":
+                self.send_bytes(MOCK_AUDIO * chunks, "audio/mpeg")
+            else:
+                self.send_chunked((MOCK_AUDIO for _ in range(chunks)), "audio/mpeg", chunk_delay)
+
+    def send_json(self, payload, status=200, headers=None):
+        self.send_bytes(json.dumps(payload).encode(), "application/json", status, headers)
+
+    def send_bytes(self, data, content_type, status=200, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_chunked(self, chunks, content_type, chunk_delay):
+        """Send chunks with HTTP/1.1 chunked transfer encoding, pausing between them."""
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        try:
+            for index, chunk in enumerate(chunks):
+                if index and chunk_delay:
+                    time.sleep(chunk_delay)
+                self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True  # Client stopped reading
+
+    def stream_chat_completion(self, model, text, prompt, body, chunk_delay):
+        """OpenAI chat completion as server-sent events."""
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+
+        def chunk(delta, finish_reason=None, usage=None):
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [] if usage else [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            if usage:
+                payload["usage"] = usage
+            return f"data: {json.dumps(payload)}\n\n".encode()
+
+        def events():
+            yield chunk({"role": "assistant", "content": ""})
+            for piece in text_chunks(text):
+                yield chunk({"content": piece})
+            yield chunk({}, finish_reason="stop")
+            if (body.get("stream_options") or {}).get("include_usage"):
+                yield chunk(None, usage={
+                    "prompt_tokens": estimate_tokens(prompt),
+                    "completion_tokens": estimate_tokens(text),
+                    "total_tokens": estimate_tokens(prompt) + estimate_tokens(text),
+                })
+            yield b"data: [DONE]\n\n"
+
+        self.send_chunked(events(), "text/event-stream", chunk_delay)
+
+    def stream_anthropic_message(self, model, text, prompt, chunk_delay):
+        """Anthropic message as server-sent events."""
+
+        def event(kind, payload):
+            payload = {"type": kind, **payload}
+            return f"event: {kind}\ndata: {json.dumps(payload)}\n\n".encode()
+
+        def events():
+            message = anthropic_message(model, "", prompt)
+            message["content"] = []
+            message["stop_reason"] = None
+            message["usage"]["output_tokens"] = 0
+            yield event("message_start", {"message": message})
+            yield event("content_block_start", {"index": 0, "content_block": {"type": "text", "text": ""}})
+            for piece in text_chunks(text):
+                yield event("content_block_delta", {"index": 0, "delta": {"type": "text_delta", "text": piece}})
+            yield event("content_block_stop", {"index": 0})
+            yield event("message_delta", {
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"output_tokens": estimate_tokens(text)},
+            })
+            yield event("message_stop", {})
+
+        self.send_chunked(events(), "text/event-stream", chunk_delay)
+
+
+class MockAPIServer(ThreadingHTTPServer):
+    """
+    Threaded mock server with per-endpoint request counts.
+
+    Usage:
+        server = MockAPIServer(latency_ms=200)
+        server.start()
+        env["OPENAI_BASE_URL"] = f"{server.url}/v1"
+        ...
+        server.shutdown()
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port=0, latency_ms=0, jitter_ms=0, chunk_delay_ms=20, error_rate=0.0,
+                 doc_tokens=1500, rules=None, verbose=False):
+        super().__init__(("127.0.0.1", port), MockAPIHandler)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.chunk_delay_ms = chunk_delay_ms
+        self.error_rate = error_rate
+        self.doc_tokens = doc_tokens
+        self.rules = [dict(rule) for rule in (rules or [])]
+        self.verbose = verbose
+        self.requests = Counter()
+        self._lock = threading.Lock()
+        self._random = random.Random(0)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def record(self, endpoint):
+        with self._lock:
+            self.requests[endpoint] += 1
+
+    def request_counts(self):
+        """Snapshot of requests served per endpoint."""
+        with self._lock:
+            return dict(self.requests)
+
+    def match_rule(self, endpoint, prompt):
+        """First scripted rule matching the request (its use is consumed), or {}."""
+        with self._lock:
+            for rule in self.rules:
+                if rule.get("endpoint") not in (None, endpoint):
+                    continue
+                if rule.get("match") and rule["match"] not in prompt:
+                    continue
+                if rule.get("times") is not None:
+                    if rule["times"] <= 0:
+                        continue
+                    rule["times"] -= 1
+                return rule
+        return {}
+
+    def first_byte_delay(self, rule):
+        """Seconds to wait before responding."""
+        latency_ms = rule.get("latency_ms", self.latency_ms)
+        with self._lock:
+            jitter_ms = self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+        return (latency_ms + jitter_ms) / 1000
+
+    def should_rate_limit(self):
+        """Randomly (at error_rate) answer with a 429."""
+        if not self.error_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def default_text(self, endpoint, prompt, body):
+        """Canned completion text for an unscripted request."""
+        if "JSON plan" in prompt:
+            return json.dumps(MOCK_PLAN, indent=2)
+        if "one per line" in prompt:
+            return "\n".join(f"{n}. {line}" for n, line in enumerate(MOCK_LINES, 1))
+        max_tokens = body.get("max_tokens") or body.get("max_completion_tokens") or 0
+        if max_tokens and max_tokens <= SHORT_RESPONSE_MAX_TOKENS:
+            return MOCK_TEXT
+        return mock_document(min(self.doc_tokens, max_tokens or self.doc_tokens))
+
+    def start(self):
+        """Serve on a background thread."""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+
+def load_rules(path):
+    """Scripted response rules from a JSON file."""
+    with open(path, 'r') as f:
+        data = json.load(f)
+    rules = data.get("rules") if isinstance(data, dict) else data
+    if not isinstance(rules, list):
+        raise ValueError("script must be a list of rules or {\"rules\": [...]}")
+    return rules
+
+
+def main():
+    """CLI interface for the mock server."""
+
+    parser = argparse.ArgumentParser(description="Mock OpenAI/Anthropic/ElevenLabs API server")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve = subparsers.add_parser("serve", help="Serve until interrupted")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve.add_argument("--latency-ms", type=float, default=0, help="Delay before every response")
+    serve.add_argument("--jitter-ms", type=float, default=0, help="Random extra delay, up to this much")
+    serve.add_argument("--chunk-delay-ms", type=float, default=20, help="Delay between streamed chunks")
+    serve.add_argument("--error-rate", type=float, default=0, help="Fraction of requests answered with 429")
+    serve.add_argument("--doc-tokens", type=int, default=1500, help="Size of canned long-form responses")
+    serve.add_argument("--script", help="JSON file with scripted response rules")
+    serve.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    rules = None
+    if args.script:
+        try:
+            rules = load_rules(args.script)
+        except (OSError, ValueError, json.JSONDecodeError) as e:
+            print(f"Error: Cannot load script {args.script}: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    try:
+        server = MockAPIServer(
+            args.port, args.latency_ms, args.jitter_ms, args.chunk_delay_ms,
+            args.error_rate, args.doc_tokens, rules, args.verbose,
+        )
+    except OSError as e:
+        print(f"Error: Cannot listen on port {args.port}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Mock API listening on {server.url} (latency {args.latency_ms:g} ms, error rate {args.error_rate:g})")
+    print(f"  OPENAI_BASE_URL={server.url}/v1")
+    print(f"  ANTHROPIC_BASE_URL={server.url}")
+    print(f"  ELEVENLABS_BASE_URL={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
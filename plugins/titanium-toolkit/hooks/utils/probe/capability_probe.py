@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Platform Capability Probe
+
+Detects once which audio players, desktop notifiers and speech binaries exist
+on this machine and caches the answer, so hooks only spawn binaries that are
+known to be installed instead of trying afplay, notify-send and osascript on
+every event.
+
+The probe result is kept in memory for the life of the process and on disk in
+$TITANIUM_HOME/capabilities.json. It is re-probed when it is older than the
+TTL, when PATH changes, or on a different platform.
+
+Commands:
+    show       Print cached capabilities (probing if stale)
+    refresh    Probe now and rewrite the cache
+
+Examples:
+    python3 capability_probe.py show
+    python3 capability_probe.py refresh
+
+Environment:
+    TITANIUM_PROBE_TTL_SECONDS   Re-probe after this long (default: 86400)
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Constants
+TITANIUM_HOME = Path(os.getenv("TITANIUM_HOME", Path.home() / ".titanium"))
+CACHE_PATH = TITANIUM_HOME / "capabilities.json"
+TTL_SECONDS = float(os.getenv("TITANIUM_PROBE_TTL_SECONDS", "86400"))
+PROBE_VERSION = 1
+
+BINARIES = {
+    "players": ["afplay", "ffplay", "mpv", "aplay"],
+    "notifiers": ["notify-send", "osascript"],
+    "speech": ["say"],
+    "tools": ["uv", "claude"],
+}
+
+_capabilities = None
+
+
+def path_hash():
+    """Fingerprint of PATH, so a changed PATH invalidates the cache."""
+    return hashlib.sha1(os.environ.get("PATH", "").encode("utf-8")).hexdigest()
+
+
+def probe():
+    """Look up every known binary on PATH."""
+    return {
+        "version": PROBE_VERSION,
+        "platform": sys.platform,
+        "path_hash": path_hash(),
+        "probed_at": time.time(),
+        "binaries": {
+            name: shutil.which(name)
+            for names in BINARIES.values()
+            for name in names
+        },
+    }
+
+
+def is_fresh(capabilities):
+    """Whether cached capabilities still apply to this process."""
+    return (
+        isinstance(capabilities, dict)
+        and capabilities.get("version") == PROBE_VERSION
+        and capabilities.get("platform") == sys.platform
+        and capabilities.get("path_hash") == path_hash()
+        and time.time() - capabilities.get("probed_at", 0) < TTL_SECONDS
+    )
+
+
+def save(capabilities):
+    """Atomically write capabilities to the cache file."""
+    try:
+        TITANIUM_HOME.mkdir(parents=True, exist_ok=True)
+        temp_path = CACHE_PATH.with_name(f".{CACHE_PATH.name}.{uuid.uuid4().hex[:8]}.tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(capabilities, f, indent=2)
+        temp_path.replace(CACHE_PATH)
+    except OSError:
+        pass  # Probing again next time is harmless
+
+
+def get_capabilities(refresh=False):
+    """
+    Return cached capabilities, probing if missing or stale.
+
+    Returns:
+        dict: {"platform", "path_hash", "probed_at", "binaries": {name: path or None}}
+    """
+    global _capabilities
+
+    if not refresh and is_fresh(_capabilities):
+        return _capabilities
+
+    if not refresh:
+        try:
+            with open(CACHE_PATH, 'r') as f:
+                cached = json.load(f)
+            if is_fresh(cached):
+                _capabilities = cached
+                return _capabilities
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+    _capabilities = probe()
+    save(_capabilities)
+    return _capabilities
+
+
+def find_binary(name):
+    """Path of a binary, or None if it is not installed."""
+    binaries = get_capabilities()["binaries"]
+    if name not in binaries:
+        return shutil.which(name)  # Not part of the probe set
+    return binaries[name]
+
+
+def has_binary(name):
+    """Whether a binary is installed."""
+    return find_binary(name) is not None
+
+
+def main():
+    """CLI interface for the capability probe."""
+
+    if len(sys.argv) < 2:
+        print("Usage: capability_probe.py <show|refresh>", file=sys.stderr)
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command in ("show", "refresh"):
+        capabilities = get_capabilities(refresh=(command == "refresh"))
+        age = time.time() - capabilities["probed_at"]
+        print(f"Platform: {capabilities['platform']} (probed {age:.0f}s ago, cache: {CACHE_PATH})\n")
+        for group, names in BINARIES.items():
+            print(f"{group}:")
+            for name in names:
+                path = capabilities["binaries"].get(name)
+                print(f"  {'✓' if path else '✗'} {name:<18} {path or ''}")
+    else:
+        print(f"Error: Unknown command: {command}", file=sys.stderr)
+        print("\nValid commands: show, refresh", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Plugin Runtime Environment
+
+Every utility is a `uv run --script` script with inline dependency metadata,
+so each call pays uv's environment resolution plus a second interpreter
+start. `install` resolves the dependencies of all the plugin's scripts once
+into a locked requirements file and builds one virtualenv from it;
+runtime_command() then runs scripts directly with that interpreter, which
+costs about as much as plain Python startup.
+
+Scripts whose dependencies are not all in the installed runtime (e.g. after
+a plugin update added one) keep running through `uv run` until `install` is
+re-run. Without a runtime or uv, scripts run with the current interpreter.
+
+Layout ($TITANIUM_HOME/runtime):
+    requirements.in     Union of the scripts' inline dependencies
+    requirements.lock   Pinned versions (uv pip compile, or pip freeze without uv)
+    venv/               The plugin's virtualenv
+    runtime.json        Interpreter and installed requirements (written last)
+
+Commands:
+    install                      Resolve, lock and install (re-run after updates)
+    status                       Show the runtime and which scripts will use it
+    command <script> [args...]   Print the command a script runs with
+
+Examples:
+    python3 plugin_runtime.py install
+    python3 plugin_runtime.py command ../llm/oai.py --completion
+
+Environment:
+    TITANIUM_RUNTIME=uv   Ignore the installed runtime and always use `uv run`
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "probe"))
+from capability_probe import has_binary
+
+# Constants
+TITANIUM_HOME = Path(os.getenv("TITANIUM_HOME", Path.home() / ".titanium"))
+RUNTIME_DIR = TITANIUM_HOME / "runtime"
+VENV_DIR = RUNTIME_DIR / "venv"
+REQUIREMENTS_PATH = RUNTIME_DIR / "requirements.in"
+LOCK_PATH = RUNTIME_DIR / "requirements.lock"
+RUNTIME_PATH = RUNTIME_DIR / "runtime.json"
+HOOKS_DIR = Path(__file__).resolve().parent.parent.parent
+METADATA_LINES = 40  # Inline metadata must be at the top of the script
+
+_runtime = None
+_script_dependencies = {}
+
+
+def parse_script_metadata(script_path):
+    """
+    Read a script's inline (PEP 723) metadata block.
+
+    Returns:
+        tuple: (list of dependency specifiers, requires-python or None);
+        ([], None) for scripts without a metadata block
+    """
+    lines = []
+    with open(script_path, 'r', encoding='utf-8') as f:
+        for _, line in zip(range(METADATA_LINES), f):
+            lines.append(line.rstrip("\n"))
+
+    try:
+        start = lines.index("# /// script")
+        end = lines.index("# ///", start + 1)
+    except ValueError:
+        return [], None
+
+    block = "\n".join(line[1:].strip() for line in lines[start + 1:end])
+    requires_python = re.search(r'requires-python\s*=\s*"([^"]+)"', block)
+    dependencies = re.search(r'dependencies\s*=\s*\[(.*?)\]', block, re.DOTALL)
+    return (
+        re.findall(r'"([^"]+)"', dependencies.group(1)) if dependencies else [],
+        requires_python.group(1) if requires_python else None,
+    )
+
+
+def script_dependencies(script_path):
+    """Inline dependencies of a script (cached per process)."""
+    key = str(Path(script_path).resolve())
+    if key not in _script_dependencies:
+        try:
+            _script_dependencies[key] = parse_script_metadata(key)[0]
+        except OSError:
+            _script_dependencies[key] = []
+    return _script_dependencies[key]
+
+
+def collect_requirements(hooks_dir=HOOKS_DIR):
+    """
+    Union of all scripts' inline dependencies.
+
+    Returns:
+        tuple: (sorted dependency specifiers, strictest requires-python)
+    """
+    dependencies = set()
+    minimum_python = (3, 8)
+    for script_path in sorted(Path(hooks_dir).rglob("*.py")):
+        if "__pycache__" in script_path.parts:
+            continue
+        script_deps, requires_python = parse_script_metadata(script_path)
+        dependencies.update(script_deps)
+        version = re.match(r'>=\s*(\d+)\.(\d+)', requires_python or "")
+        if version:
+            minimum_python = max(minimum_python, (int(version.group(1)), int(version.group(2))))
+    return sorted(dependencies), minimum_python
+
+
+def venv_python(venv_dir=VENV_DIR):
+    """Path of the virtualenv's interpreter."""
+    if sys.platform == "win32":
+        return venv_dir / "Scripts" / "python.exe"
+    return venv_dir / "bin" / "python"
+
+
+def load_runtime():
+    """The installed runtime record, or None if not installed (cached per process)."""
+    global _runtime
+    if _runtime is None:
+        try:
+            with open(RUNTIME_PATH, 'r') as f:
+                runtime = json.load(f)
+            _runtime = runtime if Path(runtime["python"]).exists() else {}
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+            _runtime = {}
+    return _runtime or None
+
+
+def runtime_installed():
+    """Whether the locked runtime is installed and not disabled."""
+    return os.getenv("TITANIUM_RUNTIME") != "uv" and load_runtime() is not None
+
+
+def runtime_covers(script_path):
+    """Whether the installed runtime has every dependency the script declares."""
+    runtime = load_runtime()
+    if runtime is None or os.getenv("TITANIUM_RUNTIME") == "uv":
+        return False
+    return set(script_dependencies(script_path)) <= set(runtime.get("requirements", []))
+
+
+def runtime_command(script_path, *args):
+    """
+    Command line that runs a plugin script with the fastest available runtime.
+
+    Args:
+        script_path: Script with inline dependency metadata
+        *args: Arguments for the script
+
+    Returns:
+        list: [runtime python, script, ...] if the installed runtime covers the
+        script, else `uv run --script` if uv is installed, else the current
+        interpreter
+    """
+    script = str(script_path)
+    if runtime_covers(script_path):
+        return [load_runtime()["python"], script, *args]
+    if has_binary("uv"):
+        return ["uv", "run", "--script", script, *args]
+    return [sys.executable, script, *args]
+
+
+def run_step(command, description):
+    """Run one install step, exiting with its output on failure."""
+    print(f"• {description}")
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"Error: {description} failed:\n{result.stderr.strip() or result.stdout.strip()}", file=sys.stderr)
+        sys.exit(1)
+    return result.stdout
+
+
+def install():
+    """Resolve, lock and install all script dependencies into the plugin runtime."""
+    dependencies, minimum_python = collect_requirements()
+    python_spec = f">={minimum_python[0]}.{minimum_python[1]}"
+    use_uv = has_binary("uv")
+
+    if not use_uv and sys.version_info[:2] < minimum_python:
+        print(f"Error: Python {python_spec} is required (this is {sys.version.split()[0]}); "
+              "install uv or run with a newer python3", file=sys.stderr)
+        sys.exit(1)
+
+    RUNTIME_DIR.mkdir(parents=True, exist_ok=True)
+    # Runtime record goes first, so a failed install is never picked up half-built
+    RUNTIME_PATH.unlink(missing_ok=True)
+    shutil.rmtree(VENV_DIR, ignore_errors=True)
+    REQUIREMENTS_PATH.write_text("\n".join(dependencies) + "\n")
+
+    started_at = time.monotonic()
+    python = venv_python()
+    if use_uv:
+        run_step(["uv", "venv", "--quiet", "--python", python_spec, str(VENV_DIR)], "Creating virtualenv (uv)")
+        run_step(["uv", "pip", "compile", "--quiet", "--python", str(python), str(REQUIREMENTS_PATH),
+                  "-o", str(LOCK_PATH)], "Locking dependencies")
+        run_step(["uv", "pip", "sync", "--quiet", "--python", str(python), str(LOCK_PATH)],
+                 "Installing locked dependencies")
+    else:
+        run_step([sys.executable, "-m", "venv", str(VENV_DIR)], "Creating virtualenv")
+        run_step([str(python), "-m", "pip", "install", "--quiet", "-r", str(REQUIREMENTS_PATH)],
+                 "Installing dependencies")
+        LOCK_PATH.write_text(run_step([str(python), "-m", "pip", "freeze"], "Locking installed versions"))
+
+    runtime = {
+        "python": str(python),
+        "requirements": dependencies,
+        "plugin_dir": str(HOOKS_DIR.parent),
+        "installer": "uv" if use_uv else "pip",
+        "installed_at": time.time(),
+    }
+    temp_path = RUNTIME_PATH.with_suffix('.tmp')
+    with open(temp_path, 'w') as f:
+        json.dump(runtime, f, indent=2)
+    temp_path.replace(RUNTIME_PATH)
+
+    print(f"✅ Runtime installed in {time.monotonic() - started_at:.1f}s: {python}")
+    print(f"   {len(dependencies)} requirements locked in {LOCK_PATH}")
+
+
+def status():
+    """Show the installed runtime and which scripts it covers."""
+    runtime = load_runtime()
+    if runtime is None:
+        print("Runtime: not installed (scripts run with `uv run`, or python3 without uv)")
+        print("Install: python3 hooks/utils/runtime/plugin_runtime.py install")
+        return
+
+    installed_at = time.strftime("%Y-%m-%d %H:%M", time.localtime(runtime.get("installed_at", 0)))
+    print(f"Runtime: {runtime['python']} ({runtime.get('installer')}, installed {installed_at})")
+    if os.getenv("TITANIUM_RUNTIME") == "uv":
+        print("Disabled by TITANIUM_RUNTIME=uv")
+
+    stale = []
+    for script_path in sorted(HOOKS_DIR.rglob("*.py")):
+        if "__pycache__" not in script_path.parts and not runtime_covers(script_path):
+            if script_dependencies(script_path):
+                stale.append(script_path.relative_to(HOOKS_DIR))
+    if stale:
+        print("\nNot covered (new dependencies; re-run install):")
+        for script in stale:
+            print(f"  {script}")
+    else:
+        print("All scripts covered")
+
+
+def main():
+    """CLI interface for the plugin runtime."""
+
+    if len(sys.argv) < 2:
+        print("Usage: plugin_runtime.py <install|status|command> [script] [args...]", file=sys.stderr)
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == "install":
+        install()
+    elif command == "status":
+        status()
+    elif command == "command":
+        if len(sys.argv) < 3:
+            print("Error: command requires a script path", file=sys.stderr)
+            sys.exit(1)
+        print(" ".join(runtime_command(sys.argv[2], *sys.argv[3:])))
+    else:
+        print(f"Error: Unknown command: {command}", file=sys.stderr)
+        print("\nValid commands: install, status, command", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Incremental Chat Export
+
+Exports a Claude Code transcript (JSONL) into the project's logs directory,
+processing only the records appended since the previous export. Used by the
+Stop and SubagentStop hooks' --chat switch.
+
+Formats:
+    json      logs/chat.json - pretty-printed array of the latest session's
+              transcript, as it has always been written (default); new
+              records are spliced in before the closing bracket, and the file
+              is rewritten only when another transcript is exported to it
+    jsonl     logs/chat/<session>.jsonl - one record per line, appended
+    archive   logs/chat-archive/<session>/chunk-NNNNN.jsonl.gz - gzip members
+              appended per export, rolled into a new chunk every
+              TITANIUM_CHAT_CHUNK_MB, with index.json beside them mapping record
+              numbers to chunks
+
+jsonl and archive export each transcript (one per session) to its own files,
+named after the transcript (<session>), so sessions running in the same
+project don't restart each other's exports.
+
+Export progress (inode, byte offset, record count) is kept per format (and
+per transcript for jsonl and archive) in logs/chat.export.json. A replaced
+or truncated transcript starts a fresh export; progress for deleted
+transcripts is dropped.
+
+Usage:
+    python3 chat_export.py <transcript_path> <log_dir> [json|jsonl|archive]
+"""
+
+import gzip
+import json
+import os
+import sys
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: exports are not serialized
+    fcntl = None
+
+# Constants
+FORMATS = ("json", "jsonl", "archive")
+STATE_FILE = "chat.export.json"
+JSONL_DIR = "chat"
+ARCHIVE_DIR = "chat-archive"
+CHUNK_BYTES = int(float(os.getenv("TITANIUM_CHAT_CHUNK_MB", "4")) * 1024 * 1024)
+
+
+def read_new_records(transcript_path, offset):
+    """
+    Read complete lines appended after offset, skipping invalid JSON.
+
+    Returns:
+        tuple: (list of raw record lines as bytes, new offset)
+    """
+    records = []
+    with open(transcript_path, 'rb') as f:
+        f.seek(offset)
+        for raw_line in f:
+            if not raw_line.endswith(b"\n"):
+                break  # Still being written; pick it up next time
+            offset += len(raw_line)
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue  # Skip invalid lines
+            records.append(line)
+    return records, offset
+
+
+def session_name(transcript_path):
+    """Name of a transcript's export files (the session id Claude Code uses)."""
+    return Path(transcript_path).stem
+
+
+def write_jsonl(log_dir, records, reset, transcript_path):
+    """Append records to logs/chat/<session>.jsonl."""
+    chat_dir = Path(log_dir) / JSONL_DIR
+    chat_dir.mkdir(parents=True, exist_ok=True)
+    chat_path = chat_dir / f"{session_name(transcript_path)}.jsonl"
+    with open(chat_path, 'wb' if reset else 'ab') as f:
+        for line in records:
+            f.write(line + b"\n")
+
+
+def write_archive(log_dir, records, reset, transcript_path, first_record, source_start, source_end):
+    """
+    Append records as a gzip member to the current archive chunk.
+
+    Args:
+        first_record: Record number of records[0] within the transcript export
+        source_start: Transcript byte offset where records begin
+        source_end: Transcript byte offset just after the last record
+    """
+    archive_dir = Path(log_dir) / ARCHIVE_DIR / session_name(transcript_path)
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    index_path = archive_dir / "index.json"
+
+    index = {"transcript_path": str(transcript_path), "chunks": []}
+    if reset:
+        for old_chunk in archive_dir.glob("chunk-*.jsonl.gz"):
+            old_chunk.unlink()
+    elif index_path.exists():
+        with open(index_path, 'r') as f:
+            index = json.load(f)
+
+    if records:
+        chunks = index["chunks"]
+        if not chunks or chunks[-1]["bytes"] >= CHUNK_BYTES:
+            chunks.append({
+                "file": f"chunk-{len(chunks) + 1:05d}.jsonl.gz",
+                "first_record": first_record,
+                "records": 0,
+                "source_start": source_start,
+                "source_end": source_start,
+                "bytes": 0,
+            })
+        chunk = chunks[-1]
+        chunk_path = archive_dir / chunk["file"]
+
+        # Each export adds one gzip member; concatenated members are valid gzip
+        with open(chunk_path, 'ab') as f:
+            f.write(gzip.compress(b"".join(line + b"\n" for line in records)))
+
+        chunk["records"] += len(records)
+        chunk["source_end"] = source_end
+        chunk["bytes"] = chunk_path.stat().st_size
+
+    temp_path = index_path.with_suffix('.tmp')
+    with open(temp_path, 'w') as f:
+        json.dump(index, f, indent=2)
+    temp_path.replace(index_path)
+
+
+def json_export_intact(chat_path):
+    """Whether logs/chat.json ends like json.dump(records, indent=2) output."""
+    try:
+        with open(chat_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() < 2:
+                return False
+            f.seek(-2, os.SEEK_END)
+            return f.read() in (b"\n]", b"[]")
+    except OSError:
+        return False
+
+
+def write_json(log_dir, records, reset):
+    """
+    Add records to logs/chat.json, byte-for-byte as json.dump(records, indent=2)
+    would write the whole array.
+    """
+    chat_path = Path(log_dir) / "chat.json"
+    # Array items at indent 2 (JSON strings never contain raw newlines)
+    items = ["  " + json.dumps(json.loads(line), indent=2).replace("\n", "\n  ") for line in records]
+
+    if reset:
+        temp_path = chat_path.with_suffix('.tmp')
+        with open(temp_path, 'w') as f:
+            f.write("[\n" + ",\n".join(items) + "\n]" if items else "[]")
+        temp_path.replace(chat_path)
+        return
+
+    if not items:
+        return
+    with open(chat_path, 'rb+') as f:
+        f.seek(-2, os.SEEK_END)
+        empty = f.read() == b"[]"
+        # Overwrite the closing "\n]" (or "]" of an empty array) and close again
+        f.seek(-1 if empty else -2, os.SEEK_END)
+        f.truncate()
+        f.write((("\n" if empty else ",\n") + ",\n".join(items) + "\n]").encode("utf-8"))
+
+
+def export_chat(transcript_path, log_dir, fmt="json"):
+    """
+    Export transcript records appended since the last export.
+
+    Args:
+        transcript_path: Path to the transcript JSONL file
+        log_dir: Project logs directory
+        fmt: "json", "jsonl" or "archive"
+
+    Returns:
+        int: Number of new records exported
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown chat export format: {fmt}")
+
+    log_dir = Path(log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    with open(log_dir / "chat.export.lock", 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        state_path = log_dir / STATE_FILE
+        all_states = {}
+        try:
+            with open(state_path, 'r') as f:
+                all_states = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+        stat = os.stat(transcript_path)
+        if fmt == "json":
+            # One shared file holding the latest transcript to be exported
+            state = all_states.get("json")
+            reset = (
+                not isinstance(state, dict)
+                or state.get("transcript_path") != str(transcript_path)
+                or not json_export_intact(log_dir / "chat.json")
+            )
+        else:
+            states = all_states.get(fmt)
+            if not isinstance(states, dict) or "offset" in states:
+                states = {}  # Missing, or the old single-transcript layout
+            state = states.get(str(transcript_path))
+            reset = not state
+        reset = reset or state.get("inode") != stat.st_ino or stat.st_size < state.get("offset", 0)
+        if reset:
+            state = {"inode": stat.st_ino, "offset": 0, "records": 0}
+            if fmt == "json":
+                state["transcript_path"] = str(transcript_path)
+
+        records, new_offset = read_new_records(transcript_path, state["offset"])
+        if not records and not reset:
+            return 0
+
+        if fmt == "json":
+            write_json(log_dir, records, reset)
+        elif fmt == "jsonl":
+            write_jsonl(log_dir, records, reset, transcript_path)
+        else:
+            write_archive(log_dir, records, reset, transcript_path, state["records"], state["offset"], new_offset)
+
+        state["offset"] = new_offset
+        state["records"] += len(records)
+        if fmt == "json":
+            all_states["json"] = state
+        else:
+            states[str(transcript_path)] = state
+            # Forget sessions whose transcript is gone (their exports stay)
+            all_states[fmt] = {path: entry for path, entry in states.items() if os.path.exists(path)}
+
+        temp_path = state_path.with_suffix('.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump(all_states, f, indent=2)
+        temp_path.replace(state_path)
+
+    return len(records)
+
+
+def main():
+    """CLI interface for chat export."""
+
+    if len(sys.argv) < 3:
+        print("Usage: chat_export.py <transcript_path> <log_dir> [json|jsonl|archive]", file=sys.stderr)
+        sys.exit(1)
+
+    transcript_path = sys.argv[1]
+    log_dir = sys.argv[2]
+    fmt = sys.argv[3] if len(sys.argv) > 3 else "json"
+
+    if not Path(transcript_path).exists():
+        print(f"Error: Transcript not found: {transcript_path}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        exported = export_chat(transcript_path, log_dir, fmt)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"✅ Exported {exported} new records ({fmt})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Incremental Transcript Index
+
+Keeps a small sidecar index per Claude Code transcript (JSONL) with the byte
+offset processed so far and running aggregates used by the Stop hook's session
+summary. Each update only parses lines appended since the previous one, so
+summarizing a long session no longer re-reads the whole transcript.
+
+Index files live in $TITANIUM_HOME/transcript-index/<sha1 of transcript path>.json
+and are rebuilt automatically if the transcript is replaced or truncated.
+
+Usage:
+    python3 transcript_index.py <transcript_path>
+
+Output:
+    Prints the updated index as JSON
+"""
+
+import hashlib
+import json
+import os
+import sys
+import uuid
+from pathlib import Path
+
+# Constants
+TITANIUM_HOME = Path(os.getenv("TITANIUM_HOME", Path.home() / ".titanium"))
+INDEX_DIR = TITANIUM_HOME / "transcript-index"
+INDEX_VERSION = 1
+
+
+def get_index_path(transcript_path):
+    """Sidecar index location for a transcript."""
+    digest = hashlib.sha1(str(Path(transcript_path).resolve()).encode("utf-8")).hexdigest()
+    return INDEX_DIR / f"{digest}.json"
+
+
+def new_index(transcript_path, inode):
+    """Empty index for a transcript that has not been processed yet."""
+    return {
+        "version": INDEX_VERSION,
+        "transcript_path": str(transcript_path),
+        "inode": inode,
+        "offset": 0,
+        "operation_count": 0,
+        "tool_counts": {},
+        "first_user_request": None,
+        "user_request_count": 0,
+    }
+
+
+def apply_message(index, msg):
+    """Fold one transcript message into the running aggregates."""
+    # Collect user messages
+    if msg.get('role') == 'user':
+        content = msg.get('content', '')
+        if isinstance(content, str) and content.strip():
+            if index["first_user_request"] is None:
+                index["first_user_request"] = content[:100]  # First 100 chars
+            index["user_request_count"] += 1
+
+    # Collect tool uses from content blocks
+    if msg.get('role') == 'assistant':
+        content = msg.get('content', [])
+        if isinstance(content, list):
+            for block in content:
+                if isinstance(block, dict) and block.get('type') == 'tool_use':
+                    name = str(block.get('name'))
+                    index["tool_counts"][name] = index["tool_counts"].get(name, 0) + 1
+                    index["operation_count"] += 1
+
+
+def update_index(transcript_path):
+    """
+    Bring the transcript's index up to date by parsing only new lines.
+
+    A trailing line without a newline is still being written and is left for
+    the next update.
+
+    Args:
+        transcript_path: Path to the transcript JSONL file
+
+    Returns:
+        Index dictionary (see new_index for fields)
+    """
+    stat = os.stat(transcript_path)
+    index_path = get_index_path(transcript_path)
+
+    index = None
+    try:
+        with open(index_path, 'r') as f:
+            index = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    # Rebuild if the transcript was replaced or truncated
+    if (
+        not index
+        or index.get("version") != INDEX_VERSION
+        or index.get("inode") != stat.st_ino
+        or stat.st_size < index.get("offset", 0)
+    ):
+        index = new_index(transcript_path, stat.st_ino)
+
+    if stat.st_size == index["offset"]:
+        return index
+
+    offset = index["offset"]
+    with open(transcript_path, 'rb') as f:
+        f.seek(offset)
+        for raw_line in f:
+            if not raw_line.endswith(b"\n"):
+                break
+            offset += len(raw_line)
+            try:
+                msg = json.loads(raw_line.strip())
+                if isinstance(msg, dict):
+                    apply_message(index, msg)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                pass
+    index["offset"] = offset
+
+    # Atomic write
+    try:
+        INDEX_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = index_path.with_name(f".{index_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(index, f)
+        temp_path.replace(index_path)
+    except OSError:
+        pass  # Still return the fresh aggregates
+
+    return index
+
+
+def main():
+    """CLI interface for inspecting a transcript index."""
+
+    if len(sys.argv) < 2:
+        print("Usage: transcript_index.py <transcript_path>", file=sys.stderr)
+        sys.exit(1)
+
+    transcript_path = sys.argv[1]
+    if not Path(transcript_path).exists():
+        print(f"Error: Transcript not found: {transcript_path}", file=sys.stderr)
+        sys.exit(1)
+
+    print(json.dumps(update_index(transcript_path), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Transcript Tail Reader
+
+Reads a Claude Code transcript (JSONL) backwards from the end in fixed-size
+blocks, so finding recent context costs memory proportional to the block size
+(plus the longest line kept), not the transcript size.
+
+Usage:
+    python3 transcript_tail.py <transcript_path>
+
+Output:
+    Prints the most recent user message
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+# Constants
+BLOCK_SIZE = 64 * 1024
+MAX_LINE_BYTES = 4 * 1024 * 1024  # Longer lines (huge tool output) are skipped
+MAX_SCAN_LINES = 1000
+
+
+def iter_lines_reversed(path, block_size=BLOCK_SIZE, max_line_bytes=MAX_LINE_BYTES):
+    """
+    Yield the file's non-empty lines as bytes, last line first.
+
+    Lines longer than max_line_bytes are skipped rather than buffered.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b""
+        oversized = False
+
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            block = f.read(read_size) + remainder
+
+            lines = block.split(b"\n")
+            remainder = lines.pop(0)  # May continue in the previous block
+
+            if oversized and lines:
+                lines.pop()  # Start of the skipped line
+                oversized = False
+
+            for line in reversed(lines):
+                if line.strip():
+                    yield line
+
+            if len(remainder) > max_line_bytes:
+                remainder = b""
+                oversized = True
+
+        if remainder.strip() and not oversized:
+            yield remainder
+
+
+def find_last_user_message(transcript_path, max_lines=MAX_SCAN_LINES):
+    """
+    Find the most recent user message in a transcript.
+
+    Args:
+        transcript_path: Path to the transcript JSONL file
+        max_lines: Give up after scanning this many lines from the end
+
+    Returns:
+        str: The user message content, or None if not found
+    """
+    for scanned, line in enumerate(iter_lines_reversed(transcript_path)):
+        if scanned >= max_lines:
+            break
+        try:
+            msg = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if isinstance(msg, dict) and msg.get('role') == 'user':
+            content = msg.get('content', '')
+            if isinstance(content, str):
+                return content
+    return None
+
+
+def main():
+    """CLI interface for testing."""
+
+    if len(sys.argv) < 2:
+        print("Usage: transcript_tail.py <transcript_path>", file=sys.stderr)
+        sys.exit(1)
+
+    transcript_path = sys.argv[1]
+    if not Path(transcript_path).exists():
+        print(f"Error: Transcript not found: {transcript_path}", file=sys.stderr)
+        sys.exit(1)
+
+    message = find_last_user_message(transcript_path)
+    if message is None:
+        print("No user message found", file=sys.stderr)
+        sys.exit(1)
+    print(message)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,529 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.8"
+# dependencies = [
+#     "elevenlabs",
+#     "openai",
+#     "python-dotenv",
+# ]
+# ///
+"""
+Announcement Spool
+
+Durable on-disk queue for voice announcements. Hooks enqueue an announcement
+(one small JSON file, atomically renamed into place) and return immediately;
+a single background worker drains the queue and owns all audio playback, so
+hook latency no longer depends on TTS provider latency.
+
+The worker speaks in-process through tts_providers, reusing one SDK client
+(and its HTTPS connections) for every announcement it drains. It runs with the
+plugin runtime (or `uv run --script`) so the provider SDKs are available;
+providers whose SDK is missing fall back to running their TTS script. tts_router picks
+the provider for each announcement when it is spoken, so slow or failing
+providers are skipped even for announcements queued earlier.
+
+PostToolUse events are queued raw and coalesced: the worker waits until no
+new tool event has arrived for TITANIUM_ANNOUNCE_WINDOW_MS, then summarizes
+the whole burst with one LLM call and speaks it once ("Updated 6 files in
+auth") instead of once per Write/Edit.
+
+Announcements are scheduled by priority, then age:
+    urgent       Needs the user's attention (permission requests, idle prompts)
+    completion   Session and subagent completion messages
+    routine      Tool summaries; dropped after TITANIUM_ANNOUNCE_ROUTINE_TTL_SECONDS
+A queued announcement of higher priority interrupts lower-priority playback;
+the interrupted announcement is requeued and dropped if it goes stale.
+
+Queue layout ($TITANIUM_HOME/spool):
+    pending/      Announcements waiting to be spoken (<rank>-<time>-... names,
+                  so name order is priority order, oldest first)
+    processing/   Announcement currently being spoken by the worker
+    worker.lock   Held by the running worker (one worker at a time)
+    worker.log    Worker output
+
+Commands:
+    worker    Drain the queue, exiting after an idle period
+    status    Show queue depth per priority and whether a worker is running
+
+Examples:
+    python3 announce_spool.py status
+    python3 announce_spool.py worker
+
+Environment:
+    TITANIUM_TTS_SPOOL=0            Disable spooling (hooks speak synchronously)
+    TITANIUM_ANNOUNCE_WORKER=0      Queue announcements without starting a worker
+                                    (benchmarks; start one with `worker`)
+    TITANIUM_SPOOL_IDLE_SECONDS     Worker idle time before exiting (default: 30)
+    TITANIUM_SPOOL_MAX_AGE_SECONDS  Drop announcements older than this (default: 300)
+    TITANIUM_ANNOUNCE_WINDOW_MS     Merge tool events arriving within this window
+                                    into one announcement (default: 1500, 0 = off)
+    TITANIUM_ANNOUNCE_MAX_WAIT_MS   Announce a burst after this long even if events
+                                    keep arriving (default: 8000)
+    TITANIUM_ANNOUNCE_ROUTINE_TTL_SECONDS
+                                    Drop routine announcements older than this
+                                    (default: 20)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, hooks speak synchronously
+    fcntl = None
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "metrics"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "runtime"))
+from plugin_runtime import runtime_command
+from hook_metrics import HookTimer
+from audio_player import interrupt_playback, play_audio_file, resume_playback
+from tts_providers import get_provider
+from tts_router import speak_routed
+
+# Constants
+TITANIUM_HOME = Path(os.getenv("TITANIUM_HOME", Path.home() / ".titanium"))
+SPOOL_DIR = TITANIUM_HOME / "spool"
+PENDING_DIR = SPOOL_DIR / "pending"
+PROCESSING_DIR = SPOOL_DIR / "processing"
+LOCK_PATH = SPOOL_DIR / "worker.lock"
+WORKER_LOG_PATH = SPOOL_DIR / "worker.log"
+
+IDLE_SECONDS = float(os.getenv("TITANIUM_SPOOL_IDLE_SECONDS", "30"))
+MAX_AGE_SECONDS = float(os.getenv("TITANIUM_SPOOL_MAX_AGE_SECONDS", "300"))
+POLL_SECONDS = 0.1
+WINDOW_SECONDS = float(os.getenv("TITANIUM_ANNOUNCE_WINDOW_MS", "1500")) / 1000
+MAX_WAIT_SECONDS = float(os.getenv("TITANIUM_ANNOUNCE_MAX_WAIT_MS", "8000")) / 1000
+
+# Priority -> rank (lower is spoken first) and maximum age before dropping
+PRIORITIES = {"urgent": 0, "completion": 1, "routine": 2}
+TTL_SECONDS = {
+    "urgent": MAX_AGE_SECONDS,
+    "completion": MAX_AGE_SECONDS,
+    "routine": float(os.getenv("TITANIUM_ANNOUNCE_ROUTINE_TTL_SECONDS", "20")),
+}
+
+
+def spool_enabled():
+    """Spooling needs advisory locks and can be turned off via TITANIUM_TTS_SPOOL=0."""
+    return fcntl is not None and os.getenv("TITANIUM_TTS_SPOOL", "1") != "0"
+
+
+def enqueue_announcement(text, providers=None, sound=None, source=None, priority="completion"):
+    """
+    Queue an announcement for the background worker.
+
+    Args:
+        text: Text to speak
+        providers: Provider names to try in order (None: routed when spoken)
+        sound: Optional sound file to play before speaking
+        source: Name of the hook that queued the announcement (for the log)
+        priority: "urgent", "completion" or "routine"
+
+    Returns:
+        bool: True if queued, False if spooling is unavailable and the caller
+        should speak synchronously
+    """
+    if not spool_enabled():
+        return False
+
+    return write_entry({
+        "text": text,
+        "providers": providers,
+        "sound": sound,
+        "source": source,
+        "priority": priority,
+        "created_at": time.time(),
+    })
+
+
+def enqueue_tool_event(event, log_dir=None, source=None):
+    """
+    Queue a raw tool event to be merged with others arriving in the same window.
+    Tool events are always routine priority.
+
+    Args:
+        event: Compacted tool event (see tool_summary.compact_event)
+        log_dir: Project logs directory for the voice_announcements log
+        source: Name of the hook that queued the event (for the log)
+
+    Returns:
+        bool: True if queued, False if coalescing is off or spooling is
+        unavailable and the caller should summarize and announce itself
+    """
+    if not spool_enabled() or WINDOW_SECONDS <= 0:
+        return False
+
+    return write_entry({
+        "event": event,
+        "log_dir": str(log_dir) if log_dir else None,
+        "source": source,
+        "priority": "routine",
+        "cwd": os.getcwd(),
+        "created_at": time.time(),
+    })
+
+
+def write_entry(entry):
+    """Atomically add an entry to the queue and make sure a worker is running."""
+    try:
+        PENDING_DIR.mkdir(parents=True, exist_ok=True)
+
+        # Rank then nanosecond prefix: name order is priority order, FIFO within
+        rank = PRIORITIES[entry["priority"]]
+        name = f"{rank}-{time.time_ns()}-{os.getpid()}-{uuid.uuid4().hex[:8]}.json"
+        temp_path = SPOOL_DIR / f".{name}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(entry, f)
+        temp_path.replace(PENDING_DIR / name)
+
+        ensure_worker()
+        return True
+
+    except OSError as e:
+        print(f"Spool error: {e}", file=sys.stderr)
+        return False
+
+
+def worker_running():
+    """Check whether a worker currently holds the spool lock."""
+    SPOOL_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_PATH, 'a') as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return True
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+        return False
+
+
+def ensure_worker():
+    """Start a detached worker unless one is already draining the queue."""
+    if os.getenv("TITANIUM_ANNOUNCE_WORKER", "1") == "0" or worker_running():
+        return
+
+    command = runtime_command(Path(__file__).resolve(), "worker")
+
+    with open(WORKER_LOG_PATH, 'a') as log_file:
+        # Detach fully: the hook's stdout is a pipe Claude Code waits on
+        subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=log_file,
+            start_new_session=True,
+        )
+
+
+def play_entry(entry, timer=None):
+    """
+    Speak one announcement, blocking until playback finishes.
+
+    Args:
+        entry: Queue entry with "text" (and optional "providers", "sound")
+        timer: HookTimer receiving the speak and synthesis phases
+
+    Returns:
+        str: Provider that spoke, or "none"
+    """
+    if entry.get("sound") and os.path.exists(entry["sound"]):
+        play_audio_file(entry["sound"], timeout=2)
+
+    started_at = time.perf_counter()
+    method = speak_routed(entry["text"], entry.get("providers"))
+    if timer is not None:
+        timer.add("speak", (time.perf_counter() - started_at) * 1000)
+        if method:
+            timer.add("synthesis", get_provider(method).last_latency_ms)
+    return method or "none"
+
+
+def pending_entry_paths():
+    """Pending announcement files, oldest first."""
+    try:
+        names = sorted(name for name in os.listdir(PENDING_DIR) if name.endswith(".json"))
+    except FileNotFoundError:
+        return []
+    return [PENDING_DIR / name for name in names]
+
+
+def next_entry_path():
+    """Return the most urgent pending announcement, or None if the queue is empty."""
+    paths = pending_entry_paths()
+    return paths[0] if paths else None
+
+
+def entry_rank(path):
+    """Priority rank encoded in an entry's file name."""
+    prefix = path.name.split("-", 1)[0]
+    return int(prefix) if len(prefix) == 1 else PRIORITIES["completion"]  # Pre-priority entries
+
+
+def more_urgent_pending(rank):
+    """Whether an announcement that outranks rank is waiting."""
+    next_path = next_entry_path()
+    return next_path is not None and entry_rank(next_path) < rank
+
+
+def requeue(processing_path):
+    """Put an interrupted or deferred announcement back in the queue."""
+    try:
+        processing_path.replace(PENDING_DIR / processing_path.name)
+    except OSError:
+        pass
+
+
+def speak_preemptible(speak, rank):
+    """
+    Run speak() while watching the queue, interrupting playback as soon as an
+    announcement that outranks rank is queued.
+
+    Returns:
+        tuple: (speak() result, whether it was preempted)
+    """
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = speak()
+        except Exception as e:
+            print(f"Announcement failed: {e}", flush=True)
+
+    resume_playback()
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+
+    preempted = False
+    while thread.is_alive():
+        thread.join(POLL_SECONDS)
+        if not preempted and thread.is_alive() and more_urgent_pending(rank):
+            interrupt_playback()
+            preempted = True
+
+    resume_playback()
+    return outcome.get("result"), preempted
+
+
+def read_pending_events(cwd):
+    """Pending tool events from the same project, as (path, entry) pairs."""
+    events = []
+    for path in pending_entry_paths():
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        if entry.get("event") and entry.get("cwd") == cwd:
+            events.append((path, entry))
+    return events
+
+
+def collect_burst(first_entry):
+    """
+    Wait for the burst that first_entry started to go quiet, then claim it.
+
+    The burst ends once no tool event from the same project has arrived for
+    WINDOW_SECONDS, or MAX_WAIT_SECONDS after it started.
+
+    Returns:
+        list: (processing path, entry) pairs for the other events in the burst,
+        or None if a more urgent announcement arrived while waiting
+    """
+    cwd = first_entry.get("cwd")
+    while True:
+        if more_urgent_pending(PRIORITIES["routine"]):
+            return None
+        pending = read_pending_events(cwd)
+        last_event_at = max([first_entry["created_at"]] + [entry["created_at"] for _, entry in pending])
+        now = time.time()
+        if now - last_event_at >= WINDOW_SECONDS or now - first_entry["created_at"] >= MAX_WAIT_SECONDS:
+            break
+        time.sleep(POLL_SECONDS)
+
+    burst = []
+    for pending_path, entry in pending:
+        processing_path = PROCESSING_DIR / pending_path.name
+        try:
+            pending_path.replace(processing_path)
+        except OSError:
+            continue
+        burst.append((processing_path, entry))
+    return burst
+
+
+def announce_burst(entries, timer=None):
+    """
+    Summarize a burst of tool events once and speak the summary.
+
+    Returns:
+        tuple: (summary, ai_generated, TTS method used)
+    """
+    from tool_summary import get_burst_summary
+    from usage_ledger import set_source
+    set_source("announce_worker")
+
+    started_at = time.perf_counter()
+    summary, ai_generated = get_burst_summary([entry["event"] for entry in entries])
+    if timer is not None:
+        timer.add("summary", (time.perf_counter() - started_at) * 1000)
+    method = play_entry({"text": summary}, timer)
+    return summary, ai_generated, method
+
+
+def log_burst(entries, summary, ai_generated, method):
+    """Record a burst announcement in the project's voice_announcements log."""
+    log_dir = entries[0].get("log_dir")
+    if not log_dir:
+        return
+
+    events = [entry["event"] for entry in entries]
+    try:
+        sys.path.insert(0, str(Path(__file__).parent.parent / "logs"))
+        from log_store import append_log
+
+        append_log(log_dir, "voice_announcements", {
+            "timestamp": datetime.now().isoformat(),
+            "tool": events[0]["tool_name"] if len(events) == 1 else sorted({e["tool_name"] for e in events}),
+            "events": len(events),
+            "summary": summary,
+            "ai_generated": ai_generated,
+            "tts_method": method,
+        })
+    except OSError as e:
+        print(f"Log error: {e}", flush=True)
+
+
+def run_worker():
+    """Drain the queue until it has been idle for IDLE_SECONDS."""
+    PENDING_DIR.mkdir(parents=True, exist_ok=True)
+    PROCESSING_DIR.mkdir(parents=True, exist_ok=True)
+
+    with open(LOCK_PATH, 'a') as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return  # Another worker owns the queue
+
+        # Requeue anything a previous worker was speaking when it died
+        for path in PROCESSING_DIR.glob("*.json"):
+            path.replace(PENDING_DIR / path.name)
+
+        while True:
+            drain_queue()
+
+            # An entry enqueued while we still held the lock found a worker
+            # running and started none; check again after releasing it
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            if next_entry_path() is None:
+                return
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return  # A new worker took over
+
+
+def drain_queue():
+    """Speak queued entries until the queue has been idle for IDLE_SECONDS."""
+    idle_since = time.monotonic()
+    while time.monotonic() - idle_since < IDLE_SECONDS:
+        pending_path = next_entry_path()
+        if pending_path is None:
+            time.sleep(POLL_SECONDS)
+            continue
+
+        processing_path = PROCESSING_DIR / pending_path.name
+        try:
+            pending_path.replace(processing_path)
+            with open(processing_path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Skipping unreadable announcement {pending_path.name}: {e}", flush=True)
+            processing_path.unlink(missing_ok=True)
+            continue
+
+        priority = entry.get("priority", "completion")
+        rank = PRIORITIES.get(priority, PRIORITIES["completion"])
+        age = time.time() - entry.get("created_at", 0)
+        timer = HookTimer("announce_worker")
+        timer.add("queue_wait", age * 1000)
+
+        if age > TTL_SECONDS.get(priority, MAX_AGE_SECONDS):
+            print(f"Dropped stale {priority} announcement ({age:.0f}s old): {entry.get('text') or entry.get('event')}", flush=True)
+
+        elif entry.get("event"):
+            burst = collect_burst(entry)
+            if burst is None:
+                requeue(processing_path)  # Speak the urgent announcement first
+                continue
+
+            burst_entries = [entry] + [burst_entry for _, burst_entry in burst]
+            outcome, preempted = speak_preemptible(lambda: announce_burst(burst_entries, timer), rank)
+            if preempted:
+                for burst_path, _ in burst:
+                    requeue(burst_path)
+                requeue(processing_path)
+                print(f"Preempted {len(burst_entries)} tool events, requeued", flush=True)
+                continue
+
+            for burst_path, _ in burst:
+                burst_path.unlink(missing_ok=True)
+            if outcome:
+                summary, ai_generated, method = outcome
+                log_burst(burst_entries, summary, ai_generated, method)
+                timer.flush(priority=priority, events=len(burst_entries), provider=method)
+                print(f"Announced {len(burst_entries)} tool events via {method} [{entry.get('source')}]: {summary}", flush=True)
+
+        else:
+            method, preempted = speak_preemptible(lambda: play_entry(entry, timer), rank)
+            if preempted:
+                requeue(processing_path)
+                print(f"Preempted {priority} announcement, requeued: {entry.get('text')}", flush=True)
+                continue
+            timer.flush(priority=priority, provider=method)
+            print(f"Announced via {method} [{entry.get('source')}]: {entry.get('text')}", flush=True)
+
+        processing_path.unlink(missing_ok=True)
+        idle_since = time.monotonic()
+
+
+def main():
+    """CLI interface for the announcement spool."""
+
+    if fcntl is None:
+        print("Error: announcement spool requires fcntl (not available on this platform)", file=sys.stderr)
+        sys.exit(1)
+
+    if len(sys.argv) < 2:
+        print("Usage: announce_spool.py <worker|status>", file=sys.stderr)
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == "worker":
+        run_worker()
+    elif command == "status":
+        by_priority = {priority: 0 for priority in PRIORITIES}
+        ranks = {rank: priority for priority, rank in PRIORITIES.items()}
+        for path in pending_entry_paths():
+            by_priority[ranks.get(entry_rank(path), "completion")] += 1
+        print(json.dumps({
+            "pending": sum(by_priority.values()),
+            "pending_by_priority": by_priority,
+            "worker_running": worker_running(),
+            "spool_dir": str(SPOOL_DIR),
+        }, indent=2))
+    else:
+        print(f"Error: Unknown command: {command}", file=sys.stderr)
+        print("\nValid commands: worker, status", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
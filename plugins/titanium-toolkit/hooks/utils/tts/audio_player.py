@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Audio Player Helpers
+
+Plays audio files with whichever system player is available, so cached or
+pre-rendered audio can be played without importing any provider SDK, and
+pipes streamed audio chunks into a player that decodes from stdin.
+
+Only players the capability probe found installed are tried. Players are
+tracked per process so a scheduler (the announcement worker) can interrupt
+whatever is playing when something more urgent arrives.
+
+Usage:
+    python3 audio_player.py <audio_file>
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "probe"))
+from capability_probe import has_binary
+
+# Players started by this process, stopped by interrupt_playback()
+_active_players = set()
+_players_lock = threading.Lock()
+_interrupted = threading.Event()
+
+
+def start_player(cmd, **kwargs):
+    """
+    Start a player process and track it for interrupt_playback().
+
+    Players run in their own session so interrupting also stops anything they
+    spawned (e.g. `uv run` running a TTS script).
+
+    Returns:
+        subprocess.Popen, or None if playback is currently interrupted
+
+    Raises:
+        FileNotFoundError: If the player is not installed
+    """
+    with _players_lock:
+        if _interrupted.is_set():
+            return None
+        player = subprocess.Popen(cmd, start_new_session=(sys.platform != "win32"), **kwargs)
+        _active_players.add(player)
+    return player
+
+
+def finish_player(player):
+    """Stop tracking a player that has exited."""
+    with _players_lock:
+        _active_players.discard(player)
+
+
+def interrupt_playback():
+    """Stop all playback and refuse new playback until resume_playback()."""
+    with _players_lock:
+        _interrupted.set()
+        for player in _active_players:
+            try:
+                if sys.platform == "win32":
+                    player.terminate()
+                else:
+                    os.killpg(player.pid, signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
+                pass
+
+
+def resume_playback():
+    """Allow playback again after interrupt_playback()."""
+    _interrupted.clear()
+
+
+def playback_interrupted():
+    """Whether playback is currently interrupted."""
+    return _interrupted.is_set()
+
+
+def get_file_player_commands(audio_path):
+    """Installed player commands for the current platform, in preference order."""
+    audio_path = str(audio_path)
+
+    if sys.platform == "win32":  # Windows: `start` is a shell builtin
+        return [["start", audio_path]]
+
+    if sys.platform == "darwin":  # macOS
+        commands = [["afplay", audio_path]]
+    else:  # Linux and others
+        commands = [
+            ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", audio_path],
+            ["mpv", "--no-video", "--really-quiet", audio_path],
+            ["aplay", audio_path],
+        ]
+    return [cmd for cmd in commands if has_binary(cmd[0])]
+
+
+def file_player_installed():
+    """Whether any player that can play an audio file is installed."""
+    return bool(get_file_player_commands("audio.mp3"))
+
+
+def play_audio_file(audio_path, timeout=60):
+    """
+    Play an audio file, blocking until playback finishes.
+
+    Args:
+        audio_path: Path to the audio file
+        timeout: Maximum playback time in seconds
+
+    Returns:
+        bool: True if a player ran successfully
+    """
+    for cmd in get_file_player_commands(audio_path):
+        try:
+            player = start_player(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                shell=(sys.platform == "win32"),
+            )
+        except FileNotFoundError:
+            continue
+        if player is None:
+            return False
+
+        try:
+            returncode = player.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            player.kill()
+            player.wait()
+            return False
+        finally:
+            finish_player(player)
+
+        if returncode == 0:
+            return True
+        if playback_interrupted():
+            return False
+    return False
+
+
+def get_stream_player_commands():
+    """Installed players that can decode MP3 from stdin as it arrives, in preference order."""
+    commands = [
+        ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", "-i", "-"],
+        ["mpv", "--no-video", "--really-quiet", "--no-cache", "-"],
+    ]
+    return [cmd for cmd in commands if has_binary(cmd[0])]
+
+
+def stream_audio(chunks, started_at=None, timeout=60):
+    """
+    Pipe audio chunks into a streaming player as they arrive.
+
+    The player is started before the first chunk is requested so its startup
+    overlaps the provider's network latency.
+
+    Args:
+        chunks: Iterable of audio byte chunks (consumed lazily)
+        started_at: time.monotonic() when the TTS request began (default: now)
+        timeout: Maximum time to wait for playback to finish after the last chunk
+
+    Returns:
+        tuple: (complete audio bytes, time to first audio in ms: until the
+        player accepted the first chunk), or None if no streaming player is
+        installed or playback is interrupted
+
+    Raises:
+        RuntimeError: If no audio arrived, or the player failed, exited before
+        taking any audio or timed out (nothing was heard; don't cache it)
+    """
+    started_at = time.monotonic() if started_at is None else started_at
+
+    commands = get_stream_player_commands()
+    if not commands:
+        return None
+    cmd = commands[0]
+
+    player = start_player(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    if player is None:
+        return None
+
+    audio = bytearray()
+    ttfa_ms = None
+    timed_out = False
+    try:
+        for chunk in chunks:
+            if not chunk:
+                continue
+            audio.extend(chunk)
+            if player.poll() is None:
+                try:
+                    player.stdin.write(chunk)
+                    player.stdin.flush()
+                except BrokenPipeError:
+                    continue  # Player exited early; its exit status decides below
+                if ttfa_ms is None:
+                    ttfa_ms = (time.monotonic() - started_at) * 1000
+    finally:
+        try:
+            player.stdin.close()
+        except BrokenPipeError:
+            pass
+        try:
+            player.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            player.kill()
+            player.wait()
+            timed_out = True
+        finish_player(player)
+
+    if playback_interrupted():
+        return None
+    if not audio:
+        raise RuntimeError("No audio received from the provider")
+    if timed_out:
+        raise RuntimeError(f"{cmd[0]} did not finish within {timeout}s")
+    if player.returncode != 0:
+        raise RuntimeError(f"{cmd[0]} exited with status {player.returncode}")
+    if ttfa_ms is None:
+        raise RuntimeError(f"{cmd[0]} exited before taking any audio")
+
+    return bytes(audio), ttfa_ms
+
+
+def main():
+    """Command line interface for testing."""
+    if len(sys.argv) < 2:
+        print("Usage: audio_player.py <audio_file>", file=sys.stderr)
+        sys.exit(1)
+
+    audio_path = Path(sys.argv[1])
+    if not audio_path.exists():
+        print(f"Error: Audio file not found: {audio_path}", file=sys.stderr)
+        sys.exit(1)
+
+    if not play_audio_file(audio_path):
+        print("Error: No working audio player found", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,13 @@
 
 import os
 import sys
-import json
 import subprocess
 from pathlib import Path
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).parent))
+from tts_providers import get_provider
+
 
 def main():
     """
@@ -49,55 +51,17 @@ def main():
         print("🔊 Generating and playing via MCP...")
         
         try:
-            # Use Claude Code CLI to invoke ElevenLabs MCP
-            # This assumes the ElevenLabs MCP server is configured in Claude Code
-            claude_cmd = [
-                "claude", "mcp", "call", "ElevenLabs", "text_to_speech",
-                "--text", text,
-                "--voice_name", "Adam",  # Default voice
-                "--model_id", "eleven_turbo_v2_5",  # Fast model
-                "--output_directory", str(Path.home() / "Desktop"),
-                "--speed", "1.0",
-                "--stability", "0.5",
-                "--similarity_boost", "0.75"
-            ]
-            
-            # Try to run the Claude MCP command
-            result = subprocess.run(
-                claude_cmd,
-                capture_output=True,
-                text=True,
-                timeout=15  # 15-second timeout for TTS generation
-            )
-            
-            if result.returncode == 0:
+            # Calls the ElevenLabs MCP server configured in Claude Code,
+            # then plays the file it wrote to the Desktop
+            if get_provider("elevenlabs_mcp").speak(text):
                 print("✅ TTS generated and played via MCP!")
-                
-                # Try to play the generated audio file
-                # Look for recently created audio files on Desktop
-                desktop = Path.home() / "Desktop"
-                audio_files = list(desktop.glob("*.mp3"))
-                
-                if audio_files:
-                    # Find the most recent audio file
-                    latest_audio = max(audio_files, key=lambda f: f.stat().st_mtime)
-                    
-                    # Try to play with system default audio player
-                    if sys.platform == "darwin":  # macOS
-                        subprocess.run(["afplay", str(latest_audio)], capture_output=True)
-                    elif sys.platform == "linux":  # Linux
-                        subprocess.run(["aplay", str(latest_audio)], capture_output=True)
-                    elif sys.platform == "win32":  # Windows
-                        subprocess.run(["start", str(latest_audio)], shell=True, capture_output=True)
-                    
-                    print("🎵 Audio playback attempted")
-                else:
-                    print("⚠️  Audio file not found on Desktop")
             else:
-                print(f"❌ MCP Error: {result.stderr}")
-                # Fall back to simple notification
-                print("🔔 TTS via MCP failed - task completion noted")
-                
+                print("⚠️  Audio file not found on Desktop")
+
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            # Fall back to simple notification
+            print("🔔 TTS via MCP failed - task completion noted")
         except subprocess.TimeoutExpired:
             print("⏰ MCP TTS timed out - continuing...")
         except FileNotFoundError:
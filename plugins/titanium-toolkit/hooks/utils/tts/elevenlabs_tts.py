@@ -12,72 +12,71 @@ import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).parent))
+from tts_providers import get_provider
+
+
 def main():
     """
     ElevenLabs Turbo v2.5 TTS Script
-    
+
     Uses ElevenLabs' Turbo v2.5 model for fast, high-quality text-to-speech.
     Accepts optional text prompt as command-line argument.
-    
+
     Usage:
-    - ./elevenlabs_tts.py                    # Uses default text
-    - ./elevenlabs_tts.py "Your custom text" # Uses provided text
-    
+    - ./elevenlabs_tts.py                             # Uses default text
+    - ./elevenlabs_tts.py "Your custom text"          # Uses provided text
+    - ./elevenlabs_tts.py --stream "Your custom text" # Plays while downloading
+
+    Streaming is also enabled with TITANIUM_TTS_STREAM=1. Synthesis and
+    playback live in tts_providers.ElevenLabsProvider.
+
     Features:
     - Fast generation (optimized for real-time use)
     - High-quality voice synthesis
     - Stable production model
     - Cost-effective for high-volume usage
+    - Cached phrases play from disk without a network call
+    - Optional streaming playback for long summaries
     """
-    
+
     # Load environment variables
     load_dotenv()
-    
-    # Get API key from environment
-    api_key = os.getenv('ELEVENLABS_API_KEY')
-    if not api_key:
+
+    args = sys.argv[1:]
+    stream = os.getenv("TITANIUM_TTS_STREAM", "0") == "1"
+    if args and args[0] == "--stream":
+        stream = True
+        args = args[1:]
+
+    # Get text from command line argument or use default
+    if args:
+        text = " ".join(args)  # Join all arguments as text
+    else:
+        text = "Task completed successfully."
+
+    provider = get_provider("elevenlabs")
+
+    # Cached phrases need no API key
+    if not provider.get_cached(text) and not provider.available():
         print("❌ Error: ELEVENLABS_API_KEY not found in environment variables", file=sys.stderr)
         print("Please add your ElevenLabs API key to .env file:", file=sys.stderr)
         print("ELEVENLABS_API_KEY=your_api_key_here", file=sys.stderr)
         sys.exit(1)
-    
+
     try:
-        from elevenlabs.client import ElevenLabs
-        from elevenlabs.play import play
-        
-        # Initialize client
-        elevenlabs = ElevenLabs(api_key=api_key)
-        
-        # Get text from command line argument or use default
-        if len(sys.argv) > 1:
-            text = " ".join(sys.argv[1:])  # Join all arguments as text
-        else:
-            text = "Task completed successfully."
-        
-        try:
-            # Generate and play audio directly
-            audio = elevenlabs.text_to_speech.convert(
-                text=text,
-                voice_id="EXAVITQu4vr4xnSDxMaL",  # Sarah voice
-                model_id="eleven_turbo_v2_5",
-                output_format="mp3_44100_128",
-            )
-            
-            play(audio)
-            
-        except Exception as e:
-            print(f"❌ Error: {e}", file=sys.stderr)
+        if not provider.speak(text, stream=stream):
+            print("❌ Error: no audio player available", file=sys.stderr)
             sys.exit(1)
-        
-        
+
     except ImportError:
         print("❌ Error: elevenlabs package not installed", file=sys.stderr)
         print("This script uses UV to auto-install dependencies.", file=sys.stderr)
         print("Make sure UV is installed: https://docs.astral.sh/uv/", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
-        print(f"❌ Unexpected error: {e}", file=sys.stderr)
+        print(f"❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
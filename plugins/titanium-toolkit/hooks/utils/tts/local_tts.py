@@ -9,6 +9,10 @@
 import sys
 import random
 import os
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from tts_providers import get_provider
 
 
 def main():
@@ -31,15 +35,6 @@ def main():
     """
     
     try:
-        import pyttsx3
-        
-        # Initialize TTS engine
-        engine = pyttsx3.init()
-        
-        # Configure engine settings
-        engine.setProperty('rate', 180)    # Speech rate (words per minute)
-        engine.setProperty('volume', 0.9)  # Volume (0.0 to 1.0)
-        
         print("🎙️  Local TTS")
         print("=" * 12)
         
@@ -74,9 +69,8 @@ def main():
         print(f"🎯 Text: {text}")
         print("🔊 Speaking...")
         
-        # Speak the text
-        engine.say(text)
-        engine.runAndWait()
+        # Speak the text (engine settings live in tts_providers.LocalProvider)
+        get_provider("local").speak(text)
         
         print("✅ Playback complete!")
         
@@ -9,12 +9,14 @@
 
 import os
 import sys
-import asyncio
 from pathlib import Path
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).parent))
+from tts_providers import get_provider
 
-async def main():
+
+def main():
     """
     OpenAI TTS Script
 
@@ -22,88 +24,58 @@ async def main():
     Accepts optional text prompt as command-line argument.
 
     Usage:
-    - ./openai_tts.py                    # Uses default text
-    - ./openai_tts.py "Your custom text" # Uses provided text
+    - ./openai_tts.py                             # Uses default text
+    - ./openai_tts.py "Your custom text"          # Uses provided text
+    - ./openai_tts.py --stream "Your custom text" # Plays while downloading
+
+    Streaming is also enabled with TITANIUM_TTS_STREAM=1. Synthesis and
+    playback live in tts_providers.OpenAIProvider.
 
     Features:
     - OpenAI TTS-1 model (fast and reliable)
     - Nova voice (engaging and warm)
     - Direct audio streaming and playback
     - Optimized for hook usage
+    - Cached phrases play from disk without a network call
     """
 
     # Load environment variables
     load_dotenv()
 
-    # Get API key from environment
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        print("❌ Error: OPENAI_API_KEY not found in environment variables")
+    args = sys.argv[1:]
+    stream = os.getenv("TITANIUM_TTS_STREAM", "0") == "1"
+    if args and args[0] == "--stream":
+        stream = True
+        args = args[1:]
+
+    text = " ".join(args) if args else "Task completed successfully!"
+    provider = get_provider("openai")
+
+    # Cached phrases need no API key
+    if not provider.get_cached(text) and not provider.available():
+        print("❌ Error: OPENAI_API_KEY not found in environment variables", file=sys.stderr)
         sys.exit(1)
 
+    print("🎙️  OpenAI TTS")
+    print("=" * 15)
+
+    print(f"🎯 Text: {text}")
+    print("🔊 Generating audio...")
+
     try:
-        from openai import AsyncOpenAI
-
-        # Initialize OpenAI client
-        openai = AsyncOpenAI(api_key=api_key)
-
-        print("🎙️  OpenAI TTS")
-        print("=" * 15)
-
-        # Get text from command line argument or use default
-        if len(sys.argv) > 1:
-            text = " ".join(sys.argv[1:])  # Join all arguments as text
-        else:
-            text = "Task completed successfully!"
-
-        print(f"🎯 Text: {text}")
-        print("🔊 Generating audio...")
-
-        try:
-            # Generate audio using OpenAI TTS
-            response = await openai.audio.speech.create(
-                model="tts-1",
-                voice="nova",
-                input=text,
-                response_format="mp3",
-            )
-            
-            # Save to temporary file
-            audio_file = Path.home() / "Desktop" / "tts_completion.mp3"
-            with open(audio_file, "wb") as f:
-                async for chunk in response.iter_bytes():
-                    f.write(chunk)
-            
-            print("🎵 Playing audio...")
-            
-            # Play the audio file
-            import subprocess
-            if sys.platform == "darwin":  # macOS
-                subprocess.run(["afplay", str(audio_file)], capture_output=True)
-            elif sys.platform == "linux":  # Linux
-                subprocess.run(["aplay", str(audio_file)], capture_output=True)
-            elif sys.platform == "win32":  # Windows
-                subprocess.run(["start", str(audio_file)], shell=True, capture_output=True)
-
-            print("✅ Playback complete!")
-            
-            # Clean up the temporary file
-            try:
-                audio_file.unlink()
-            except:
-                pass
-
-        except Exception as e:
-            print(f"❌ Error: {e}")
-
-    except ImportError as e:
-        print("❌ Error: Required package not installed")
-        print("This script uses UV to auto-install dependencies.")
+        if not provider.speak(text, stream=stream):
+            print("❌ Error: no audio player available", file=sys.stderr)
+            sys.exit(1)
+        print("✅ Playback complete!")
+
+    except ImportError:
+        print("❌ Error: Required package not installed", file=sys.stderr)
+        print("This script uses UV to auto-install dependencies.", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        print(f"❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
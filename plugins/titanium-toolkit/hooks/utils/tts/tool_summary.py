@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Tool Completion Summaries
+
+Short voice-announcement summaries for PostToolUse events, shared by the
+PostToolUse hook (one event) and the announcement worker (a coalesced burst
+of events, e.g. "Updated 6 files in auth").
+
+Usage:
+    python3 tool_summary.py < events.json
+
+Input:
+    JSON list of {"tool_name", "tool_input", "tool_response"} events
+
+Output:
+    Prints the burst summary
+"""
+
+import json
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "llm"))
+from llm_client import complete, llm_available
+
+# Constants
+MAX_PROMPT_CHARS = 500
+MAX_OUTPUT_CHARS = 200
+MAX_BURST_LINES = 20
+
+
+def compact_event(tool_name, tool_input, tool_response):
+    """
+    Keep only the fields summaries use, so queued events stay small
+    (Write inputs carry whole file contents).
+    """
+    tool_input = tool_input or {}
+    compact_input = {}
+    for key in ("file_path", "description"):
+        if key in tool_input:
+            compact_input[key] = str(tool_input[key])
+    if "prompt" in tool_input:
+        compact_input["prompt"] = str(tool_input["prompt"])[:MAX_PROMPT_CHARS]
+
+    compact_response = {}
+    if isinstance(tool_response, dict) and "output" in tool_response:
+        compact_response["output"] = str(tool_response["output"])[:MAX_OUTPUT_CHARS]
+
+    return {"tool_name": tool_name, "tool_input": compact_input, "tool_response": compact_response}
+
+
+def get_simple_summary(tool_name, tool_input, tool_response):
+    """
+    Create a simple summary without LLM first
+    """
+    if tool_name == "Task":
+        # Extract task description
+        task_desc = ""
+        if "prompt" in tool_input:
+            task_desc = tool_input['prompt']
+        elif "description" in tool_input:
+            task_desc = tool_input['description']
+        
+        # Extract agent name if present
+        if ':' in task_desc:
+            parts = task_desc.split(':', 1)
+            agent_name = parts[0].strip()
+            task_detail = parts[1].strip() if len(parts) > 1 else ""
+            # Shorten task detail
+            if len(task_detail) > 30:
+                task_detail = task_detail[:30] + "..."
+            return f"{agent_name} completed {task_detail}"
+        return "Agent task completed"
+    
+    elif tool_name == "Write":
+        file_path = tool_input.get("file_path", "")
+        if file_path:
+            file_name = Path(file_path).name
+            return f"Created {file_name}"
+        return "File created"
+    
+    elif tool_name in ["Edit", "MultiEdit"]:
+        file_path = tool_input.get("file_path", "")
+        if file_path:
+            file_name = Path(file_path).name
+            return f"Updated {file_name}"
+        return "File updated"
+    
+    return f"{tool_name} completed"
+
+
+def get_ai_summary(tool_name, tool_input, tool_response):
+    """
+    Use an LLM (GPT-5 nano, or Claude Haiku as fallback) to create a better summary
+    """
+    if not llm_available():
+        return None
+    
+    try:
+        # Build context
+        context = f"Tool: {tool_name}\n"
+        
+        if tool_name == "Task":
+            task_desc = tool_input.get("prompt", tool_input.get("description", ""))
+            context += f"Task: {task_desc}\n"
+            if tool_response and "output" in tool_response:
+                # Truncate output if too long
+                output = str(tool_response["output"])[:200]
+                context += f"Result: {output}\n"
+        
+        elif tool_name == "Write":
+            file_path = tool_input.get("file_path", "")
+            context += f"File: {file_path}\n"
+            context += "Action: Created new file\n"
+        
+        elif tool_name in ["Edit", "MultiEdit"]:
+            file_path = tool_input.get("file_path", "")
+            context += f"File: {file_path}\n"
+            context += "Action: Modified existing file\n"
+        
+        prompt = f"""Create a 3-7 word summary of this tool completion for voice announcement.
+Be specific about what was accomplished.
+
+{context}
+
+Examples of good summaries:
+- "Created user authentication module"
+- "Updated API endpoints"
+- "Documentation generator built"
+- "Fixed validation errors"
+- "Database schema created"
+
+Summary:"""
+        
+        summary = complete(prompt, max_tokens=15, hedge=True, cache=True)
+        # Remove quotes if present
+        return summary.strip('"').strip("'") if summary else None
+        
+    except Exception as e:
+        print(f"AI summary error: {e}", file=sys.stderr)
+        return None
+
+
+def get_burst_location(events):
+    """Name of the deepest directory shared by the burst's files, or None."""
+    parents = [str(Path(e["tool_input"]["file_path"]).parent) for e in events if e["tool_input"].get("file_path")]
+    if not parents:
+        return None
+    try:
+        common = Path(os.path.commonpath(parents))
+    except ValueError:
+        return None  # Mixed absolute/relative or different drives
+    return common.name or None
+
+
+def get_simple_burst_summary(events):
+    """
+    Create a burst summary without LLM, e.g. "Updated 6 files in auth".
+    """
+    actions = Counter()
+    for event in events:
+        if event["tool_name"] == "Write":
+            actions["created"] += 1
+        elif event["tool_name"] in ["Edit", "MultiEdit"]:
+            actions["updated"] += 1
+        elif event["tool_name"] == "Task":
+            actions["tasks"] += 1
+        else:
+            actions["other"] += 1
+
+    parts = []
+    files = actions["created"] + actions["updated"]
+    if files:
+        if actions["created"] and actions["updated"]:
+            phrase = f"Created {actions['created']} and updated {actions['updated']} files"
+        elif actions["created"]:
+            phrase = f"Created {files} files" if files > 1 else "Created 1 file"
+        else:
+            phrase = f"Updated {files} files" if files > 1 else "Updated 1 file"
+        location = get_burst_location(events)
+        parts.append(f"{phrase} in {location}" if location else phrase)
+    if actions["tasks"]:
+        parts.append(f"{actions['tasks']} agent tasks completed" if actions["tasks"] > 1 else "Agent task completed")
+    if actions["other"]:
+        parts.append(f"{actions['other']} other tools completed" if actions["other"] > 1 else "1 other tool completed")
+    return ", ".join(parts)
+
+
+def get_ai_burst_summary(events):
+    """
+    Use an LLM to summarize a burst of tool completions in one call
+    """
+    if not llm_available():
+        return None
+
+    try:
+        lines = []
+        for event in events[:MAX_BURST_LINES]:
+            tool_input = event["tool_input"]
+            detail = tool_input.get("file_path") or tool_input.get("description") or tool_input.get("prompt", "")
+            lines.append(f"- {event['tool_name']}: {detail[:100]}")
+        if len(events) > MAX_BURST_LINES:
+            lines.append(f"- ... and {len(events) - MAX_BURST_LINES} more")
+        context = "\n".join(lines)
+
+        prompt = f"""Create a 3-8 word summary of these {len(events)} tool completions for one voice announcement.
+Describe the work as a whole, not each step.
+
+{context}
+
+Examples of good summaries:
+- "Updated 6 files in auth module"
+- "Created API route handlers"
+- "Refactored database models"
+
+Summary:"""
+
+        summary = complete(prompt, max_tokens=20, cache=True)
+        # Remove quotes if present
+        return summary.strip('"').strip("'") if summary else None
+
+    except Exception as e:
+        print(f"AI summary error: {e}", file=sys.stderr)
+        return None
+
+
+def get_burst_summary(events):
+    """
+    Summarize one or more compacted tool events with a single LLM call.
+
+    Returns:
+        tuple: (summary, ai_generated)
+    """
+    if len(events) == 1:
+        event = events[0]
+        summary = get_ai_summary(event["tool_name"], event["tool_input"], event["tool_response"])
+        if summary:
+            return summary, True
+        return get_simple_summary(event["tool_name"], event["tool_input"], event["tool_response"]), False
+
+    summary = get_ai_burst_summary(events)
+    if summary:
+        return summary, True
+    return get_simple_burst_summary(events), False
+
+
+def main():
+    """CLI interface for testing burst summaries."""
+
+    try:
+        events = json.load(sys.stdin)
+    except json.JSONDecodeError as e:
+        print(f"Error: invalid JSON: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if not isinstance(events, list) or not events:
+        print("Error: expected a non-empty JSON list of events", file=sys.stderr)
+        sys.exit(1)
+
+    events = [compact_event(e.get("tool_name", ""), e.get("tool_input"), e.get("tool_response")) for e in events]
+    summary, ai_generated = get_burst_summary(events)
+    print(f"{summary}{' (AI)' if ai_generated else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.8"
+# dependencies = [
+#     "elevenlabs",
+#     "openai",
+#     "python-dotenv",
+# ]
+# ///
+
+"""
+TTS Audio Cache
+
+Content-addressed cache of synthesized speech. Audio is keyed by
+(provider, voice_id, model_id, output_format, text) and stored as plain audio
+files, so repeated phrases ("Subagent Complete", "All done!", "Updated app.py")
+play from disk with zero network round trips.
+
+Eviction is least-recently-used: a cache hit refreshes the file's mtime and
+the oldest files are removed once the cache exceeds its size cap.
+
+Commands:
+    prewarm [--provider elevenlabs|openai] [phrase ...]   Render known phrases
+    stats                                                 Show cache usage
+    clear                                                 Delete all cached audio
+
+Examples:
+    uv run tts_cache.py prewarm
+    uv run tts_cache.py prewarm --provider openai "Deploy finished"
+    uv run tts_cache.py stats
+
+Environment:
+    TITANIUM_TTS_CACHE_MB   Cache size cap in megabytes (default: 50, 0 disables)
+"""
+
+import hashlib
+import json
+import os
+import sys
+import uuid
+from pathlib import Path
+
+# Constants
+TITANIUM_HOME = Path(os.getenv("TITANIUM_HOME", Path.home() / ".titanium"))
+CACHE_DIR = TITANIUM_HOME / "tts-cache"
+MAX_BYTES = int(float(os.getenv("TITANIUM_TTS_CACHE_MB", "50")) * 1024 * 1024)
+
+# Fixed phrases spoken by the hooks (stop.get_completion_messages,
+# subagent_stop, notification.get_notification_message)
+KNOWN_PHRASES = [
+    "Subagent Complete",
+    "Work complete!",
+    "All done!",
+    "Task finished!",
+    "Job complete!",
+    "Ready for next task!",
+    "Claude needs your permission",
+    "Waiting for your response",
+    "Claude is ready",
+]
+
+
+def cache_key(provider, voice_id, model_id, output_format, text):
+    """Stable content hash for one synthesized utterance."""
+    material = json.dumps([provider, voice_id, model_id, output_format, text.strip()])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def cache_path(provider, voice_id, model_id, output_format, text):
+    """Location of the cached audio file (extension from the output format)."""
+    extension = output_format.split("_")[0]
+    return CACHE_DIR / f"{cache_key(provider, voice_id, model_id, output_format, text)}.{extension}"
+
+
+def get_cached_audio(provider, voice_id, model_id, output_format, text):
+    """
+    Look up cached audio and mark it as recently used.
+
+    Returns:
+        Path: Cached audio file, or None on a miss
+    """
+    if MAX_BYTES <= 0:
+        return None
+
+    path = cache_path(provider, voice_id, model_id, output_format, text)
+    try:
+        os.utime(path)  # Refresh LRU position
+    except FileNotFoundError:
+        return None
+    return path
+
+
+def store_audio(provider, voice_id, model_id, output_format, text, audio):
+    """
+    Store synthesized audio and evict old entries if over the size cap.
+
+    Args:
+        audio: Audio bytes
+
+    Returns:
+        Path: Cached audio file, or None if caching is disabled
+    """
+    if MAX_BYTES <= 0 or not audio:
+        return None
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = cache_path(provider, voice_id, model_id, output_format, text)
+
+    # Atomic write so a concurrent reader never plays a partial file
+    temp_path = CACHE_DIR / f".{uuid.uuid4().hex}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(audio)
+    temp_path.replace(path)
+
+    evict(keep=path)
+    return path
+
+
+def list_entries():
+    """Cached audio files as (path, size, mtime), oldest first."""
+    entries = []
+    if not CACHE_DIR.exists():
+        return entries
+    for path in CACHE_DIR.iterdir():
+        if path.name.startswith("."):
+            continue
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((path, stat.st_size, stat.st_mtime))
+    entries.sort(key=lambda entry: entry[2])
+    return entries
+
+
+def evict(max_bytes=None, keep=None):
+    """
+    Remove least-recently-used files until the cache fits in max_bytes.
+
+    Returns:
+        int: Number of files removed
+    """
+    max_bytes = MAX_BYTES if max_bytes is None else max_bytes
+    entries = list_entries()
+    total = sum(size for _, size, _ in entries)
+
+    removed = 0
+    for path, size, _ in entries:
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            path.unlink()
+            total -= size
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def prewarm(provider, phrases):
+    """Synthesize phrases that are not cached yet using the given provider."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from tts_providers import get_provider
+
+    if provider not in ("elevenlabs", "openai"):
+        print(f"Error: Unknown provider: {provider}", file=sys.stderr)
+        sys.exit(1)
+    tts_provider = get_provider(provider)
+
+    rendered = 0
+    for phrase in phrases:
+        if tts_provider.get_cached(phrase):
+            print(f"✓ cached: {phrase}")
+            continue
+        try:
+            tts_provider.store(phrase, tts_provider.synthesize(phrase))
+            rendered += 1
+            print(f"🎙️  rendered: {phrase}")
+        except Exception as e:
+            print(f"❌ {phrase}: {e}", file=sys.stderr)
+
+    print(f"✅ Prewarm complete: {rendered} rendered, {len(phrases) - rendered} already cached or failed")
+
+
+def main():
+    """CLI interface for the TTS cache."""
+
+    if len(sys.argv) < 2:
+        print("Usage: tts_cache.py <prewarm|stats|clear> [args...]", file=sys.stderr)
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == "prewarm":
+        args = sys.argv[2:]
+        provider = "elevenlabs"
+        if len(args) >= 2 and args[0] == "--provider":
+            provider = args[1]
+            args = args[2:]
+
+        try:
+            from dotenv import load_dotenv
+            load_dotenv()
+        except ImportError:
+            pass
+
+        prewarm(provider, args or KNOWN_PHRASES)
+
+    elif command == "stats":
+        entries = list_entries()
+        print(json.dumps({
+            "cache_dir": str(CACHE_DIR),
+            "files": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": MAX_BYTES,
+        }, indent=2))
+
+    elif command == "clear":
+        removed = evict(max_bytes=0)
+        print(f"✅ Removed {removed} cached audio files")
+
+    else:
+        print(f"Error: Unknown command: {command}", file=sys.stderr)
+        print("\nValid commands: prewarm, stats, clear", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.8"
+# dependencies = [
+#     "elevenlabs",
+#     "openai",
+#     "python-dotenv",
+# ]
+# ///
+
+"""
+TTS Time-to-First-Audio Measurement
+
+Records time to first audio (TTFA) for every spoken announcement and compares
+buffered vs streaming synthesis per provider.
+
+Commands:
+    report                 Summarize recorded TTFA per provider and mode
+    measure [text]         Measure buffered vs streaming TTFA for each provider
+                           with an API key (consumes audio without playing it)
+
+Examples:
+    uv run tts_latency.py report
+    uv run tts_latency.py measure "I fixed the failing tests and updated the auth module."
+
+Output:
+    Records are appended to $TITANIUM_HOME/tts-latency.jsonl
+"""
+
+import json
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+# Constants
+TITANIUM_HOME = Path(os.getenv("TITANIUM_HOME", Path.home() / ".titanium"))
+LATENCY_LOG_PATH = TITANIUM_HOME / "tts-latency.jsonl"
+
+# A long multi-sentence summary, like stop.get_session_summary produces
+DEFAULT_MEASURE_TEXT = (
+    "I set up three MCP servers and configured voice announcements across all your projects. "
+    "I also fixed the failing authentication tests and updated the API documentation, "
+    "so everything is ready for your review."
+)
+
+
+def record_ttfa(provider, mode, ttfa_ms, chars):
+    """
+    Append one time-to-first-audio measurement.
+
+    Args:
+        provider: TTS provider name ("elevenlabs", "openai", ...)
+        mode: "stream" or "buffered"
+        ttfa_ms: Milliseconds from request start until audio reached the player
+        chars: Length of the spoken text
+    """
+    if ttfa_ms is None:
+        return
+    try:
+        TITANIUM_HOME.mkdir(parents=True, exist_ok=True)
+        record = {
+            "timestamp": time.time(),
+            "provider": provider,
+            "mode": mode,
+            "ttfa_ms": round(ttfa_ms, 1),
+            "chars": chars,
+        }
+        with open(LATENCY_LOG_PATH, 'a') as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError:
+        pass  # Measurement must never break playback
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def report():
+    """Print TTFA percentiles per provider and mode."""
+    groups = {}
+    if LATENCY_LOG_PATH.exists():
+        with open(LATENCY_LOG_PATH, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                key = (record.get("provider"), record.get("mode"))
+                groups.setdefault(key, []).append(record["ttfa_ms"])
+
+    if not groups:
+        print("No TTFA measurements recorded yet")
+        return
+
+    print(f"{'provider':<12} {'mode':<9} {'count':>6} {'p50 ms':>9} {'p95 ms':>9}")
+    for (provider, mode), values in sorted(groups.items()):
+        print(f"{provider:<12} {mode:<9} {len(values):>6} {percentile(values, 50):>9.0f} {percentile(values, 95):>9.0f}")
+
+
+def measure(text):
+    """Compare buffered and streaming TTFA for each configured provider."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from tts_providers import get_provider
+
+    providers = [get_provider(name) for name in ("elevenlabs", "openai") if get_provider(name).available()]
+
+    if not providers:
+        print("Error: set ELEVENLABS_API_KEY and/or OPENAI_API_KEY to measure", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"🎯 Text ({len(text)} chars): {text}\n")
+    print(f"{'provider':<12} {'mode':<9} {'ttfa ms':>9} {'total ms':>9} {'bytes':>9}")
+
+    for provider in providers:
+        name = provider.name
+        try:
+            # Buffered: audio can only start once the whole response arrived
+            started_at = time.monotonic()
+            audio = provider.synthesize(text)
+            total_ms = (time.monotonic() - started_at) * 1000
+            record_ttfa(name, "buffered", total_ms, len(text))
+            print(f"{name:<12} {'buffered':<9} {total_ms:>9.0f} {total_ms:>9.0f} {len(audio):>9}")
+
+            # Streaming: audio can start with the first chunk
+            started_at = time.monotonic()
+            ttfa_ms = None
+            size = 0
+            for chunk in provider.synthesize_stream(text):
+                if chunk and ttfa_ms is None:
+                    ttfa_ms = (time.monotonic() - started_at) * 1000
+                size += len(chunk)
+            total_ms = (time.monotonic() - started_at) * 1000
+            record_ttfa(name, "stream", ttfa_ms, len(text))
+            print(f"{name:<12} {'stream':<9} {ttfa_ms or 0:>9.0f} {total_ms:>9.0f} {size:>9}")
+
+        except Exception as e:
+            print(f"❌ {name}: {e}", file=sys.stderr)
+
+
+def main():
+    """CLI interface for TTFA measurement."""
+
+    if len(sys.argv) < 2:
+        print("Usage: tts_latency.py <report|measure> [text]", file=sys.stderr)
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == "report":
+        report()
+    elif command == "measure":
+        try:
+            from dotenv import load_dotenv
+            load_dotenv()
+        except ImportError:
+            pass
+        measure(" ".join(sys.argv[2:]) or DEFAULT_MEASURE_TEXT)
+    else:
+        print(f"Error: Unknown command: {command}", file=sys.stderr)
+        print("\nValid commands: report, measure", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
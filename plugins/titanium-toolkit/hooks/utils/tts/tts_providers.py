@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+TTS Provider Library
+
+In-process text-to-speech providers behind one interface, so long-lived
+callers (the announcement worker, the hook daemon) can speak without spawning
+`uv run <script>` per utterance. Each provider builds its SDK client once and
+reuses it, keeping the underlying HTTPS connection pool alive between calls.
+
+Providers:
+    elevenlabs       ElevenLabs Turbo v2.5, Sarah voice (ELEVENLABS_API_KEY)
+    openai           OpenAI tts-1, Nova voice (OPENAI_API_KEY)
+    local            pyttsx3 offline synthesis
+    elevenlabs_mcp   ElevenLabs MCP server via the `claude mcp call` CLI
+    say              macOS `say`
+
+SDKs are imported on first use, so importing this module is cheap. The
+elevenlabs_tts.py, openai_tts.py, local_tts.py and elevenlabs_mcp.py scripts
+are thin CLI wrappers around these classes; tts_router.py decides which
+provider speaks an announcement.
+
+Usage:
+    from tts_providers import get_provider
+
+    get_provider("elevenlabs").speak("All done!")
+
+Environment:
+    TITANIUM_TTS_TIMEOUT_SECONDS   API request timeout (default: 10)
+    ELEVENLABS_BASE_URL            ElevenLabs API endpoint (e.g. the mock server);
+                                   OpenAI reads OPENAI_BASE_URL itself
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "probe"))
+from capability_probe import has_binary
+from audio_player import finish_player, play_audio_file, playback_interrupted, start_player, stream_audio
+from tts_cache import get_cached_audio, store_audio
+from tts_latency import record_ttfa
+
+# Constants
+REQUEST_TIMEOUT = float(os.getenv("TITANIUM_TTS_TIMEOUT_SECONDS", "10"))
+
+
+class TTSProvider:
+    """
+    Base provider: cache-aware synthesis and blocking playback.
+
+    Subclasses that return audio implement synthesize() (and optionally
+    synthesize_stream()); engines that speak directly override speak().
+    """
+
+    name = None
+    script = None  # CLI wrapper in this directory, run with `uv run` when the SDK is missing
+    # Cache key parts; providers without an output format are not cached
+    voice_id = None
+    model_id = None
+    output_format = None
+    # Audio is played with a system player (engines that speak themselves: False)
+    needs_player = True
+    # Time until audio started in the last speak() (None: cached or not measured)
+    last_latency_ms = None
+
+    def available(self):
+        """Whether this provider can be used (credentials, binaries, packages)."""
+        return True
+
+    def synthesize(self, text):
+        """Return complete audio bytes for text."""
+        raise NotImplementedError(f"{self.name} does not produce audio bytes")
+
+    def synthesize_stream(self, text):
+        """Yield audio chunks as they arrive (default: one buffered chunk)."""
+        yield self.synthesize(text)
+
+    def get_cached(self, text):
+        """Cached audio file for text in this provider's voice, or None."""
+        if not self.output_format:
+            return None
+        return get_cached_audio(self.name, self.voice_id, self.model_id, self.output_format, text)
+
+    def store(self, text, audio):
+        """Cache audio for text; returns the cached file or None."""
+        if not self.output_format:
+            return None
+        return store_audio(self.name, self.voice_id, self.model_id, self.output_format, text, audio)
+
+    def speak(self, text, stream=False):
+        """
+        Speak text, blocking until playback finishes.
+
+        Args:
+            text: Text to speak
+            stream: Pipe audio into the player while it downloads
+
+        Returns:
+            bool: True if audio was played (False if playback was interrupted)
+        """
+        self.last_latency_ms = None
+        if playback_interrupted():
+            return False
+
+        # Cache hit: play from disk, no network round trip
+        cached = self.get_cached(text)
+        if cached and play_audio_file(cached):
+            return True
+
+        started_at = time.monotonic()
+
+        if stream:
+            streamed = stream_audio(self.synthesize_stream(text), started_at)
+            if streamed is not None:
+                audio, ttfa_ms = streamed
+                self.last_latency_ms = ttfa_ms
+                record_ttfa(self.name, "stream", ttfa_ms, len(text))
+                self.store(text, audio)
+                return True
+
+        if playback_interrupted():
+            return False
+
+        audio = self.synthesize(text)
+        self.last_latency_ms = (time.monotonic() - started_at) * 1000
+        record_ttfa(self.name, "buffered", self.last_latency_ms, len(text))
+
+        audio_file = self.store(text, audio)
+        if audio_file is not None:
+            return play_audio_file(audio_file)
+
+        # Caching disabled: play from a temporary file
+        suffix = f".{self.output_format.split('_')[0]}"
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
+            f.write(audio)
+        try:
+            return play_audio_file(f.name)
+        finally:
+            os.unlink(f.name)
+
+
+class ElevenLabsProvider(TTSProvider):
+    """ElevenLabs Turbo v2.5 with the Sarah voice."""
+
+    name = "elevenlabs"
+    script = "elevenlabs_tts.py"
+    voice_id = "EXAVITQu4vr4xnSDxMaL"  # Sarah voice
+    model_id = "eleven_turbo_v2_5"
+    output_format = "mp3_44100_128"
+
+    def __init__(self):
+        self._client = None
+
+    def available(self):
+        return bool(os.getenv("ELEVENLABS_API_KEY"))
+
+    @property
+    def client(self):
+        if self._client is None:
+            from elevenlabs.client import ElevenLabs
+            options = {"base_url": os.getenv("ELEVENLABS_BASE_URL")} if os.getenv("ELEVENLABS_BASE_URL") else {}
+            self._client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"), timeout=REQUEST_TIMEOUT, **options)
+        return self._client
+
+    def synthesize(self, text):
+        audio = self.client.text_to_speech.convert(
+            text=text,
+            voice_id=self.voice_id,
+            model_id=self.model_id,
+            output_format=self.output_format,
+        )
+        return b"".join(audio)
+
+    def synthesize_stream(self, text):
+        yield from self.client.text_to_speech.stream(
+            text=text,
+            voice_id=self.voice_id,
+            model_id=self.model_id,
+            output_format=self.output_format,
+        )
+
+
+class OpenAIProvider(TTSProvider):
+    """OpenAI tts-1 with the Nova voice."""
+
+    name = "openai"
+    script = "openai_tts.py"
+    voice_id = "nova"
+    model_id = "tts-1"
+    output_format = "mp3"
+
+    def __init__(self):
+        self._client = None
+
+    def available(self):
+        return bool(os.getenv("OPENAI_API_KEY"))
+
+    @property
+    def client(self):
+        if self._client is None:
+            from openai import OpenAI
+            # No SDK retries: the router falls back to the next provider instead
+            self._client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), timeout=REQUEST_TIMEOUT, max_retries=0)
+        return self._client
+
+    def synthesize(self, text):
+        response = self.client.audio.speech.create(
+            model=self.model_id,
+            voice=self.voice_id,
+            input=text,
+            response_format=self.output_format,
+        )
+        return response.read()
+
+    def synthesize_stream(self, text):
+        with self.client.audio.speech.with_streaming_response.create(
+            model=self.model_id,
+            voice=self.voice_id,
+            input=text,
+            response_format=self.output_format,
+        ) as response:
+            yield from response.iter_bytes(chunk_size=4096)
+
+
+class LocalProvider(TTSProvider):
+    """Offline pyttsx3 engine, initialized once per process."""
+
+    name = "local"
+    script = "local_tts.py"
+    needs_player = False
+
+    def __init__(self):
+        self._engine = None
+
+    def available(self):
+        import importlib.util
+        return importlib.util.find_spec("pyttsx3") is not None
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            import pyttsx3
+            self._engine = pyttsx3.init()
+            self._engine.setProperty('rate', 180)    # Speech rate (words per minute)
+            self._engine.setProperty('volume', 0.9)  # Volume (0.0 to 1.0)
+        return self._engine
+
+    def speak(self, text, stream=False):
+        self.engine.say(text)
+        self.engine.runAndWait()
+        return True
+
+
+class ElevenLabsMCPProvider(TTSProvider):
+    """ElevenLabs through the MCP server configured in Claude Code."""
+
+    name = "elevenlabs_mcp"
+    script = "elevenlabs_mcp.py"
+    output_dir = Path.home() / "Desktop"
+
+    def available(self):
+        return has_binary("claude")
+
+    def speak(self, text, stream=False):
+        claude_cmd = [
+            "claude", "mcp", "call", "ElevenLabs", "text_to_speech",
+            "--text", text,
+            "--voice_name", "Adam",  # Default voice
+            "--model_id", "eleven_turbo_v2_5",  # Fast model
+            "--output_directory", str(self.output_dir),
+            "--speed", "1.0",
+            "--stability", "0.5",
+            "--similarity_boost", "0.75"
+        ]
+
+        started_at = time.monotonic()
+        result = subprocess.run(
+            claude_cmd,
+            capture_output=True,
+            text=True,
+            timeout=15  # 15-second timeout for TTS generation
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"MCP Error: {result.stderr}")
+        self.last_latency_ms = (time.monotonic() - started_at) * 1000
+
+        # Play the most recent audio file the MCP server wrote
+        audio_files = list(self.output_dir.glob("*.mp3"))
+        if not audio_files:
+            return False
+        latest_audio = max(audio_files, key=lambda f: f.stat().st_mtime)
+        return play_audio_file(latest_audio)
+
+
+class SayProvider(TTSProvider):
+    """macOS `say` (last-resort fallback)."""
+
+    name = "say"
+    needs_player = False
+
+    def available(self):
+        return has_binary("say")
+
+    def speak(self, text, stream=False):
+        player = start_player(["say", text], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if player is None:
+            return False
+        try:
+            return player.wait(timeout=30) == 0
+        except subprocess.TimeoutExpired:
+            player.kill()
+            player.wait()
+            return False
+        finally:
+            finish_player(player)
+
+
+PROVIDERS = {
+    provider.name: provider
+    for provider in (ElevenLabsProvider, OpenAIProvider, LocalProvider, ElevenLabsMCPProvider, SayProvider)
+}
+
+_instances = {}
+
+
+def get_provider(name):
+    """
+    Return the shared provider instance for name (clients are reused).
+
+    Raises:
+        ValueError: If name is not a known provider
+    """
+    if name not in PROVIDERS:
+        raise ValueError(f"Unknown TTS provider: {name}")
+    if name not in _instances:
+        _instances[name] = PROVIDERS[name]()
+    return _instances[name]
+
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+TTS Provider Router
+
+Chooses which TTS provider speaks each announcement. Every attempt records the
+provider's latency (time until audio starts) and success in a small state
+file shared by all hook processes and the announcement worker:
+
+    - latency is an exponentially weighted moving average per provider
+    - a provider that fails TITANIUM_TTS_CIRCUIT_FAILURES times in a row has
+      its circuit opened and is skipped for TITANIUM_TTS_CIRCUIT_COOLDOWN_SECONDS;
+      afterwards one announcement claims a trial of it (success closes the
+      circuit, failure reopens it) while every other caller keeps skipping it
+
+Routing order: cloud voices (ElevenLabs, OpenAI, ElevenLabs MCP) with a closed
+circuit, fastest first; then the offline voices (pyttsx3, macOS `say`).
+Phrases already in the audio cache play in the cached voice first.
+
+State file: $TITANIUM_HOME/tts-router.json (updated under tts-router.lock)
+
+Commands:
+    status            Show routing order and per-provider health
+    reset [provider]  Close circuits and forget latency
+
+Examples:
+    python3 tts_router.py status
+    python3 tts_router.py reset elevenlabs
+
+Environment:
+    TITANIUM_TTS_PROVIDER                  Preferred provider while healthy
+    TITANIUM_TTS_CIRCUIT_FAILURES          Failures before opening (default: 3)
+    TITANIUM_TTS_CIRCUIT_COOLDOWN_SECONDS  Time a circuit stays open (default: 120)
+"""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: state updates are best effort
+    fcntl = None
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "probe"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "runtime"))
+from capability_probe import has_binary
+from plugin_runtime import runtime_command, runtime_installed
+from audio_player import file_player_installed, finish_player, playback_interrupted, start_player
+from tts_providers import get_provider
+
+# Constants
+TITANIUM_HOME = Path(os.getenv("TITANIUM_HOME", Path.home() / ".titanium"))
+STATE_PATH = TITANIUM_HOME / "tts-router.json"
+LOCK_PATH = TITANIUM_HOME / "tts-router.lock"
+
+FAILURE_THRESHOLD = int(os.getenv("TITANIUM_TTS_CIRCUIT_FAILURES", "3"))
+COOLDOWN_SECONDS = float(os.getenv("TITANIUM_TTS_CIRCUIT_COOLDOWN_SECONDS", "120"))
+EWMA_ALPHA = 0.3
+SCRIPT_TIMEOUT_SECONDS = 30
+# A trial not recorded within this long (its process died) can be claimed again
+TRIAL_TIMEOUT_SECONDS = 2 * SCRIPT_TIMEOUT_SECONDS
+
+CLOUD_PROVIDERS = ("elevenlabs", "openai", "elevenlabs_mcp")
+OFFLINE_PROVIDERS = ("local", "say")
+# Assumed latency until a provider has been measured (keeps ElevenLabs first)
+PRIOR_LATENCY_MS = {"elevenlabs": 500, "openai": 800, "elevenlabs_mcp": 2000}
+
+
+def load_state():
+    """Current router state (written atomically, so safe to read unlocked)."""
+    try:
+        with open(STATE_PATH, 'r') as f:
+            state = json.load(f)
+        return state if isinstance(state, dict) else {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+@contextmanager
+def locked_state():
+    """Load, yield and atomically save the state under the router lock."""
+    TITANIUM_HOME.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_PATH, 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        state = load_state()
+        yield state
+
+        temp_path = STATE_PATH.with_name(f".{STATE_PATH.name}.{uuid.uuid4().hex[:8]}.tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(state, f, indent=2)
+        temp_path.replace(STATE_PATH)
+
+
+def circuit_open(stats, now=None):
+    """
+    Whether a provider's circuit is open: recently failing and still cooling
+    down, or cooled down with another caller's trial in progress.
+    """
+    opened_at = stats.get("opened_at")
+    if opened_at is None:
+        return False
+    now = time.time() if now is None else now
+    trial_started_at = stats.get("trial_started_at")
+    if trial_started_at is not None and now - trial_started_at < TRIAL_TIMEOUT_SECONDS:
+        return True
+    return now - opened_at < COOLDOWN_SECONDS
+
+
+def claim_trial(name):
+    """
+    Claim the single trial of a provider whose circuit has cooled down.
+
+    Returns:
+        bool: True if this caller may try the provider (circuit closed, or
+        the trial is ours), False if it is still open or another caller's
+        trial is in progress
+    """
+    try:
+        with locked_state() as state:
+            stats = state.get(name, {})
+            if stats.get("opened_at") is None:
+                return True
+            now = time.time()
+            if circuit_open(stats, now):
+                return False
+            stats["trial_started_at"] = now
+            state[name] = stats
+            return True
+    except OSError:
+        return True  # Without shared state, behave as before
+
+
+def release_trial(name):
+    """Give up a claimed trial without a result (playback was preempted)."""
+    try:
+        with locked_state() as state:
+            state.get(name, {}).pop("trial_started_at", None)
+    except OSError:
+        pass
+
+
+def expected_latency(state, name):
+    """Measured latency EWMA, or the prior for unmeasured providers."""
+    return state.get(name, {}).get("latency_ms") or PRIOR_LATENCY_MS.get(name, 1000)
+
+
+def provider_usable(name):
+    """Whether a provider can be tried here (in-process or through its script)."""
+    if name == "local":
+        # pyttsx3 is in the plugin runtime, or installed on demand by `uv run local_tts.py`
+        return importlib.util.find_spec("pyttsx3") is not None or runtime_installed() or has_binary("uv")
+    return get_provider(name).available()
+
+
+def route(text=None):
+    """
+    Order providers for an announcement.
+
+    Args:
+        text: Announcement text; providers that have it cached go first
+
+    Returns:
+        list: Provider names to try in order
+    """
+    state = load_state()
+    now = time.time()
+
+    cloud = [
+        name for name in CLOUD_PROVIDERS
+        if provider_usable(name) and not circuit_open(state.get(name, {}), now)
+    ]
+    cloud.sort(key=lambda name: expected_latency(state, name))
+
+    preferred = os.getenv("TITANIUM_TTS_PROVIDER")
+    if preferred in cloud:
+        cloud.remove(preferred)
+        cloud.insert(0, preferred)
+
+    if text:
+        cached = [name for name in CLOUD_PROVIDERS if get_provider(name).get_cached(text)]
+        cloud = cached + [name for name in cloud if name not in cached]
+
+    offline = [name for name in OFFLINE_PROVIDERS if provider_usable(name)]
+    return cloud + offline
+
+
+def record_result(name, ok, latency_ms=None, error=None):
+    """Fold one attempt into the provider's latency and circuit state."""
+    try:
+        with locked_state() as state:
+            stats = state.setdefault(name, {})
+            now = time.time()
+            stats["last_attempt_at"] = now
+            stats.pop("trial_started_at", None)
+
+            if ok:
+                stats["failures"] = 0
+                stats["opened_at"] = None
+                if latency_ms is not None:
+                    previous = stats.get("latency_ms")
+                    stats["latency_ms"] = latency_ms if previous is None else (
+                        EWMA_ALPHA * latency_ms + (1 - EWMA_ALPHA) * previous
+                    )
+                    stats["samples"] = stats.get("samples", 0) + 1
+            else:
+                stats["failures"] = stats.get("failures", 0) + 1
+                stats["last_error"] = str(error).strip()[:200] if error else None
+                if stats["failures"] >= FAILURE_THRESHOLD:
+                    stats["opened_at"] = now  # (Re)open; also after a failed trial
+    except OSError as e:
+        print(f"TTS router state error: {e}", file=sys.stderr)
+
+
+def run_script(name, text, timeout=SCRIPT_TIMEOUT_SECONDS):
+    """Speak through the provider's TTS script (SDK not importable here)."""
+    script = Path(__file__).parent / get_provider(name).script
+    player = start_player(runtime_command(script, text), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if player is None:
+        return False
+    try:
+        _, stderr = player.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        player.kill()
+        player.communicate()
+        raise RuntimeError(f"{script.name} timed out after {timeout}s")
+    finally:
+        finish_player(player)
+    if player.returncode != 0:
+        raise RuntimeError(stderr.decode("utf-8", "replace").strip()[-200:] or f"{script.name} failed")
+    return True
+
+
+def speak_routed(text, providers=None, stream=None, script_timeout=SCRIPT_TIMEOUT_SECONDS):
+    """
+    Speak text with the best healthy provider, falling through on failure and
+    recording every attempt.
+
+    Providers that play audio through a system player are skipped, without
+    counting against their circuit, when no player is installed: the
+    provider is healthy, this machine just can't play what it returns.
+
+    Args:
+        text: Text to speak
+        providers: Provider names to try in order (default: route(text))
+        stream: Stream audio (default: TITANIUM_TTS_STREAM=1)
+        script_timeout: Timeout for providers run through their script
+
+    Returns:
+        str: Name of the provider that spoke, or None
+    """
+    if stream is None:
+        stream = os.getenv("TITANIUM_TTS_STREAM", "0") == "1"
+
+    player_installed = None
+    state = load_state()
+    for name in providers or route(text):
+        provider = get_provider(name)
+        if provider.needs_player:
+            if player_installed is None:
+                player_installed = file_player_installed()
+            if not player_installed:
+                print(f"TTS provider {name} skipped: no audio player installed", file=sys.stderr)
+                continue
+        # Circuit cooled down (route() let it through): only one caller tries it
+        trial = state.get(name, {}).get("opened_at") is not None
+        if trial and not claim_trial(name):
+            continue
+        provider.last_latency_ms = None
+        error = None
+        try:
+            try:
+                ok = provider.speak(text, stream=stream)
+            except ImportError:
+                ok = run_script(name, text, script_timeout)
+        except Exception as e:
+            ok, error = False, e
+
+        if playback_interrupted():
+            if trial:
+                release_trial(name)
+            return None  # Preempted by a more urgent announcement, not a failure
+
+        record_result(name, ok, provider.last_latency_ms, error)
+        if ok:
+            return name
+        print(f"TTS provider {name} failed: {str(error).strip() if error else 'no audio played'}", file=sys.stderr)
+
+    return None
+
+
+def main():
+    """CLI interface for the TTS router."""
+
+    if len(sys.argv) < 2:
+        print("Usage: tts_router.py <status|reset> [provider]", file=sys.stderr)
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == "status":
+        state = load_state()
+        now = time.time()
+        print(f"Route: {' > '.join(route()) or '(no providers available)'}\n")
+        print(f"{'provider':<16} {'circuit':<8} {'latency ms':>10} {'samples':>8} {'failures':>9}")
+        for name in CLOUD_PROVIDERS + OFFLINE_PROVIDERS:
+            stats = state.get(name, {})
+            if stats.get("opened_at") is None:
+                circuit = "closed"
+            elif circuit_open(stats, now):
+                circuit = "trial" if stats.get("trial_started_at") else "open"
+            else:
+                circuit = "half-open"
+            latency = f"{stats['latency_ms']:.0f}" if stats.get("latency_ms") else "-"
+            print(f"{name:<16} {circuit:<8} {latency:>10} {stats.get('samples', 0):>8} {stats.get('failures', 0):>9}")
+            if stats.get("last_error"):
+                print(f"    last error: {stats['last_error']}")
+
+    elif command == "reset":
+        with locked_state() as state:
+            if len(sys.argv) > 2:
+                state.pop(sys.argv[2], None)
+            else:
+                state.clear()
+        print("✅ Router state reset")
+
+    else:
+        print(f"Error: Unknown command: {command}", file=sys.stderr)
+        print("\nValid commands: status, reset", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
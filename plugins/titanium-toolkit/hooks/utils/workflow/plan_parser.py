@@ -27,9 +27,13 @@ Output:
 import json
 import sys
 import os
+import time
 from pathlib import Path
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "llm"))
+from usage_ledger import record_response
+
 
 def get_claude_model(task_type: str = "default") -> str:
     """
@@ -148,12 +152,14 @@ Return ONLY valid JSON, no markdown code blocks, no explanations."""
         model = get_claude_model("complex")  # Use large model for complex epics
 
         # Call Claude
+        started_at = time.monotonic()
         response = client.messages.create(
             model=model,
             max_tokens=8192,  # Increased for large epics with many stories
             temperature=0.3,  # Lower temperature for deterministic planning
             messages=[{"role": "user", "content": prompt}]
         )
+        record_response(response, started_at, "plan_parser", "plan")
 
         plan_json = response.content[0].text.strip()
 